@@ -3,88 +3,95 @@ Main entry point for the Model Downloader application
 """
 
 import logging
-import multiprocessing
 import os
-import platform
 import sys
 
 from PyQt6.QtGui import QIcon
 from PyQt6.QtWidgets import QApplication
 
-from src.resource_utils import get_asset_path
+from src.resource_utils import get_platform_icon_path
 from src.ui import MainWindow
 
 __version__ = "1.0.0"
 
 # Configuration constants
 MULTIPROCESSING_START_METHOD = "spawn"
-QT_ENV_VARS = {
-    "QT_AUTO_SCREEN_SCALE_FACTOR": "1",
-    "QT_ENABLE_HIGHDPI_SCALING": "1",
-}
+SPAWN_DEFAULT_PLATFORMS = ("win32", "darwin")
 
-ICON_PATHS = {
-    "darwin": "icon.icns",
-    "windows": "icon.ico",
-    "default": "icon.png",
-}
+DEBUG_ENV_VAR = "HF_DL_DEBUG"
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
-logger = logging.getLogger(__name__)
+logger = logging.getLogger("hf_downloader")
 
 
 def setup_multiprocessing():
-    """Configure multiprocessing for cross-platform compatibility."""
-    try:
-        multiprocessing.set_start_method(MULTIPROCESSING_START_METHOD, force=True)
-    except RuntimeError as e:
-        logger.warning(f"Failed to set multiprocessing method: {e}")
-
-    if getattr(sys, "frozen", False):
-        os.environ["PYINSTALLER_HOOKS_DIR"] = "1"
-        multiprocessing.freeze_support()
+    """Configure multiprocessing for cross-platform compatibility.
 
+    spawn is already the default start method on Windows and macOS, so it is
+    only forced on other platforms, and multiprocessing is not imported at
+    all when there is nothing to configure.
+    """
+    frozen = getattr(sys, "frozen", False)
+    needs_start_method = sys.platform not in SPAWN_DEFAULT_PLATFORMS
+    if not (frozen or needs_start_method):
+        return
 
-def setup_environment():
-    """Configure environment variables for Qt."""
-    for key, value in QT_ENV_VARS.items():
-        os.environ[key] = value
+    import multiprocessing
 
+    current_method = multiprocessing.get_start_method(allow_none=True)
+    if needs_start_method and current_method != MULTIPROCESSING_START_METHOD:
+        try:
+            multiprocessing.set_start_method(MULTIPROCESSING_START_METHOD, force=True)
+        except RuntimeError as e:
+            logger.warning(f"Failed to set multiprocessing method: {e}")
 
-def get_icon_path():
-    """Get the appropriate icon path based on platform."""
-    system = platform.system().lower()
-    icon_name = ICON_PATHS.get(system, ICON_PATHS["default"])
-    return get_asset_path(icon_name)
+    if frozen:
+        os.environ["PYINSTALLER_HOOKS_DIR"] = "1"
+        multiprocessing.freeze_support()
 
 
 def setup_application_icon(app):
-    """Set application icon based on platform availability."""
-    icon_path = get_icon_path()
+    """Set application icon based on platform availability.
+
+    Returns the loaded QIcon so it can be reused by the main window, or
+    None if no icon could be loaded.
+    """
+    icon_path = get_platform_icon_path()
     if os.path.exists(icon_path):
         try:
-            app.setWindowIcon(QIcon(icon_path))
+            icon = QIcon(icon_path)
+            app.setWindowIcon(icon)
             logger.info(f"Application icon loaded from: {icon_path}")
+            return icon
         except Exception as e:
             logger.warning(f"Failed to set application icon: {e}")
     else:
         logger.warning(f"Icon file not found at: {icon_path}")
+    return None
+
+
+def setup_logging():
+    """Enable console logging only when debugging was requested.
+
+    Without it, warnings and errors still reach stderr through logging's
+    last-resort handler, but no handlers are created on a normal launch.
+    """
+    if os.environ.get(DEBUG_ENV_VAR):
+        logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
 
 
 def main():
     """Main application entry point."""
+    setup_logging()
     try:
         setup_multiprocessing()
-        setup_environment()
 
-        app = QApplication(sys.argv)
-        setup_application_icon(app)
+        # Reuse an existing instance (tests, embedding) and pass only the
+        # program name, since no Qt command-line options are supported
+        app = QApplication.instance() or QApplication(sys.argv[:1])
+        icon = setup_application_icon(app)
 
-        window = MainWindow()
+        window = MainWindow(icon=icon)
         window.show()
         sys.exit(app.exec())
 
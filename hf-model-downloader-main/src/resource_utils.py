@@ -2,9 +2,16 @@
 Resource path utilities for handling assets in both development and packaged.
 """
 
+import functools
 import os
 import sys
 
+PLATFORM_ICON_NAMES = {
+    "darwin": "icon.icns",
+    "win32": "icon.ico",
+}
+DEFAULT_ICON_NAME = "icon.png"
+
 
 def get_resource_path(relative_path):
     """
@@ -30,6 +37,7 @@ def get_resource_path(relative_path):
     return os.path.join(base_path, relative_path)
 
 
+@functools.lru_cache(maxsize=None)
 def get_asset_path(filename):
     """
     Get the absolute path to an asset file in the assets directory.
@@ -41,3 +49,43 @@ def get_asset_path(filename):
         str: Absolute path to the asset file
     """
     return get_resource_path(os.path.join("assets", filename))
+
+
+@functools.lru_cache(maxsize=1)
+def get_platform_icon_path():
+    """
+    Get the absolute path to the application icon for the current platform.
+
+    The result is cached so the main window and the application share a
+    single lookup.
+
+    Returns:
+        str: Absolute path to the icon file
+    """
+    return get_asset_path(PLATFORM_ICON_NAMES.get(sys.platform, DEFAULT_ICON_NAME))
+
+
+def preload_pixmaps(names):
+    """
+    Load asset images once and register them in Qt's shared pixmap cache.
+
+    Missing files yield null pixmaps, which Qt renders as empty icons, so no
+    existence check is needed.
+
+    Args:
+        names (list[str]): Asset filenames (e.g., ["huggingface_logo.png"])
+
+    Returns:
+        dict[str, QPixmap]: Pixmaps keyed by asset filename
+    """
+    from PyQt6.QtGui import QPixmap, QPixmapCache
+
+    pixmaps = {}
+    for name in names:
+        pixmap = QPixmapCache.find(name)
+        if pixmap is None:
+            pixmap = QPixmap(get_asset_path(name))
+            if not pixmap.isNull():
+                QPixmapCache.insert(name, pixmap)
+        pixmaps[name] = pixmap
+    return pixmaps
@@ -1,19 +1,30 @@
-
+import functools
 import json
 import os
-from typing import Any, Dict
+from typing import Any, Dict, Optional
+
+from PyQt6.QtCore import QSettings
+
+SETTINGS_ORGANIZATION = "hf_model_suite"
+SETTINGS_APPLICATION = "hf_model_suite"
 
+# File written by older versions, migrated into QSettings on first load
 CONFIG_DIR_NAME = ".hf_model_suite"
-CONFIG_FILE_NAME = "settings.json"
+LEGACY_CONFIG_FILE_NAME = "settings.json"
 
+NAMED_LOCATIONS_KEY = "named_locations"
+NAMED_LOCATION_FIELDS = ("name", "path")
 
+
+@functools.lru_cache(maxsize=None)
 def get_config_dir() -> str:
     home = os.path.expanduser("~")
     return os.path.join(home, CONFIG_DIR_NAME)
 
 
+@functools.lru_cache(maxsize=None)
 def get_config_path() -> str:
-    return os.path.join(get_config_dir(), CONFIG_FILE_NAME)
+    return os.path.join(get_config_dir(), LEGACY_CONFIG_FILE_NAME)
 
 
 def get_default_settings() -> Dict[str, Any]:
@@ -29,28 +40,96 @@ def get_default_settings() -> Dict[str, Any]:
     }
 
 
+def _qsettings() -> QSettings:
+    return QSettings(SETTINGS_ORGANIZATION, SETTINGS_APPLICATION)
+
+
+def _read_legacy_settings() -> Optional[Dict[str, Any]]:
+    """Read the settings.json written by older versions, if one exists."""
+    try:
+        with open(get_config_path(), "r", encoding="utf-8") as f:
+            loaded = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return loaded if isinstance(loaded, dict) else None
+
+
+def _migrate_legacy_settings(store: QSettings, data: Dict[str, Any]) -> None:
+    """Copy settings.json into an empty store, then remove the file.
+
+    The file is only removed once every value is written and synced; a
+    failed copy is cleared from the store so the next load tries again.
+    """
+    legacy = _read_legacy_settings()
+    if legacy is None:
+        return
+    data.update(legacy)
+    try:
+        _write_settings(store, data)
+        store.sync()
+        if store.status() != QSettings.Status.NoError:
+            raise OSError(f"QSettings status {store.status()}")
+    except Exception:
+        store.clear()
+        return
+    try:
+        os.remove(get_config_path())
+    except OSError:
+        pass
+
+
+def _read_named_locations(store: QSettings) -> list:
+    locations = []
+    count = store.beginReadArray(NAMED_LOCATIONS_KEY)
+    for i in range(count):
+        store.setArrayIndex(i)
+        locations.append(
+            {field: store.value(field, "", type=str) for field in NAMED_LOCATION_FIELDS}
+        )
+    store.endArray()
+    return locations
+
+
+def _write_named_locations(store: QSettings, locations: list) -> None:
+    store.remove(NAMED_LOCATIONS_KEY)
+    store.beginWriteArray(NAMED_LOCATIONS_KEY, len(locations))
+    for i, loc in enumerate(locations):
+        store.setArrayIndex(i)
+        for field in NAMED_LOCATION_FIELDS:
+            store.setValue(field, loc.get(field, ""))
+    store.endArray()
+
+
+def _write_settings(store: QSettings, settings: Dict[str, Any]) -> None:
+    for key, value in settings.items():
+        if key == NAMED_LOCATIONS_KEY:
+            _write_named_locations(store, value or [])
+        else:
+            store.setValue(key, value)
+
+
 def load_settings() -> Dict[str, Any]:
-    cfg_path = get_config_path()
+    store = _qsettings()
     data = get_default_settings()
+    if not store.allKeys():
+        _migrate_legacy_settings(store, data)
+        return data
     try:
-        if os.path.exists(cfg_path):
-            with open(cfg_path, "r", encoding="utf-8") as f:
-                loaded = json.load(f)
-            if isinstance(loaded, dict):
-                data.update(loaded)
+        for key, default in data.items():
+            if key == NAMED_LOCATIONS_KEY:
+                data[key] = _read_named_locations(store)
+            elif store.contains(key):
+                data[key] = store.value(key, default, type=type(default))
     except Exception:
         pass
     return data
 
 
 def save_settings(settings: Dict[str, Any]) -> None:
-    cfg_dir = get_config_dir()
-    os.makedirs(cfg_dir, exist_ok=True)
-    cfg_path = get_config_path()
     safe = dict(get_default_settings())
     safe.update(settings or {})
+    store = _qsettings()
     try:
-        with open(cfg_path, "w", encoding="utf-8") as f:
-            json.dump(safe, f, indent=2)
+        _write_settings(store, safe)
     except Exception:
         pass
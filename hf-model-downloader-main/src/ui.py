@@ -1,15 +1,17 @@
 import os
-import platform
+import sys
 
-from PyQt6.QtCore import QSize, Qt, QUrl
-from PyQt6.QtGui import QDesktopServices, QIcon
+from PyQt6.QtCore import QSize, Qt, QThreadPool, QTimer, QUrl
+from PyQt6.QtGui import QDesktopServices, QIcon, QTextCursor
+# Only the widgets needed to build the main window are imported here;
+# dialogs are imported on first use.
 from PyQt6.QtWidgets import (
     QButtonGroup,
     QComboBox,
-    QFileDialog,
     QFrame,
     QHBoxLayout,
     QLabel,
+    QLayout,
     QLineEdit,
     QMainWindow,
     QPushButton,
@@ -18,35 +20,98 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
-from .resource_utils import get_asset_path
-from .unified_downloader import UnifiedDownloadWorker
+from .resource_utils import get_platform_icon_path, preload_pixmaps
 from .settings_manager import load_settings, save_settings
 
 GITHUB_REPO_URL = "https://github.com/samzong/hf-model-downloader"
 AUTHOR_NAME = "samzong"
 AUTHOR_GITHUB_URL = "https://github.com/samzong"
 
+# Log lines are collected and written to the view at most once per interval
+LOG_FLUSH_INTERVAL_MS = 50
+
+_PLATFORM_BTN_QSS = """
+QPushButton {
+    border: 2px solid #ddd;
+    border-radius: 6px;
+    padding: 8px;
+    background-color: white;
+}
+QPushButton:hover {
+    border-color: %(accent)s;
+    background-color: %(hover)s;
+}
+QPushButton:checked {
+    border-color: %(accent)s;
+    background-color: %(checked)s;
+}
+"""
+_HF_BTN_QSS = _PLATFORM_BTN_QSS % {
+    "accent": "#FFD21E",
+    "hover": "#fffbf0",
+    "checked": "#fff8e1",
+}
+_MS_BTN_QSS = _PLATFORM_BTN_QSS % {
+    "accent": "#1677FF",
+    "hover": "#f0f8ff",
+    "checked": "#e6f3ff",
+}
+_LINK_BTN_QSS = (
+    "QPushButton { "
+    "font-size: 12px; color: #666; border: none; text-decoration: underline; "
+    "}"
+)
+
+
+def _add(layout, *items):
+    """Append widgets and child layouts to a box layout in order."""
+    for item in items:
+        if isinstance(item, QLayout):
+            layout.addLayout(item)
+        else:
+            layout.addWidget(item)
+
 
 class MainWindow(QMainWindow):
-    def __init__(self):
+    # UnifiedDownloadWorker, imported on first use since it pulls in the hub SDKs
+    _Worker = None
+
+    def __init__(self, icon=None):
         super().__init__()
         self.setWindowTitle("HF Model Downloader")
 
-        # Set window icon based on platform
-        system = platform.system().lower()
-        if system == "darwin":
-            icon_path = get_asset_path("icon.icns")
-        elif system == "windows":
-            icon_path = get_asset_path("icon.ico")
-        else:
-            icon_path = get_asset_path("icon.png")
-
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
+        # Reuse the application icon when the caller already loaded it
+        if icon is None:
+            icon_path = get_platform_icon_path()
+            if os.path.exists(icon_path):
+                icon = QIcon(icon_path)
+        if icon is not None:
+            self.setWindowIcon(icon)
 
-        main_widget = QWidget()
+        self.download_worker = None
+        self.last_save_path = ""
+        self._QFileDialog = None
+        self._pending_log = []
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(LOG_FLUSH_INTERVAL_MS)
+        self._log_flush_timer.timeout.connect(self._flush_log)
+
+        # Show a lightweight frame first and build the full UI once the event
+        # loop has painted it, so the window appears without waiting on the
+        # widget tree and the settings file.
+        loading_label = QLabel("Loading...")
+        loading_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.setCentralWidget(loading_label)
+        QTimer.singleShot(0, self._deferred_init)
+
+    def _deferred_init(self):
+        """Build the main layout and apply persisted settings."""
         main_widget = QWidget()
         self.setCentralWidget(main_widget)
+        # Hold off repaints until every child is in place so Qt runs a single
+        # layout pass instead of one per added widget
+        main_widget.setUpdatesEnabled(False)
         layout = QVBoxLayout(main_widget)
 
         standard_button_height = 32
@@ -57,53 +122,21 @@ class MainWindow(QMainWindow):
         self.platform_button_group = QButtonGroup()
         self.platform_button_group.setExclusive(True)
 
+        pixmaps = preload_pixmaps(["huggingface_logo.png", "modelscope_logo.png"])
+
         self.hf_button = QPushButton()
-        hf_icon_path = get_asset_path("huggingface_logo.png")
-        if os.path.exists(hf_icon_path):
-            self.hf_button.setIcon(QIcon(hf_icon_path))
-            self.hf_button.setIconSize(QSize(32, 32))
+        self.hf_button.setIcon(QIcon(pixmaps["huggingface_logo.png"]))
+        self.hf_button.setIconSize(QSize(32, 32))
         self.hf_button.setCheckable(True)
         self.hf_button.setChecked(True)
-        self.hf_button.setStyleSheet("""
-            QPushButton {
-                border: 2px solid #ddd;
-                border-radius: 6px;
-                padding: 8px;
-                background-color: white;
-            }
-            QPushButton:hover {
-                border-color: #FFD21E;
-                background-color: #fffbf0;
-            }
-            QPushButton:checked {
-                border-color: #FFD21E;
-                background-color: #fff8e1;
-            }
-        """)
+        self.hf_button.setStyleSheet(_HF_BTN_QSS)
         self.platform_button_group.addButton(self.hf_button, 0)
 
         self.ms_button = QPushButton()
-        ms_icon_path = get_asset_path("modelscope_logo.png")
-        if os.path.exists(ms_icon_path):
-            self.ms_button.setIcon(QIcon(ms_icon_path))
-            self.ms_button.setIconSize(QSize(32, 32))
+        self.ms_button.setIcon(QIcon(pixmaps["modelscope_logo.png"]))
+        self.ms_button.setIconSize(QSize(32, 32))
         self.ms_button.setCheckable(True)
-        self.ms_button.setStyleSheet("""
-            QPushButton {
-                border: 2px solid #ddd;
-                border-radius: 6px;
-                padding: 8px;
-                background-color: white;
-            }
-            QPushButton:hover {
-                border-color: #1677FF;
-                background-color: #f0f8ff;
-            }
-            QPushButton:checked {
-                border-color: #1677FF;
-                background-color: #e6f3ff;
-            }
-        """)
+        self.ms_button.setStyleSheet(_MS_BTN_QSS)
         self.platform_button_group.addButton(self.ms_button, 1)
 
         self.platform_button_group.idClicked.connect(self.on_platform_icon_changed)
@@ -112,8 +145,6 @@ class MainWindow(QMainWindow):
         icon_layout.addWidget(self.ms_button)
         icon_layout.addStretch()
 
-        layout.addLayout(icon_layout)
-
         help_frame = QFrame()
         help_frame.setFrameStyle(QFrame.Shape.StyledPanel | QFrame.Shadow.Raised)
         help_layout = QVBoxLayout(help_frame)
@@ -164,12 +195,9 @@ class MainWindow(QMainWindow):
         guide_content_layout.addLayout(links_layout)
         help_layout.addLayout(guide_content_layout)
 
-        layout.addWidget(help_frame)
-
         separator = QFrame()
         separator.setFrameShape(QFrame.Shape.HLine)
         separator.setFrameShadow(QFrame.Shadow.Sunken)
-        layout.addWidget(separator)
 
         self.platform_combo = QComboBox()
         self.platform_combo.addItems(["Hugging Face", "ModelScope"])
@@ -186,7 +214,6 @@ class MainWindow(QMainWindow):
         type_layout.addWidget(type_label)
         type_layout.addWidget(self.type_combo)
         type_layout.addStretch()
-        layout.addLayout(type_layout)
 
         repo_layout = QHBoxLayout()
         self.repo_label = QLabel("Model ID:")
@@ -194,7 +221,6 @@ class MainWindow(QMainWindow):
         self.repo_input.setPlaceholderText("e.g., qwen/Qwen2.5-Coder-1.5B-Instruct")
         repo_layout.addWidget(self.repo_label)
         repo_layout.addWidget(self.repo_input)
-        layout.addLayout(repo_layout)
 
         path_layout = QHBoxLayout()
         path_label = QLabel("Save Path:")
@@ -219,7 +245,6 @@ class MainWindow(QMainWindow):
         path_layout.addWidget(self.path_preset_combo)
         path_layout.addWidget(self.add_preset_button)
         path_layout.addWidget(browse_button)
-        layout.addLayout(path_layout)
 
         token_layout = QHBoxLayout()
         token_label = QLabel("Token:")
@@ -249,7 +274,6 @@ class MainWindow(QMainWindow):
         token_layout.addWidget(self.load_env_token_button)
         token_layout.addWidget(self.save_token_button)
         token_layout.addWidget(self.settings_button)
-        layout.addLayout(token_layout)
 
         endpoint_layout = QHBoxLayout()
         endpoint_label = QLabel("Endpoint:")
@@ -258,7 +282,6 @@ class MainWindow(QMainWindow):
         self.endpoint_input.setPlaceholderText("default: https://hf-mirror.com")
         endpoint_layout.addWidget(endpoint_label)
         endpoint_layout.addWidget(self.endpoint_input)
-        layout.addLayout(endpoint_layout)
 
         button_layout = QHBoxLayout()
         self.download_button = QPushButton("Download")
@@ -270,25 +293,22 @@ class MainWindow(QMainWindow):
         self.stop_button.setEnabled(False)
         button_layout.addWidget(self.download_button)
         button_layout.addWidget(self.stop_button)
-        layout.addLayout(button_layout)
 
+        # Built with the rest of the window so it never shifts the layout;
+        # it stays empty until the first log flush
         self.log_text = QTextEdit()
         self.log_text.setReadOnly(True)
         self.log_text.setMinimumHeight(100)
-        layout.addWidget(self.log_text)
 
         footer_frame = QFrame()
+        # Set once on the frame so both link buttons share the parsed rules
+        footer_frame.setStyleSheet(_LINK_BTN_QSS)
         footer_layout = QHBoxLayout(footer_frame)
 
         footer_layout.addStretch()
 
         github_btn = QPushButton("View on GitHub")
         github_btn.setFlat(True)
-        github_btn.setStyleSheet(
-            "QPushButton { "
-            "font-size: 12px; color: #666; border: none; text-decoration: underline; "
-            "}"
-        )
         github_btn.clicked.connect(
             lambda: QDesktopServices.openUrl(QUrl(GITHUB_REPO_URL))
         )
@@ -296,11 +316,6 @@ class MainWindow(QMainWindow):
 
         author_btn = QPushButton(f"Created by {AUTHOR_NAME}")
         author_btn.setFlat(True)
-        author_btn.setStyleSheet(
-            "QPushButton { "
-            "font-size: 12px; color: #666; border: none; text-decoration: underline; "
-            "}"
-        )
         author_btn.clicked.connect(
             lambda: QDesktopServices.openUrl(QUrl(AUTHOR_GITHUB_URL))
         )
@@ -308,15 +323,45 @@ class MainWindow(QMainWindow):
 
         footer_layout.addStretch()
 
-        layout.addWidget(footer_frame)
+        _add(
+            layout,
+            icon_layout,
+            help_frame,
+            separator,
+            type_layout,
+            repo_layout,
+            path_layout,
+            token_layout,
+            endpoint_layout,
+            button_layout,
+            self.log_text,
+            footer_frame,
+        )
+        layout.setStretchFactor(self.log_text, 1)
 
         # Load persisted settings (token, paths, options)
         self._init_settings()
 
         self._set_dynamic_minimum_height()
 
-        self.download_worker = None
-        self.last_save_path = ""
+        main_widget.setUpdatesEnabled(True)
+        main_widget.updateGeometry()
+
+        # Import the downloader in the background once the window is idle so
+        # the first Download click does not stall on it
+        QTimer.singleShot(500, self._prewarm_worker_module)
+
+    @classmethod
+    def _worker_class(cls):
+        if cls._Worker is None:
+            from .unified_downloader import UnifiedDownloadWorker
+
+            cls._Worker = UnifiedDownloadWorker
+        return cls._Worker
+
+    def _prewarm_worker_module(self):
+        if MainWindow._Worker is None:
+            QThreadPool.globalInstance().start(MainWindow._worker_class)
 
     def _set_dynamic_minimum_height(self):
         platform_icons_height = 40
@@ -399,7 +444,11 @@ class MainWindow(QMainWindow):
             self.repo_input.setPlaceholderText("e.g., deepseek-ai/DeepSeek-R1")
 
     def browse_path(self):
-        path = QFileDialog.getExistingDirectory(self, "Select Save Directory")
+        if self._QFileDialog is None:
+            from PyQt6.QtWidgets import QFileDialog
+
+            self._QFileDialog = QFileDialog
+        path = self._QFileDialog.getExistingDirectory(self, "Select Save Directory")
         if path:
             self.path_input.setText(path)
 
@@ -432,9 +481,12 @@ class MainWindow(QMainWindow):
         self.stop_button.setStyleSheet(
             "QPushButton { background-color: #ff4444; color: white; }"
         )
-        self.update_status("Initializing download...")
+        # Drop lines of the previous run not yet flushed to the view
+        self._pending_log.clear()
         self.log_text.clear()
+        self.update_status("Initializing download...")
 
+        UnifiedDownloadWorker = self._worker_class()
         if platform == "ModelScope":
             self.download_worker = UnifiedDownloadWorker(
                 "modelscope", repo_id, save_path, token, endpoint, repo_type
@@ -472,25 +524,28 @@ class MainWindow(QMainWindow):
 
     def update_status(self, message, error=False):
         if error:
-            self.log_text.append(f"❌ {message}")
+            self.update_log(f"❌ {message}")
         else:
-            self.log_text.append(f"ℹ️ {message}")
-        self.log_text.verticalScrollBar().setValue(
-            self.log_text.verticalScrollBar().maximum()
-        )
+            self.update_log(f"ℹ️ {message}")
 
     def update_log(self, message):
-        self.log_text.append(message)
-        self.log_text.verticalScrollBar().setValue(
-            self.log_text.verticalScrollBar().maximum()
-        )
+        self._pending_log.append(message)
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    def _flush_log(self):
+        if not self._pending_log:
+            return
+        self.log_text.append("\n".join(self._pending_log))
+        self._pending_log.clear()
+        self.log_text.moveCursor(QTextCursor.MoveOperation.End)
 
     def download_finished(self):
         self.download_button.setEnabled(True)
         self.stop_button.setEnabled(False)
         self.stop_button.setStyleSheet("")
         self.update_status("✅ Download completed successfully!")
-        self.log_text.append("✅ Download completed successfully!")
+        self.update_log("✅ Download completed successfully!")
 
     def download_error(self, error_msg):
         self.download_button.setEnabled(True)
@@ -498,10 +553,10 @@ class MainWindow(QMainWindow):
         self.stop_button.setStyleSheet("")
         if "cancelled by user" in error_msg.lower():
             self.update_status("⏹️ Download stopped by user")
-            self.log_text.append("⏹️ Download stopped by user")
+            self.update_log("⏹️ Download stopped by user")
         else:
             self.update_status(f"❌ Error: {error_msg}", error=True)
-            self.log_text.append(f"❌ Error: {error_msg}")
+            self.update_log(f"❌ Error: {error_msg}")
 
 
     # === Settings & presets helpers ===
@@ -522,16 +577,14 @@ class MainWindow(QMainWindow):
 
         # Platform / type
         last_platform = self.settings.get("last_platform") or "Hugging Face"
-        for i in range(self.platform_combo.count()):
-            if self.platform_combo.itemText(i) == last_platform:
-                self.platform_combo.setCurrentIndex(i)
-                break
+        idx = self.platform_combo.findText(last_platform)
+        if idx >= 0:
+            self.platform_combo.setCurrentIndex(idx)
 
         last_repo_type = self.settings.get("last_repo_type") or "Model"
-        for i in range(self.type_combo.count()):
-            if self.type_combo.itemText(i) == last_repo_type:
-                self.type_combo.setCurrentIndex(i)
-                break
+        idx = self.type_combo.findText(last_repo_type)
+        if idx >= 0:
+            self.type_combo.setCurrentIndex(idx)
 
         # Named locations
         self._refresh_path_presets()
@@ -540,10 +593,12 @@ class MainWindow(QMainWindow):
         self.path_preset_combo.blockSignals(True)
         self.path_preset_combo.clear()
         self.path_preset_combo.addItem("Presets...")
-        for loc in self.settings.get("named_locations", []):
+        locations = self.settings.get("named_locations", [])
+        for loc in locations:
             label = f"{loc.get('name','')}"
             self.path_preset_combo.addItem(label, loc.get("path", ""))
         self.path_preset_combo.blockSignals(False)
+        self._preset_paths = {loc.get("path", "") for loc in locations}
 
     def on_path_preset_changed(self, index: int):
         if index <= 0:
@@ -557,10 +612,11 @@ class MainWindow(QMainWindow):
         if not path:
             return
         name = os.path.basename(path) or path
-        locations = list(self.settings.get("named_locations", []))
-        if any(loc.get("path") == path for loc in locations):
+        if path in self._preset_paths:
             return
+        locations = list(self.settings.get("named_locations", []))
         locations.append({"name": name, "path": path})
+        self._preset_paths.add(path)
         self.settings["named_locations"] = locations
         self.settings["default_save_path"] = path
         save_settings(self.settings)
@@ -598,9 +654,11 @@ class MainWindow(QMainWindow):
 
         layout.addWidget(QLabel("Named locations:"))
         list_widget = QListWidget()
+        list_widget.setUpdatesEnabled(False)
         locations = list(self.settings.get("named_locations", []))
         for loc in locations:
             list_widget.addItem(f"{loc.get('name','')} -> {loc.get('path','')}")
+        list_widget.setUpdatesEnabled(True)
         layout.addWidget(list_widget)
 
         btn_row = QHBoxLayout()
@@ -640,7 +698,7 @@ class MainWindow(QMainWindow):
     def run_login_helper(self):
         """Run the bundled hf_login_helper.bat on Windows to configure HF credentials."""
         import subprocess
-        if platform.system().lower() != "windows":
+        if not sys.platform.startswith("win"):
             self.update_status("HF Login Helper is only available on Windows.", error=True)
             return
         # Batch script is located in scripts folder next to this file's parent directory
@@ -20,8 +20,28 @@ Or run directly:
 __version__ = "2.0.0"
 __author__ = "HF Suite Team"
 
-from .ui.app import run_app, create_app
-from .core import get_config, get_db, EventBus, Events
+import importlib
+
+# Public names are imported on first access, so `python -m hf_suite_v2.cli`
+# does not pay for the Qt UI or the database layer before it needs them
+_LAZY_ATTRS = {
+    "run_app": ".ui.app",
+    "create_app": ".ui.app",
+    "get_config": ".core",
+    "get_db": ".core",
+    "EventBus": ".core",
+    "Events": ".core",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "run_app",
@@ -4,11 +4,62 @@ CLI entry point and commands.
 
 import argparse
 import logging
+import os
+import re
 import sys
-from pathlib import Path
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Number of scanned models written to the database per transaction,
+# overridable through HF_SUITE_SCAN_BATCH_SIZE (read by _scan_batch_size())
+SCAN_BATCH_SIZE = 1000
+
+# Directory listings run concurrently to hide filesystem latency
+SCAN_MAX_WORKERS = 8
+
+# File extensions (lowercase) treated as model weights by the scanner
+MODEL_EXTENSIONS = frozenset({".safetensors", ".ckpt", ".pt", ".pth", ".bin", ".gguf"})
+
+# Hidden entries (".git", ".locks") are never descended into. A
+# HuggingFace cache repo directory ("models--owner--name") exposes every
+# file through both snapshots/ and blobs/, so inside one only snapshots/
+# is walked; directories with these names elsewhere are scanned as usual.
+HF_CACHE_REPO_PREFIXES = ("models--", "datasets--", "spaces--")
+SCAN_SKIP_DIRS = frozenset({"blobs", "refs"})
+
+# Markers for favorite / regular entries in "list history"
+_FAV = "\u2b50"
+_NOFAV = "  "
+
+# Path keywords that identify a model type, in order of precedence
+MODEL_TYPE_KEYWORDS = ("lora", "vae", "controlnet", "embedding")
+_MODEL_TYPE_RE = re.compile("|".join(MODEL_TYPE_KEYWORDS))
+
+
+def _detect_model_type(path_lower: str) -> str:
+    """Guess a model type from keywords in a lowercased file path."""
+    found = set(_MODEL_TYPE_RE.findall(path_lower))
+    for model_type in MODEL_TYPE_KEYWORDS:
+        if model_type in found:
+            return model_type
+    return "checkpoint"
+
+
+def _scan_batch_size() -> int:
+    """Scan batch size from the environment, falling back to SCAN_BATCH_SIZE."""
+    raw = os.environ.get("HF_SUITE_SCAN_BATCH_SIZE")
+    if raw is None:
+        return SCAN_BATCH_SIZE
+    try:
+        return max(1, int(raw))
+    except ValueError:
+        logger.warning(
+            f"Ignoring invalid HF_SUITE_SCAN_BATCH_SIZE={raw!r}, using {SCAN_BATCH_SIZE}"
+        )
+        return SCAN_BATCH_SIZE
+
 
 def setup_logging(verbose: bool = False) -> None:
     """Configure CLI logging."""
@@ -19,6 +70,105 @@ def setup_logging(verbose: bool = False) -> None:
     )
 
 
+def _scan_dir(path: str) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """
+    List one directory for the scanner.
+    
+    Uses os.scandir so each entry's type and stat information come from the
+    directory listing itself. Symlinked directories are not followed, but
+    symlinked files are (the HuggingFace cache stores snapshot files as
+    symlinks into its blob store).
+    
+    Returns:
+        Tuple of (model file records, subdirectory paths)
+    """
+    records = []
+    subdirs = []
+    in_repo_cache = os.path.basename(os.path.normpath(path)).startswith(HF_CACHE_REPO_PREFIXES)
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                filename = entry.name
+                if filename.startswith("."):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    if not (in_repo_cache and filename in SCAN_SKIP_DIRS):
+                        subdirs.append(entry.path)
+                    continue
+                
+                dot = filename.rfind(".")
+                ext = filename[dot:].lower() if dot >= 0 else ""
+                # Only model files reach stat(), so configs, tokenizers
+                # and READMEs never cost a syscall
+                if ext not in MODEL_EXTENSIONS or not entry.is_file():
+                    continue
+                try:
+                    file_size = entry.stat().st_size
+                except OSError:
+                    # Dangling symlink or file removed mid-scan
+                    continue
+                
+                filepath = entry.path
+                records.append({
+                    "file_path": filepath,
+                    "file_name": filename,
+                    "file_size": file_size,
+                    "model_type": _detect_model_type(filepath.lower()),
+                })
+    except OSError as e:
+        logger.debug(f"Skipping unreadable directory {path}: {e}")
+    
+    return records, subdirs
+
+
+def _expand_scan_root(root: str) -> List[str]:
+    """
+    Narrow a HuggingFace hub cache root to its repos' snapshot directories.
+    
+    Model, dataset and space caches ("models--*", "datasets--*",
+    "spaces--*") are all included. Any other root is returned unchanged.
+    """
+    if os.path.basename(os.path.normpath(root)) != "hub":
+        return [root]
+    
+    snapshots = []
+    try:
+        with os.scandir(root) as it:
+            for entry in it:
+                if "--" in entry.name and entry.is_dir(follow_symlinks=False):
+                    snapshot_dir = os.path.join(entry.path, "snapshots")
+                    if os.path.isdir(snapshot_dir):
+                        snapshots.append(snapshot_dir)
+    except OSError as e:
+        logger.debug(f"Skipping unreadable directory {root}: {e}")
+        return []
+    
+    return snapshots or [root]
+
+
+def _scan_roots(
+    roots: List[str],
+    max_workers: int = SCAN_MAX_WORKERS,
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Walk several directory trees concurrently.
+    
+    Every directory listing is a task on a shared thread pool, and the
+    subdirectories it finds are queued as new tasks straight away. Yields
+    the model file records of each directory as its listing completes.
+    """
+    start_dirs = [path for root in roots for path in _expand_scan_root(root)]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        running = {executor.submit(_scan_dir, path) for path in start_dirs}
+        while running:
+            done, running = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                records, subdirs = future.result()
+                running.update(executor.submit(_scan_dir, subdir) for subdir in subdirs)
+                if records:
+                    yield records
+
+
 def cmd_download(args: argparse.Namespace) -> int:
     """Handle download command."""
     from ..core import get_config
@@ -69,9 +219,10 @@ def cmd_list(args: argparse.Namespace) -> int:
         
         print(f"\nDownload History ({len(history)} entries):")
         print("-" * 60)
-        for entry in history:
-            fav = "⭐" if entry.is_favorite else "  "
-            print(f"{fav} {entry.repo_id:<40} {entry.platform}")
+        print("\n".join(
+            f"{_FAV if entry.is_favorite else _NOFAV} {entry.repo_id:<40} {entry.platform}"
+            for entry in history
+        ))
             
     elif args.what == "local":
         models = db.get_local_models()
@@ -81,9 +232,11 @@ def cmd_list(args: argparse.Namespace) -> int:
         
         print(f"\nLocal Models ({len(models)} files):")
         print("-" * 60)
+        lines = []
         for model in models:
             size = f"{model.file_size / 1024 / 1024:.1f} MB" if model.file_size else "?"
-            print(f"  {model.file_name:<40} {size:>10}  {model.model_type}")
+            lines.append(f"  {model.file_name:<40} {size:>10}  {model.model_type}")
+        print("\n".join(lines))
             
     elif args.what == "queue":
         pending = db.get_pending_downloads()
@@ -93,8 +246,10 @@ def cmd_list(args: argparse.Namespace) -> int:
         
         print(f"\nDownload Queue ({len(pending)} items):")
         print("-" * 60)
-        for item in pending:
-            print(f"  [{item.priority}] {item.repo_id:<40} {item.status}")
+        print("\n".join(
+            f"  [{item.priority}] {item.repo_id:<40} {item.status}"
+            for item in pending
+        ))
     
     return 0
 
@@ -102,51 +257,35 @@ def cmd_list(args: argparse.Namespace) -> int:
 def cmd_scan(args: argparse.Namespace) -> int:
     """Handle scan command."""
     from ..core import get_db
-    from ..core.constants import FILE_CATEGORIES
-    import os
-    import hashlib
     
     paths = args.paths or [os.path.expanduser("~/.cache/huggingface/hub")]
     
     print("Scanning for models...")
     db = get_db()
     
-    MODEL_EXTENSIONS = {'.safetensors', '.ckpt', '.pt', '.pth', '.bin', '.gguf'}
     found_count = 0
+    pending = []
+    batch_size = _scan_batch_size()
     
+    roots = []
     for scan_path in paths:
         if not os.path.exists(scan_path):
             print(f"  Skipping (not found): {scan_path}")
             continue
         
         print(f"  Scanning: {scan_path}")
+        roots.append(scan_path)
+    
+    for records in _scan_roots(roots):
+        pending.extend(records)
+        found_count += len(records)
         
-        for root, dirs, files in os.walk(scan_path):
-            for filename in files:
-                ext = os.path.splitext(filename)[1].lower()
-                if ext in MODEL_EXTENSIONS:
-                    filepath = os.path.join(root, filename)
-                    stat = os.stat(filepath)
-                    
-                    # Detect model type from path/name
-                    path_lower = filepath.lower()
-                    model_type = "checkpoint"
-                    if "lora" in path_lower:
-                        model_type = "lora"
-                    elif "vae" in path_lower:
-                        model_type = "vae"
-                    elif "controlnet" in path_lower:
-                        model_type = "controlnet"
-                    elif "embedding" in path_lower:
-                        model_type = "embedding"
-                    
-                    db.add_local_model({
-                        "file_path": filepath,
-                        "file_name": filename,
-                        "file_size": stat.st_size,
-                        "model_type": model_type,
-                    })
-                    found_count += 1
+        if len(pending) >= batch_size:
+            db.add_local_models(pending)
+            pending.clear()
+    
+    if pending:
+        db.add_local_models(pending)
     
     print(f"\nFound {found_count} model files.")
     return 0
@@ -187,27 +326,7 @@ def cmd_config(args: argparse.Namespace) -> int:
     return 0
 
 
-def create_parser() -> argparse.ArgumentParser:
-    """Create the argument parser."""
-    parser = argparse.ArgumentParser(
-        prog="hf-suite",
-        description="HuggingFace Download Suite CLI",
-    )
-    parser.add_argument(
-        "-v", "--verbose",
-        action="store_true",
-        help="Enable verbose output"
-    )
-    parser.add_argument(
-        "--version",
-        action="version",
-        version="%(prog)s 2.0.0"
-    )
-    
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
-    
-    # Download command
-    dl_parser = subparsers.add_parser("download", aliases=["dl"], help="Download a model")
+def _build_download_parser(dl_parser: argparse.ArgumentParser) -> None:
     dl_parser.add_argument("repo_id", help="Repository ID (e.g., user/model)")
     dl_parser.add_argument(
         "-p", "--platform",
@@ -230,10 +349,9 @@ def create_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Wait for download to complete"
     )
-    dl_parser.set_defaults(func=cmd_download)
-    
-    # List command
-    list_parser = subparsers.add_parser("list", aliases=["ls"], help="List items")
+
+
+def _build_list_parser(list_parser: argparse.ArgumentParser) -> None:
     list_parser.add_argument(
         "what",
         choices=["history", "local", "queue"],
@@ -245,19 +363,17 @@ def create_parser() -> argparse.ArgumentParser:
         default=20,
         help="Maximum items to show"
     )
-    list_parser.set_defaults(func=cmd_list)
-    
-    # Scan command
-    scan_parser = subparsers.add_parser("scan", help="Scan for local models")
+
+
+def _build_scan_parser(scan_parser: argparse.ArgumentParser) -> None:
     scan_parser.add_argument(
         "paths",
         nargs="*",
         help="Paths to scan (default: ~/.cache/huggingface/hub)"
     )
-    scan_parser.set_defaults(func=cmd_scan)
-    
-    # Config command
-    config_parser = subparsers.add_parser("config", help="Manage configuration")
+
+
+def _build_config_parser(config_parser: argparse.ArgumentParser) -> None:
     config_parser.add_argument(
         "action",
         choices=["show", "set", "reset"],
@@ -265,14 +381,66 @@ def create_parser() -> argparse.ArgumentParser:
     )
     config_parser.add_argument("--key", help="Config key for 'set'")
     config_parser.add_argument("--value", help="Config value for 'set'")
-    config_parser.set_defaults(func=cmd_config)
+
+
+# (name, aliases, help, argument builder, handler)
+SUBCOMMANDS = [
+    ("download", ["dl"], "Download a model", _build_download_parser, cmd_download),
+    ("list", ["ls"], "List items", _build_list_parser, cmd_list),
+    ("scan", [], "Scan for local models", _build_scan_parser, cmd_scan),
+    ("config", [], "Manage configuration", _build_config_parser, cmd_config),
+]
+
+
+def _requested_command(argv: List[str]) -> Optional[str]:
+    """Return the first positional token, which names the subcommand."""
+    for token in argv:
+        if not token.startswith("-"):
+            return token
+    return None
+
+
+def create_parser(argv: Optional[List[str]] = None) -> argparse.ArgumentParser:
+    """
+    Create the argument parser.
+    
+    Every subcommand is registered so it shows up in --help, but only the
+    one named in argv gets its arguments built. Without a recognised
+    subcommand in argv, all of them are built.
+    """
+    parser = argparse.ArgumentParser(
+        prog="hf-suite",
+        description="HuggingFace Download Suite CLI",
+    )
+    parser.add_argument(
+        "-v", "--verbose",
+        action="store_true",
+        help="Enable verbose output"
+    )
+    parser.add_argument(
+        "--version",
+        action="version",
+        version="%(prog)s 2.0.0"
+    )
+    
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+    
+    requested = _requested_command(sys.argv[1:] if argv is None else argv)
+    known = {name for spec in SUBCOMMANDS for name in [spec[0], *spec[1]]}
+    build_all = requested not in known
+    
+    for name, aliases, help_text, build, handler in SUBCOMMANDS:
+        sub_parser = subparsers.add_parser(name, aliases=aliases, help=help_text)
+        if build_all or requested == name or requested in aliases:
+            build(sub_parser)
+        sub_parser.set_defaults(func=handler)
     
     return parser
 
 
 def cli(args: list = None) -> int:
     """Run the CLI."""
-    parser = create_parser()
+    parser = create_parser(args)
     parsed = parser.parse_args(args)
     
     setup_logging(parsed.verbose)
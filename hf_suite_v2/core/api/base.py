@@ -2,13 +2,42 @@
 Base API class and common exceptions.
 """
 
+import hashlib
 import logging
+import re
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Any
+from dataclasses import dataclass, field
 
 logger = logging.getLogger(__name__)
 
+# Concurrent requests made by get_repo_infos()
+BULK_INFO_MAX_WORKERS = 8
+
+# Unfiltered search pages, shared by all clients and keyed by
+# (platform, client key, query, limit) -> (expires_at, results); filters
+# are applied to the cached page so switching between them costs nothing
+SEARCH_CACHE_SIZE = 64
+SEARCH_CACHE_TTL = 120  # seconds
+# Pages are fetched this many times larger than the limit, leaving room
+# for results dropped by filters
+SEARCH_OVERFETCH = 2
+_SEARCH_CACHE: "OrderedDict[tuple, tuple]" = OrderedDict()
+_SEARCH_CACHE_LOCK = threading.Lock()
+
+# "owner/name", where neither part is empty or starts with a dot
+_REPO_ID_RE = re.compile(r"[^./][^/]*/[^./][^/]*")
+
+
+def _split_repo_id(repo_id: str) -> Tuple[str, str]:
+    """Split "owner/name" into (owner, name); IDs without an owner give ("", id)."""
+    owner, sep, name = repo_id.partition("/")
+    return (owner, name) if sep else ("", owner)
+
 
 class APIError(Exception):
     """Base exception for API errors."""
@@ -35,7 +64,7 @@ class NotFoundError(APIError):
     pass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RepoFile:
     """Represents a file in a repository."""
     path: str
@@ -45,7 +74,7 @@ class RepoFile:
     sha256: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RepoMetadata:
     """Repository metadata."""
     repo_id: str
@@ -56,14 +85,10 @@ class RepoMetadata:
     description: str = ""
     downloads: int = 0
     likes: int = 0
-    tags: List[str] = None
+    tags: List[str] = field(default_factory=list)
     private: bool = False
     gated: bool = False
     last_modified: Optional[str] = None
-    
-    def __post_init__(self):
-        if self.tags is None:
-            self.tags = []
 
 
 class BaseAPI(ABC):
@@ -87,6 +112,14 @@ class BaseAPI(ABC):
         self.token = token
         self.endpoint = endpoint
     
+    def _client_key(self) -> str:
+        """
+        Key for sharing one underlying client between instances.
+        
+        Hashed so tokens are not kept as plain-text dict keys.
+        """
+        return hashlib.sha256(f"{self.endpoint}|{self.token or ''}".encode()).hexdigest()
+    
     @property
     @abstractmethod
     def platform_name(self) -> str:
@@ -111,6 +144,36 @@ class BaseAPI(ABC):
         """
         pass
     
+    def get_repo_infos(
+        self,
+        repo_ids: List[str],
+        repo_type: str = "model",
+        max_workers: int = BULK_INFO_MAX_WORKERS,
+    ) -> List[Optional[RepoMetadata]]:
+        """
+        Get metadata for several repositories concurrently.
+        
+        Args:
+            repo_ids: Repository IDs
+            repo_type: Repository type shared by all IDs
+            max_workers: Maximum requests in flight
+            
+        Returns:
+            Metadata in the order of repo_ids, None where a lookup failed
+        """
+        def fetch(repo_id: str) -> Optional[RepoMetadata]:
+            try:
+                return self.get_repo_info(repo_id, repo_type)
+            except APIError as e:
+                logger.debug(f"Repo info lookup failed for {repo_id}: {e}")
+                return None
+        
+        if len(repo_ids) <= 1:
+            return [fetch(repo_id) for repo_id in repo_ids]
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(repo_ids))) as executor:
+            return list(executor.map(fetch, repo_ids))
+    
     @abstractmethod
     def list_files(self, repo_id: str, repo_type: str = "model") -> List[RepoFile]:
         """
@@ -125,6 +188,23 @@ class BaseAPI(ABC):
         """
         pass
     
+    def iter_files(self, repo_id: str, repo_type: str = "model") -> Iterator[RepoFile]:
+        """
+        Iterate over files in a repository.
+        
+        For callers that only walk the listing once, such as summing
+        sizes; platforms that keep the listing cached override this to
+        skip building a list.
+        
+        Args:
+            repo_id: Repository ID
+            repo_type: Repository type
+            
+        Returns:
+            Iterator of RepoFile objects, sorted by path
+        """
+        return iter(self.list_files(repo_id, repo_type))
+    
     @abstractmethod
     def download_file(
         self,
@@ -168,6 +248,41 @@ class BaseAPI(ABC):
         """
         raise NotImplementedError("Search not implemented for this platform")
     
+    def _search_page(
+        self,
+        query: str,
+        limit: int,
+        fetch: Callable[[int], List[RepoMetadata]],
+    ) -> tuple:
+        """
+        Get the unfiltered results for a query, using the search cache.
+        
+        Args:
+            query: Search query
+            limit: Number of results the caller will show
+            fetch: Called with the number of results to request on a miss
+            
+        Returns:
+            Tuple of up to limit * SEARCH_OVERFETCH results
+        """
+        key = (self.platform_name, self._client_key(), query, limit)
+        now = time.time()
+        with _SEARCH_CACHE_LOCK:
+            entry = _SEARCH_CACHE.get(key)
+            if entry is not None and entry[0] > now:
+                _SEARCH_CACHE.move_to_end(key)
+                return entry[1]
+        
+        results = tuple(fetch(limit * SEARCH_OVERFETCH))
+        
+        with _SEARCH_CACHE_LOCK:
+            _SEARCH_CACHE[key] = (now + SEARCH_CACHE_TTL, results)
+            _SEARCH_CACHE.move_to_end(key)
+            while len(_SEARCH_CACHE) > SEARCH_CACHE_SIZE:
+                _SEARCH_CACHE.popitem(last=False)
+        
+        return results
+    
     def validate_repo_id(self, repo_id: str) -> bool:
         """
         Validate repository ID format.
@@ -178,11 +293,4 @@ class BaseAPI(ABC):
         Returns:
             True if valid format
         """
-        if not repo_id:
-            return False
-        
-        parts = repo_id.split("/")
-        if len(parts) != 2:
-            return False
-        
-        return all(part and not part.startswith(".") for part in parts)
+        return bool(repo_id) and _REPO_ID_RE.fullmatch(repo_id) is not None
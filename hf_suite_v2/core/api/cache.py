@@ -8,19 +8,91 @@ to reduce API calls and improve UI responsiveness.
 import json
 import hashlib
 import logging
+import os
+import struct
+import threading
 import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional, Any, Dict, Callable
-from functools import wraps
+from functools import lru_cache, wraps
 
 from ..constants import APP_DATA_DIR
+from .base import NotFoundError
+
+try:
+    import orjson
+except ImportError:  # Optional: the stdlib json module is used instead
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 # Cache configuration
 CACHE_DIR = APP_DATA_DIR / "cache"
 DEFAULT_TTL = 3600  # 1 hour in seconds
+DEFAULT_NEG_TTL = 60  # Seconds to remember None results and NotFoundError
 MAX_CACHE_SIZE_MB = 100  # Maximum cache size
+MEMORY_CACHE_ENTRIES = 512  # Entries kept in memory in front of the disk cache
+CLEANUP_INTERVAL = 300  # Minimum seconds between background expiry sweeps
+
+# Each entry file starts with a fixed header (magic, expires_at) followed by
+# the JSON payload, so expiry can be checked without parsing the payload
+_ENTRY_MAGIC = b"HFC1"
+_ENTRY_HEADER = struct.Struct("<4sd")
+CACHE_FILE_SUFFIX = ".json"
+
+# Keyword arguments that never affect a result and are left out of cache keys
+NON_CACHEABLE_KWARGS = frozenset({"progress_callback"})
+
+# Stored by @cached in place of negative results, which cache.get() cannot
+# distinguish from a miss
+_NEG_KEY = "__neg__"
+_EXC_KEY = "__exc__"
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize cache data to JSON bytes."""
+    if orjson is not None:
+        # Match json.dumps, which stringifies non-str dict keys
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data).encode('utf-8')
+
+
+def _canonical_bytes(data: Any) -> bytes:
+    """
+    Serialize data to compact, key-sorted JSON for hashing.
+    
+    Raises TypeError for objects that are not JSON types (orjson also
+    encodes dataclasses and datetimes natively), rather than falling back
+    to str(), whose output often includes a memory address.
+    """
+    if orjson is not None:
+        # orjson.JSONEncodeError subclasses TypeError
+        return orjson.dumps(
+            data,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+        )
+    return json.dumps(
+        data,
+        sort_keys=True,
+        separators=(',', ':'),
+        ensure_ascii=False,
+    ).encode('utf-8')
+
+
+def _read_expiry(f) -> float:
+    """Read the expires_at timestamp from an open entry file's header."""
+    magic, expires_at = _ENTRY_HEADER.unpack(f.read(_ENTRY_HEADER.size))
+    if magic != _ENTRY_MAGIC:
+        raise ValueError("not a cache entry file")
+    return expires_at
+
+
+def _loads(raw: bytes) -> Any:
+    """Deserialize JSON bytes written by _dumps."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
 class APICache:
@@ -31,39 +103,116 @@ class APICache:
     - TTL-based expiration
     - Automatic cleanup of expired entries
     - Size-limited cache directory
+    - In-memory LRU layer for hot keys
     - Thread-safe operations
-    """
     
-    _instance = None
-    
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
+    Values served from memory are shared between callers and must not be
+    mutated. Use get_cache() for the shared instance.
+    """
     
     def __init__(self):
-        if self._initialized:
-            return
-        
-        self._initialized = True
         self.cache_dir = CACHE_DIR
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         
+        # In-memory LRU of key -> (expires_at, value)
+        self._mem: "OrderedDict[str, tuple]" = OrderedDict()
+        self._mem_cap = MEMORY_CACHE_ENTRIES
+        self._mem_lock = threading.Lock()
+        
+        # Background expiry sweeps, started from get()/set() at most once
+        # per CLEANUP_INTERVAL
+        self._last_cleanup = 0.0
+        self._cleanup_lock = threading.Lock()
+        
         # Cache stats
         self._hits = 0
         self._misses = 0
         
         logger.debug(f"APICache initialized at {self.cache_dir}")
     
-    def _get_cache_key(self, prefix: str, *args, **kwargs) -> str:
-        """Generate a unique cache key from arguments."""
-        key_data = f"{prefix}:{args}:{sorted(kwargs.items())}"
-        return hashlib.md5(key_data.encode()).hexdigest()
+    def make_key(self, prefix: str, *args, **kwargs) -> str:
+        """
+        Generate a unique cache key from arguments.
+        
+        Arguments are serialized canonically (sorted keys, JSON encoding)
+        rather than through repr(), so equal inputs map to the same key
+        across runs. Private keyword arguments (leading underscore) and
+        those in NON_CACHEABLE_KWARGS, such as callbacks, are ignored.
+        
+        Raises:
+            TypeError: If an argument is not JSON serializable
+        """
+        cacheable_kwargs = sorted(
+            (name, value) for name, value in kwargs.items()
+            if not name.startswith('_') and name not in NON_CACHEABLE_KWARGS
+        )
+        key_data = _canonical_bytes([prefix, args, cacheable_kwargs])
+        return hashlib.blake2b(key_data, digest_size=16).hexdigest()
     
     def _get_cache_path(self, key: str) -> Path:
         """Get the file path for a cache key."""
-        return self.cache_dir / f"{key}.json"
+        return self.cache_dir / f"{key}{CACHE_FILE_SUFFIX}"
+    
+    def _iter_entries(self):
+        """Yield a DirEntry for every cache entry file in one directory pass."""
+        try:
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if entry.name.endswith(CACHE_FILE_SUFFIX):
+                        yield entry
+        except FileNotFoundError:
+            return
+    
+    def _mem_get(self, key: str) -> tuple:
+        """Look up a key in the memory layer, returning (found, value)."""
+        with self._mem_lock:
+            entry = self._mem.get(key)
+            if entry is None:
+                return False, None
+            expires_at, value = entry
+            if time.time() > expires_at:
+                del self._mem[key]
+                return False, None
+            self._mem.move_to_end(key)
+            return True, value
+    
+    def _mem_put(self, key: str, expires_at: float, value: Any) -> None:
+        """Store a key in the memory layer, evicting the least recently used."""
+        with self._mem_lock:
+            self._mem[key] = (expires_at, value)
+            self._mem.move_to_end(key)
+            if len(self._mem) > self._mem_cap:
+                self._mem.popitem(last=False)
+    
+    def _mem_discard(self, key: Optional[str] = None) -> None:
+        """Drop one key, or every key, from the memory layer."""
+        with self._mem_lock:
+            if key is None:
+                self._mem.clear()
+            else:
+                self._mem.pop(key, None)
+    
+    def _maybe_cleanup_in_background(self) -> None:
+        """Start an expiry sweep on a daemon thread if one is due."""
+        now = time.time()
+        if now - self._last_cleanup < CLEANUP_INTERVAL:
+            return
+        with self._cleanup_lock:
+            if now - self._last_cleanup < CLEANUP_INTERVAL:
+                return
+            self._last_cleanup = now
+        
+        threading.Thread(
+            target=self._run_background_cleanup,
+            name="APICacheCleanup",
+            daemon=True,
+        ).start()
+    
+    def _run_background_cleanup(self) -> None:
+        try:
+            self.cleanup_expired()
+        except Exception as e:
+            logger.warning(f"Background cache cleanup failed: {e}")
     
     def get(self, key: str) -> Optional[Any]:
         """
@@ -75,27 +224,47 @@ class APICache:
         Returns:
             Cached value or None if not found/expired
         """
+        self._maybe_cleanup_in_background()
+        
+        found, value = self._mem_get(key)
+        if found:
+            self._hits += 1
+            return value
+        
         cache_path = self._get_cache_path(key)
         
-        if not cache_path.exists():
+        # EAFP: a miss costs the failed open() and nothing else, including
+        # when the cache directory itself has been removed
+        try:
+            f = open(cache_path, 'rb')
+        except FileNotFoundError:
+            self._misses += 1
+            return None
+        except OSError as e:
+            logger.warning(f"Cache read error for {key}: {e}")
             self._misses += 1
             return None
         
         try:
-            with open(cache_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with f:
+                expires_at = _read_expiry(f)
+                if time.time() > expires_at:
+                    data = None
+                else:
+                    data = _loads(f.read())
             
-            # Check expiration
-            if time.time() > data.get('expires_at', 0):
+            if data is None:
                 cache_path.unlink(missing_ok=True)
                 self._misses += 1
                 return None
             
             self._hits += 1
             logger.debug(f"Cache hit: {key}")
-            return data.get('value')
+            value = data.get('value')
+            self._mem_put(key, expires_at, value)
+            return value
             
-        except (json.JSONDecodeError, IOError) as e:
+        except (ValueError, struct.error, OSError) as e:
             logger.warning(f"Cache read error for {key}: {e}")
             cache_path.unlink(missing_ok=True)
             self._misses += 1
@@ -113,27 +282,43 @@ class APICache:
         Returns:
             True if successfully cached
         """
+        self._maybe_cleanup_in_background()
+        
         cache_path = self._get_cache_path(key)
+        # Written under a per-thread name and renamed into place, so readers
+        # and the cleanup sweep never see a partially written entry
+        tmp_path = cache_path.with_name(
+            f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
         
         try:
-            data = {
+            now = time.time()
+            expires_at = now + ttl
+            payload = _dumps({
                 'value': value,
-                'created_at': time.time(),
-                'expires_at': time.time() + ttl,
-            }
+                'created_at': now,
+            })
             
-            with open(cache_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f)
+            with open(tmp_path, 'wb', buffering=0) as f:
+                f.write(_ENTRY_HEADER.pack(_ENTRY_MAGIC, expires_at))
+                f.write(payload)
+            os.replace(tmp_path, cache_path)
+            self._mem_put(key, expires_at, value)
             
             logger.debug(f"Cache set: {key} (TTL: {ttl}s)")
             return True
             
         except (TypeError, IOError) as e:
             logger.warning(f"Cache write error for {key}: {e}")
+            try:
+                tmp_path.unlink(missing_ok=True)
+            except OSError:
+                pass
             return False
     
     def delete(self, key: str) -> bool:
         """Delete a cache entry."""
+        self._mem_discard(key)
         cache_path = self._get_cache_path(key)
         try:
             cache_path.unlink(missing_ok=True)
@@ -148,12 +333,13 @@ class APICache:
         Returns:
             Number of entries cleared
         """
+        self._mem_discard()
         count = 0
-        for cache_file in self.cache_dir.glob("*.json"):
+        for entry in self._iter_entries():
             try:
-                cache_file.unlink()
+                os.unlink(entry.path)
                 count += 1
-            except IOError:
+            except OSError:
                 pass
         
         logger.info(f"Cache cleared: {count} entries")
@@ -169,18 +355,20 @@ class APICache:
         count = 0
         current_time = time.time()
         
-        for cache_file in self.cache_dir.glob("*.json"):
+        for entry in self._iter_entries():
             try:
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                if current_time > data.get('expires_at', 0):
-                    cache_file.unlink()
+                with open(entry.path, 'rb') as f:
+                    expires_at = _read_expiry(f)
+                expired = current_time > expires_at
+            except (ValueError, struct.error, OSError):
+                expired = True
+            
+            if expired:
+                try:
+                    os.unlink(entry.path)
                     count += 1
-                    
-            except (json.JSONDecodeError, IOError):
-                cache_file.unlink(missing_ok=True)
-                count += 1
+                except FileNotFoundError:
+                    pass
         
         if count > 0:
             logger.debug(f"Cleaned up {count} expired cache entries")
@@ -189,8 +377,14 @@ class APICache:
     
     def get_stats(self) -> Dict:
         """Get cache statistics."""
-        total_size = sum(f.stat().st_size for f in self.cache_dir.glob("*.json"))
-        entry_count = len(list(self.cache_dir.glob("*.json")))
+        total_size = 0
+        entry_count = 0
+        for entry in self._iter_entries():
+            try:
+                total_size += entry.stat().st_size
+            except FileNotFoundError:
+                continue
+            entry_count += 1
         
         return {
             'hits': self._hits,
@@ -201,18 +395,38 @@ class APICache:
         }
 
 
+@lru_cache(maxsize=1)
 def get_cache() -> APICache:
     """Get the global cache instance."""
     return APICache()
 
 
-def cached(prefix: str, ttl: int = DEFAULT_TTL):
+def _key_args(wrapper: Callable, args: tuple) -> tuple:
+    """Arguments of a @cached call to key on, with a bound instance replaced."""
+    if args and getattr(type(args[0]), wrapper.__name__, None) is wrapper:
+        owner = args[0]
+        client_key = getattr(owner, "_client_key", None)
+        owner_key = client_key() if client_key is not None else type(owner).__qualname__
+        return (owner_key, *args[1:])
+    return args
+
+
+def cached(prefix: str, ttl: int = DEFAULT_TTL, neg_ttl: int = DEFAULT_NEG_TTL):
     """
     Decorator to cache function results.
     
+    Arguments must be JSON serializable, or calls raise TypeError; callback
+    keyword arguments are ignored (see APICache.make_key). On methods the
+    instance is keyed by its _client_key() (or its class name), so keys
+    stay the same across runs.
+    
+    A None result or a raised NotFoundError is remembered for neg_ttl
+    seconds, so unreachable or missing repos are not re-fetched on every call.
+    
     Args:
         prefix: Cache key prefix (usually function name)
         ttl: Time-to-live in seconds
+        neg_ttl: Time-to-live in seconds for negative results (0 disables)
         
     Usage:
         @cached("search_models", ttl=1800)
@@ -225,18 +439,30 @@ def cached(prefix: str, ttl: int = DEFAULT_TTL):
             cache = get_cache()
             
             # Generate cache key
-            key = cache._get_cache_key(prefix, *args, **kwargs)
+            key = cache.make_key(prefix, *_key_args(wrapper, args), **kwargs)
             
             # Try cache first
             cached_value = cache.get(key)
             if cached_value is not None:
+                if isinstance(cached_value, dict):
+                    if cached_value.get(_NEG_KEY) is True:
+                        return None
+                    if cached_value.get(_EXC_KEY) == "NotFoundError":
+                        raise NotFoundError(cached_value.get("message", ""))
                 return cached_value
             
             # Call function and cache result
-            result = func(*args, **kwargs)
+            try:
+                result = func(*args, **kwargs)
+            except NotFoundError as e:
+                if neg_ttl > 0:
+                    cache.set(key, {_EXC_KEY: "NotFoundError", "message": e.message}, neg_ttl)
+                raise
             
             if result is not None:
                 cache.set(key, result, ttl)
+            elif neg_ttl > 0:
+                cache.set(key, {_NEG_KEY: True}, neg_ttl)
             
             return result
         
@@ -2,14 +2,25 @@
 HuggingFace Hub API wrapper.
 """
 
+import atexit
+import glob
 import logging
 import os
-from typing import Dict, List, Optional
+import threading
+import time
+from collections import OrderedDict
+from operator import attrgetter
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
 
 from .base import (
-    BaseAPI, RepoFile, RepoMetadata,
+    BaseAPI, RepoFile, RepoMetadata, _split_repo_id,
     APIError, AuthenticationError, NotFoundError, RateLimitError
 )
+from .cache import get_cache
+from ..config import get_config
+
+if TYPE_CHECKING:
+    from huggingface_hub import HfApi
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +28,125 @@ logger = logging.getLogger(__name__)
 DEFAULT_ENDPOINT = "https://huggingface.co"
 MIRROR_ENDPOINT = "https://hf-mirror.com"
 
+# HfApi clients shared by all instances with the same endpoint and token,
+# keyed by BaseAPI._client_key()
+_HFAPI_CACHE: Dict[str, "HfApi"] = {}
+_HFAPI_LOCK = threading.Lock()
+
+# huggingface_hub symbols used on every repo info request, bound by
+# _load_hub() on first client access so importing this module stays cheap
+_ModelInfo = None
+_DatasetInfo = None
+_build_hf_headers = None
+_get_session = None
+_hf_raise_for_status = None
+
+
+def _load_hub() -> None:
+    """Import the huggingface_hub symbols used per request, once."""
+    global _ModelInfo, _DatasetInfo, _build_hf_headers, _get_session, _hf_raise_for_status
+    if _ModelInfo is not None:
+        return
+    from huggingface_hub.hf_api import DatasetInfo, ModelInfo
+    from huggingface_hub.utils import build_hf_headers, get_session, hf_raise_for_status
+    _DatasetInfo, _build_hf_headers = DatasetInfo, build_hf_headers
+    _get_session, _hf_raise_for_status = get_session, hf_raise_for_status
+    _ModelInfo = ModelInfo  # Set last: it marks the symbols as loaded
+
+
+def _close_clients() -> None:
+    """Drop shared clients and close huggingface_hub's HTTP session."""
+    if not _HFAPI_CACHE:
+        return
+    _HFAPI_CACHE.clear()
+    try:
+        from huggingface_hub.utils import close_session
+    except ImportError:  # huggingface_hub < 1.0
+        return
+    close_session()
+
+
+atexit.register(_close_clients)
+
+# One model_info(files_metadata=True) response serves both get_repo_info()
+# and list_files(); results are kept briefly, keyed by
+# (client key, repo_id, repo_type) -> (expires_at, RepoMetadata, files)
+REPO_INFO_CACHE_SIZE = 256
+REPO_INFO_CACHE_TTL = 300  # seconds
+_INFO_CACHE: "OrderedDict[tuple, tuple]" = OrderedDict()
+_INFO_CACHE_LOCK = threading.Lock()
+
+WHOAMI_CACHE_TTL = 60  # seconds
+
+# Concurrent file transfers made by download_files()
+DOWNLOAD_MAX_WORKERS = 8
+
+# Raw repo info responses are kept on disk with their ETag and revalidated
+# with If-None-Match, so an unchanged repo costs a headers-only response
+ETAG_CACHE_TTL = 7 * 24 * 3600  # seconds
+
+# Fields of a repo info response that _fetch_info() reads. Only these are
+# stored with the ETag: files_metadata bodies of large repos run to
+# several MB, mostly in fields nothing here uses
+_INFO_FIELDS = ("id", "author", "downloads", "likes", "tags", "private", "gated", "lastModified")
+_SIBLING_FIELDS = ("rfilename", "size", "blobId", "lfs")
+
+
+class _EtagUnavailable(Exception):
+    """The installed huggingface_hub cannot serve the revalidated request."""
+
+
+def _trim_info(data: Dict) -> Dict:
+    """Keep only the fields of a repo info response that are used."""
+    trimmed = {k: data[k] for k in _INFO_FIELDS if k in data}
+    trimmed["siblings"] = [
+        {k: sibling[k] for k in _SIBLING_FIELDS if k in sibling}
+        for sibling in data.get("siblings") or ()
+    ]
+    return trimmed
+
+
+def _repo_file(sibling) -> RepoFile:
+    """Build a RepoFile from a huggingface_hub RepoSibling."""
+    return RepoFile(
+        path=sibling.rfilename,
+        size=sibling.size or 0,
+        blob_id=sibling.blob_id,
+        lfs=getattr(sibling, "lfs", None) is not None,
+    )
+
+
+def _last_modified(info) -> Optional[str]:
+    """ISO timestamp of a repo's last commit, if the response has one."""
+    # Renamed to last_modified in huggingface_hub 0.20
+    value = getattr(info, "last_modified", None) or getattr(info, "lastModified", None)
+    if value is None:
+        return None
+    return value.isoformat() if hasattr(value, "isoformat") else str(value)
+
+
+def _repo_info_error(error: Exception, repo_id: str) -> APIError:
+    """Map an exception from huggingface_hub onto the APIError hierarchy."""
+    from huggingface_hub.utils import GatedRepoError, HfHubHTTPError, RepositoryNotFoundError
+    
+    # GatedRepoError subclasses RepositoryNotFoundError, so it goes first
+    if isinstance(error, GatedRepoError):
+        return AuthenticationError(f"Authentication required for {repo_id}", status_code=403)
+    if isinstance(error, RepositoryNotFoundError):
+        return NotFoundError(f"Repository not found: {repo_id}", status_code=404)
+    if isinstance(error, HfHubHTTPError):
+        response = getattr(error, "response", None)
+        status_code = getattr(response, "status_code", None)
+        if status_code == 401:
+            return AuthenticationError(f"Authentication required for {repo_id}", status_code=401)
+        if status_code == 404:
+            return NotFoundError(f"Repository not found: {repo_id}", status_code=404)
+        if status_code == 429:
+            return RateLimitError("Rate limit exceeded", status_code=429)
+        return APIError(f"Failed to get repo info: {error}", status_code=status_code)
+    
+    return APIError(f"Failed to get repo info: {error}")
+
 
 class HuggingFaceAPI(BaseAPI):
     """
@@ -51,6 +181,8 @@ class HuggingFaceAPI(BaseAPI):
         super().__init__(token=token, endpoint=endpoint)
         
         self._api = None
+        # (checked_at, token, whoami result) from the last whoami() call
+        self._whoami_cache: Optional[Tuple[float, Optional[str], Optional[Dict]]] = None
     
     @property
     def platform_name(self) -> str:
@@ -58,69 +190,172 @@ class HuggingFaceAPI(BaseAPI):
     
     @property
     def api(self):
-        """Lazy-load HfApi."""
+        """Lazy-load the shared HfApi for this endpoint and token."""
         if self._api is None:
-            from huggingface_hub import HfApi
-            self._api = HfApi(endpoint=self.endpoint, token=self.token)
+            key = self._client_key()
+            with _HFAPI_LOCK:
+                api = _HFAPI_CACHE.get(key)
+                if api is None:
+                    from huggingface_hub import HfApi
+                    api = _HFAPI_CACHE[key] = HfApi(endpoint=self.endpoint, token=self.token)
+            try:
+                _load_hub()
+            except ImportError as e:
+                # Only the revalidated repo info request needs these
+                logger.debug(f"huggingface_hub helpers unavailable: {e}")
+            self._api = api
         return self._api
     
+    def _fetch_info(self, repo_id: str, repo_type: str) -> Tuple[RepoMetadata, tuple]:
+        """
+        Fetch metadata and file list with a single request, using the cache.
+        
+        Returns:
+            Tuple of (metadata, files sorted by path)
+        """
+        key = (self._client_key(), repo_id, repo_type)
+        now = time.time()
+        with _INFO_CACHE_LOCK:
+            entry = _INFO_CACHE.get(key)
+            if entry is not None and entry[0] > now:
+                _INFO_CACHE.move_to_end(key)
+                return entry[1], entry[2]
+        
+        info = self._request_info(repo_id, repo_type)
+        
+        author, name = _split_repo_id(info.id)
+        metadata = RepoMetadata(
+            repo_id=info.id,
+            platform="huggingface",
+            repo_type=repo_type,
+            author=info.author or author,
+            name=name,
+            description=getattr(info, "description", ""),
+            downloads=info.downloads or 0,
+            likes=info.likes or 0,
+            tags=list(info.tags) if info.tags else [],
+            private=info.private if hasattr(info, "private") else False,
+            gated=info.gated if hasattr(info, "gated") else False,
+            last_modified=_last_modified(info),
+        )
+        
+        files = tuple(sorted(map(_repo_file, info.siblings or ()), key=attrgetter("path")))
+        
+        with _INFO_CACHE_LOCK:
+            _INFO_CACHE[key] = (now + REPO_INFO_CACHE_TTL, metadata, files)
+            _INFO_CACHE.move_to_end(key)
+            while len(_INFO_CACHE) > REPO_INFO_CACHE_SIZE:
+                _INFO_CACHE.popitem(last=False)
+        
+        return metadata, files
+    
+    def _request_info(self, repo_id: str, repo_type: str):
+        """
+        Request repo info with file metadata.
+        
+        Tries the ETag-revalidated request first. If that path cannot be
+        used with the installed huggingface_hub (missing helpers, or an
+        info class that no longer takes the response's fields), the public
+        model_info()/dataset_info() call is made instead. HTTP errors from
+        either are raised as huggingface_hub's own error types.
+        
+        Returns:
+            huggingface_hub ModelInfo or DatasetInfo
+        """
+        try:
+            return self._request_info_etag(repo_id, repo_type)
+        except _EtagUnavailable as e:
+            logger.debug(f"Revalidated repo info unavailable for {repo_id}, using HfApi: {e}")
+        
+        if repo_type == "model":
+            return self.api.model_info(repo_id, files_metadata=True)
+        return self.api.dataset_info(repo_id, files_metadata=True)
+    
+    def _request_info_etag(self, repo_id: str, repo_type: str):
+        """
+        Request repo info, revalidating a stored response by ETag.
+        
+        Equivalent to model_info()/dataset_info() with files_metadata=True,
+        for the fields _fetch_info() reads.
+        
+        Raises:
+            _EtagUnavailable: huggingface_hub lacks the helpers used here,
+                or its info class rejects the response
+        """
+        try:
+            _load_hub()  # The client may have been set directly
+        except ImportError as e:
+            raise _EtagUnavailable(e) from e
+        headers = _build_hf_headers(token=self.token)
+        
+        kind = "models" if repo_type == "model" else "datasets"
+        cache = get_cache()
+        cache_key = cache.make_key("hf_etag", self._client_key(), kind, repo_id)
+        stored = cache.get(cache_key)
+        if stored:
+            headers["If-None-Match"] = stored["etag"]
+        
+        response = _get_session().get(
+            f"{self.endpoint}/api/{kind}/{repo_id}",
+            headers=headers,
+            params={"blobs": True},
+            timeout=get_config().network.timeout,
+        )
+        if response.status_code == 304 and stored:
+            data = stored["body"]
+        else:
+            # Raises RepositoryNotFoundError, GatedRepoError etc. as HfApi would
+            _hf_raise_for_status(response)
+            data = _trim_info(response.json())
+            etag = response.headers.get("ETag")
+            if etag:
+                cache.set(cache_key, {"etag": etag, "body": data}, ETAG_CACHE_TTL)
+        
+        info_cls = _ModelInfo if repo_type == "model" else _DatasetInfo
+        try:
+            return info_cls(**data)
+        except TypeError as e:
+            # Info classes of older releases take a fixed set of fields
+            raise _EtagUnavailable(e) from e
+    
+    def invalidate(self, repo_id: Optional[str] = None) -> None:
+        """
+        Drop cached repository info so the next call refetches it.
+        
+        Entries otherwise live for REPO_INFO_CACHE_TTL seconds. The refetch
+        still revalidates a stored response by ETag, so an unchanged repo
+        costs a headers-only response.
+        
+        Args:
+            repo_id: Repository to drop, or None to drop everything
+        """
+        with _INFO_CACHE_LOCK:
+            if repo_id is None:
+                _INFO_CACHE.clear()
+                return
+            for key in [k for k in _INFO_CACHE if k[1] == repo_id]:
+                del _INFO_CACHE[key]
+    
     def get_repo_info(self, repo_id: str, repo_type: str = "model") -> RepoMetadata:
         """Get repository metadata from HuggingFace."""
         try:
-            if repo_type == "model":
-                info = self.api.model_info(repo_id)
-            else:
-                info = self.api.dataset_info(repo_id)
-            
-            return RepoMetadata(
-                repo_id=info.id,
-                platform="huggingface",
-                repo_type=repo_type,
-                author=info.author or info.id.split("/")[0],
-                name=info.id.split("/")[-1],
-                description=getattr(info, "description", ""),
-                downloads=info.downloads or 0,
-                likes=info.likes or 0,
-                tags=list(info.tags) if info.tags else [],
-                private=info.private if hasattr(info, "private") else False,
-                gated=info.gated if hasattr(info, "gated") else False,
-                last_modified=str(info.lastModified) if hasattr(info, "lastModified") else None,
-            )
+            return self._fetch_info(repo_id, repo_type)[0]
             
         except Exception as e:
-            error_str = str(e).lower()
-            
-            if "401" in error_str or "unauthorized" in error_str:
-                raise AuthenticationError(f"Authentication required for {repo_id}")
-            elif "404" in error_str or "not found" in error_str:
-                raise NotFoundError(f"Repository not found: {repo_id}")
-            elif "429" in error_str or "rate limit" in error_str:
-                raise RateLimitError("Rate limit exceeded")
-            
-            raise APIError(f"Failed to get repo info: {e}")
+            raise _repo_info_error(e, repo_id) from e
     
     def list_files(self, repo_id: str, repo_type: str = "model") -> List[RepoFile]:
         """List files in a HuggingFace repository."""
+        return list(self.iter_files(repo_id, repo_type))
+    
+    def iter_files(self, repo_id: str, repo_type: str = "model") -> Iterator[RepoFile]:
+        """Iterate over the cached file listing of a HuggingFace repository."""
         try:
-            if repo_type == "model":
-                info = self.api.model_info(repo_id, files_metadata=True)
-            else:
-                info = self.api.dataset_info(repo_id, files_metadata=True)
-            
-            files = []
-            if info.siblings:
-                for sibling in info.siblings:
-                    files.append(RepoFile(
-                        path=sibling.rfilename,
-                        size=sibling.size or 0,
-                        blob_id=sibling.blob_id,
-                        lfs=sibling.lfs is not None if hasattr(sibling, "lfs") else False,
-                    ))
-            
-            return sorted(files, key=lambda f: f.path)
+            files = self._fetch_info(repo_id, repo_type)[1]
             
         except Exception as e:
             raise APIError(f"Failed to list files: {e}")
+        return iter(files)
     
     def download_file(
         self,
@@ -131,14 +366,10 @@ class HuggingFaceAPI(BaseAPI):
         progress_callback: callable = None,
     ) -> str:
         """Download a file from HuggingFace."""
-        from huggingface_hub import hf_hub_download
-        
         try:
-            # Set environment for custom endpoint
-            if self.endpoint and self.endpoint != DEFAULT_ENDPOINT:
-                os.environ["HF_ENDPOINT"] = self.endpoint
-            
-            result = hf_hub_download(
+            # The client carries this instance's endpoint, so concurrent
+            # downloads against different endpoints do not interfere
+            return self.api.hf_hub_download(
                 repo_id=repo_id,
                 filename=filename,
                 repo_type=repo_type,
@@ -146,14 +377,47 @@ class HuggingFaceAPI(BaseAPI):
                 token=self.token,
             )
             
-            return result
+        except Exception as e:
+            raise APIError(f"Download failed: {e}")
+    
+    def download_files(
+        self,
+        repo_id: str,
+        filenames: List[str],
+        local_path: str,
+        repo_type: str = "model",
+        max_workers: int = DOWNLOAD_MAX_WORKERS,
+    ) -> str:
+        """
+        Download several files from one repository in a single snapshot.
+        
+        The repo is resolved once, so every file comes from the same
+        commit, and files are fetched concurrently instead of one
+        download_file() round trip each.
+        
+        Args:
+            repo_id: Repository ID
+            filenames: File paths within the repository
+            local_path: Local destination directory
+            repo_type: Type of repository
+            max_workers: Maximum concurrent file transfers
+            
+        Returns:
+            Path to the local directory
+        """
+        try:
+            return self.api.snapshot_download(
+                repo_id=repo_id,
+                repo_type=repo_type,
+                local_dir=local_path,
+                # Escaped so names are matched literally, not as globs
+                allow_patterns=[glob.escape(f) for f in filenames],
+                max_workers=max_workers,
+                token=self.token,
+            )
             
         except Exception as e:
             raise APIError(f"Download failed: {e}")
-        finally:
-            # Restore endpoint
-            if "HF_ENDPOINT" in os.environ:
-                del os.environ["HF_ENDPOINT"]
     
     def search(
         self,
@@ -162,51 +426,67 @@ class HuggingFaceAPI(BaseAPI):
         filters: Dict = None,
     ) -> List[RepoMetadata]:
         """Search HuggingFace models."""
-        from huggingface_hub import ModelFilter
-        
         try:
-            model_filter = ModelFilter()
-            
-            if filters:
-                if filters.get("task"):
-                    model_filter.task = filters["task"]
-                if filters.get("library"):
-                    model_filter.library = filters["library"]
-            
-            results = self.api.list_models(
-                search=query,
-                filter=model_filter,
-                limit=limit,
-                sort="downloads",
-                direction=-1,
-            )
-            
-            models = []
-            for model in results:
-                models.append(RepoMetadata(
-                    repo_id=model.id,
-                    platform="huggingface",
-                    repo_type="model",
-                    author=model.id.split("/")[0] if "/" in model.id else "",
-                    name=model.id.split("/")[-1],
-                    downloads=model.downloads or 0,
-                    likes=model.likes or 0,
-                    tags=list(model.tags) if model.tags else [],
-                    private=model.private if hasattr(model, "private") else False,
-                    gated=model.gated if hasattr(model, "gated") else False,
-                ))
-            
-            return models
-            
+            results = self._search_page(query, limit, lambda n: self._search_models(query, n))
         except Exception as e:
             raise APIError(f"Search failed: {e}")
+        
+        # Task and library names are both listed in a model's tags
+        wanted = [filters[name] for name in ("task", "library") if filters and filters.get(name)]
+        if wanted:
+            results = [m for m in results if all(tag in m.tags for tag in wanted)]
+        return list(results[:limit])
+    
+    def _search_models(self, query: str, limit: int) -> List[RepoMetadata]:
+        """Request one unfiltered page of search results, most downloaded first."""
+        results = list(self.api.list_models(
+            search=query,
+            limit=limit,
+            sort="downloads",
+            direction=-1,
+        ))
+        if not results:
+            return []
+        
+        # Every result of one response has the same schema
+        has_private = hasattr(results[0], "private")
+        has_gated = hasattr(results[0], "gated")
+        _RM = RepoMetadata
+        
+        return [
+            _RM(
+                repo_id=model.id,
+                platform="huggingface",
+                repo_type="model",
+                author=author,
+                name=name,
+                downloads=model.downloads or 0,
+                likes=model.likes or 0,
+                tags=list(model.tags) if model.tags else [],
+                private=model.private if has_private else False,
+                gated=model.gated if has_gated else False,
+            )
+            for model in results
+            for author, name in (_split_repo_id(model.id),)
+        ]
     
     def whoami(self) -> Optional[Dict]:
-        """Get current user info (if authenticated)."""
+        """Get current user info (if authenticated), cached for WHOAMI_CACHE_TTL."""
+        now = time.monotonic()
+        cached = self._whoami_cache
+        if cached is not None and cached[1] == self.token and now - cached[0] < WHOAMI_CACHE_TTL:
+            return cached[2]
+        
         try:
-            return self.api.whoami()
+            result = self.api.whoami()
         except Exception:
-            return None
+            result = None
+        self._whoami_cache = (now, self.token, result)
+        return result
+    
+    def invalidate_auth(self) -> None:
+        """Forget the cached whoami() result, e.g. after login or logout."""
+        self._whoami_cache = None
     
     def is_authenticated(self) -> bool:
         """Check if client is authenticated."""
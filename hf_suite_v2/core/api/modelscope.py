@@ -2,19 +2,42 @@
 ModelScope API wrapper.
 """
 
+import atexit
 import logging
 import os
-from typing import Dict, List, Optional
+import threading
+from operator import attrgetter
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 from .base import (
-    BaseAPI, RepoFile, RepoMetadata,
+    BaseAPI, RepoFile, RepoMetadata, _split_repo_id,
     APIError, AuthenticationError, NotFoundError
 )
 
+if TYPE_CHECKING:
+    from modelscope.hub.api import HubApi
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_ENDPOINT = "https://modelscope.cn"
 
+# HubApi clients shared by all instances with the same endpoint and token,
+# keyed by BaseAPI._client_key()
+_HUBAPI_CACHE: Dict[str, "HubApi"] = {}
+_HUBAPI_LOCK = threading.Lock()
+
+
+def _close_clients() -> None:
+    """Drop shared clients and close their HTTP sessions."""
+    for api in _HUBAPI_CACHE.values():
+        session = getattr(api, "session", None)
+        if session is not None:
+            session.close()
+    _HUBAPI_CACHE.clear()
+
+
+atexit.register(_close_clients)
+
 
 class ModelScopeAPI(BaseAPI):
     """
@@ -48,28 +71,35 @@ class ModelScopeAPI(BaseAPI):
     
     @property
     def api(self):
-        """Lazy-load ModelScope HubApi."""
+        """Lazy-load the shared ModelScope HubApi for this endpoint and token."""
         if self._api is None:
-            try:
-                from modelscope.hub.api import HubApi
-                self._api = HubApi()
-                if self.token:
-                    self._api.login(self.token)
-            except ImportError:
-                raise APIError("modelscope package not installed. Run: pip install modelscope")
+            key = self._client_key()
+            with _HUBAPI_LOCK:
+                api = _HUBAPI_CACHE.get(key)
+                if api is None:
+                    try:
+                        from modelscope.hub.api import HubApi
+                    except ImportError:
+                        raise APIError("modelscope package not installed. Run: pip install modelscope")
+                    api = HubApi()
+                    if self.token:
+                        api.login(self.token)
+                    _HUBAPI_CACHE[key] = api
+            self._api = api
         return self._api
     
     def get_repo_info(self, repo_id: str, repo_type: str = "model") -> RepoMetadata:
         """Get repository metadata from ModelScope."""
         try:
             model_info = self.api.get_model(repo_id)
+            author, name = _split_repo_id(repo_id)
             
             return RepoMetadata(
                 repo_id=repo_id,
                 platform="modelscope",
                 repo_type=repo_type,
-                author=repo_id.split("/")[0] if "/" in repo_id else "",
-                name=repo_id.split("/")[-1],
+                author=author,
+                name=name,
                 description=model_info.get("Description", ""),
                 downloads=model_info.get("Downloads", 0),
                 likes=model_info.get("Likes", 0),
@@ -78,14 +108,22 @@ class ModelScopeAPI(BaseAPI):
             )
             
         except Exception as e:
-            error_str = str(e).lower()
-            
-            if "401" in error_str or "unauthorized" in error_str:
-                raise AuthenticationError(f"Authentication required for {repo_id}")
-            elif "404" in error_str or "not found" in error_str:
-                raise NotFoundError(f"Repository not found: {repo_id}")
-            
-            raise APIError(f"Failed to get repo info: {e}")
+            # modelscope raises requests' HTTPError for HTTP failures; fall
+            # back to the message for its own exception types
+            status_code = getattr(getattr(e, "response", None), "status_code", None)
+            if status_code is None:
+                error_str = str(e).lower()
+                if "401" in error_str or "unauthorized" in error_str:
+                    status_code = 401
+                elif "404" in error_str or "not found" in error_str:
+                    status_code = 404
+            
+            if status_code == 401:
+                raise AuthenticationError(f"Authentication required for {repo_id}", status_code=401)
+            elif status_code == 404:
+                raise NotFoundError(f"Repository not found: {repo_id}", status_code=404)
+            
+            raise APIError(f"Failed to get repo info: {e}", status_code=status_code)
     
     def list_files(self, repo_id: str, repo_type: str = "model") -> List[RepoFile]:
         """List files in a ModelScope repository."""
@@ -108,7 +146,8 @@ class ModelScopeAPI(BaseAPI):
                         size=size,
                     ))
             
-            return sorted(files, key=lambda f: f.path)
+            files.sort(key=attrgetter("path"))
+            return files
             
         except Exception as e:
             raise APIError(f"Failed to list files: {e}")
@@ -169,32 +208,38 @@ class ModelScopeAPI(BaseAPI):
     ) -> List[RepoMetadata]:
         """Search ModelScope models."""
         try:
-            # ModelScope search API
-            results = self.api.list_models(
-                query=query,
-                page_size=limit,
-            )
-            
-            models = []
-            for model in results.get("Data", {}).get("Models", []):
-                models.append(RepoMetadata(
-                    repo_id=model.get("Name", ""),
-                    platform="modelscope",
-                    repo_type="model",
-                    author=model.get("Name", "").split("/")[0] if "/" in model.get("Name", "") else "",
-                    name=model.get("Name", "").split("/")[-1],
-                    description=model.get("Description", ""),
-                    downloads=model.get("Downloads", 0),
-                    likes=model.get("Likes", 0),
-                    tags=model.get("Tags", []),
-                ))
-            
-            return models
+            return list(self._search_page(query, limit, lambda n: self._search_models(query, n))[:limit])
             
         except Exception as e:
             logger.warning(f"ModelScope search failed: {e}")
             return []
     
+    def _search_models(self, query: str, limit: int) -> List[RepoMetadata]:
+        """Request one page of search results."""
+        # ModelScope search API
+        results = self.api.list_models(
+            query=query,
+            page_size=limit,
+        )
+        
+        _RM = RepoMetadata
+        return [
+            _RM(
+                repo_id=repo_id,
+                platform="modelscope",
+                repo_type="model",
+                author=author,
+                name=name,
+                description=model.get("Description", ""),
+                downloads=model.get("Downloads", 0),
+                likes=model.get("Likes", 0),
+                tags=model.get("Tags", []),
+            )
+            for model in results.get("Data", {}).get("Models", [])
+            for repo_id in (model.get("Name", ""),)
+            for author, name in (_split_repo_id(repo_id),)
+        ]
+    
     def is_authenticated(self) -> bool:
         """Check if client is authenticated."""
         try:
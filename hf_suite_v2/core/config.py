@@ -2,21 +2,72 @@
 Configuration management with validation.
 """
 
+import atexit
+import hashlib
 import json
 import os
 import logging
+import threading
+from collections import deque
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Optional, Dict, Any, List
-from pydantic import BaseModel, Field, ConfigDict
+from typing import Optional, Deque, Dict, Any, List
+from pydantic import BaseModel, Field, ConfigDict, PrivateAttr, field_serializer, field_validator
+from pydantic.dataclasses import dataclass
 
-from .constants import APP_DATA_DIR, DEFAULT_MAX_WORKERS, PLATFORMS
+from .constants import APP_DATA_DIR, DEFAULT_MAX_WORKERS, PLATFORMS, ensure_app_dirs
+
+try:
+    import orjson
+except ImportError:  # Optional: the stdlib json module is used instead
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 CONFIG_FILE = APP_DATA_DIR / "config.json"
 
+RECENT_REPOS_LIMIT = 20
+
+# Changes made through update()/add_recent_repo() are written this long
+# after the last one, so a burst of changes costs a single write
+SAVE_DEBOUNCE_SECONDS = 0.5
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize config data to JSON bytes, indented for hand editing."""
+    if orjson is not None:
+        return orjson.dumps(
+            data, default=str, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2
+        )
+    return json.dumps(data, indent=2, default=str).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Any:
+    """Deserialize JSON bytes."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# Configs with a scheduled save, flushed at exit (id -> Config)
+_pending_saves: Dict[int, "Config"] = {}
+
+
+def _flush_pending_saves() -> None:
+    for config in list(_pending_saves.values()):
+        config.flush_save()
+
+
+atexit.register(_flush_pending_saves)
+
+
+# The settings groups are slotted pydantic dataclasses: values are still
+# validated when a config is loaded or built, but reads such as
+# config.download.max_workers are plain slot lookups
 
-class DownloadSettings(BaseModel):
+@dataclass(slots=True)
+class DownloadSettings:
     """Download-related settings."""
     max_workers: int = Field(default=DEFAULT_MAX_WORKERS, ge=1, le=8)
     bandwidth_limit: Optional[int] = None  # bytes/sec, None = unlimited
@@ -28,17 +79,19 @@ class DownloadSettings(BaseModel):
     auto_cleanup_cache: bool = True
 
 
-class NetworkSettings(BaseModel):
+@dataclass(slots=True)
+class NetworkSettings:
     """Network-related settings."""
     use_proxy: bool = False
     proxy_url: Optional[str] = None
     timeout: int = 300  # seconds
-    hf_endpoint: str = PLATFORMS["huggingface"]["default_endpoint"]
+    hf_endpoint: str = PLATFORMS["huggingface"].default_endpoint
     use_hf_mirror: bool = False
-    ms_endpoint: str = PLATFORMS["modelscope"]["default_endpoint"]
+    ms_endpoint: str = PLATFORMS["modelscope"].default_endpoint
 
 
-class UISettings(BaseModel):
+@dataclass(slots=True)
+class UISettings:
     """UI-related settings."""
     theme: str = "dark"  # 'dark', 'light', 'system'
     font_size: int = 12
@@ -55,7 +108,8 @@ class UISettings(BaseModel):
     close_to_tray: bool = False  # Close to tray instead of quitting
 
 
-class PathSettings(BaseModel):
+@dataclass(slots=True)
+class PathSettings:
     """Path-related settings."""
     default_save_path: str = ""
     comfy_root: str = ""
@@ -75,19 +129,41 @@ class Config(BaseModel):
     # Simple key-value settings
     first_run: bool = True
     last_tab: int = 0
-    recent_repos: List[str] = Field(default_factory=list, max_length=20)
+    recent_repos: Deque[str] = Field(default_factory=lambda: deque(maxlen=RECENT_REPOS_LIMIT))
     
     model_config = ConfigDict(extra="allow")  # Allow additional fields
     
+    _save_timer: Optional[threading.Timer] = PrivateAttr(default=None)
+    _save_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    # Held while recent_repos is changed or the config is snapshotted, so a
+    # debounced save on the timer thread never iterates a deque mid-update
+    _state_lock: threading.RLock = PrivateAttr(default_factory=threading.RLock)
+    # Set by retire() once another instance owns the config file
+    _retired: bool = PrivateAttr(default=False)
+    # (path, digest) of the last payload written, to skip unchanged saves
+    _last_saved: Optional[tuple] = PrivateAttr(default=None)
+    
+    @field_validator("recent_repos", mode="after")
+    @classmethod
+    def _bound_recent_repos(cls, value: Deque[str]) -> Deque[str]:
+        # Most recent first, so keep the head of longer lists
+        return deque(islice(value, RECENT_REPOS_LIMIT), maxlen=RECENT_REPOS_LIMIT)
+    
+    @field_serializer("recent_repos")
+    def _serialize_recent_repos(self, value: Deque[str]) -> List[str]:
+        return list(value)
+    
     @classmethod
     def load(cls, path: Path = None) -> "Config":
         """Load config from file, creating defaults if needed."""
         config_path = path or CONFIG_FILE
+        if path is None:
+            ensure_app_dirs()
         
         if config_path.exists():
             try:
-                with open(config_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+                with open(config_path, "rb") as f:
+                    data = _loads(f.read())
                 logger.info(f"Loaded config from {config_path}")
                 return cls(**data)
             except Exception as e:
@@ -101,63 +177,121 @@ class Config(BaseModel):
     def save(self, path: Path = None) -> None:
         """Save config to file."""
         config_path = path or CONFIG_FILE
+        if path is None:
+            ensure_app_dirs()
         
+        # Written to a temp file and renamed so a crash never leaves a
+        # truncated config behind
+        tmp_path = config_path.with_name(config_path.name + ".tmp")
         try:
+            with self._state_lock:
+                data = self.model_dump(mode="json")
+            payload = _dumps(data)
+            saved = (config_path, hashlib.blake2b(payload, digest_size=16).digest())
+            if saved == self._last_saved:
+                return
+            
             config_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(config_path, "w", encoding="utf-8") as f:
-                json.dump(self.model_dump(), f, indent=2, default=str)
+            with self._save_lock:
+                if self._retired:
+                    return
+                with open(tmp_path, "wb") as f:
+                    f.write(payload)
+                os.replace(tmp_path, config_path)
+                self._last_saved = saved
             logger.debug(f"Saved config to {config_path}")
         except Exception as e:
             logger.error(f"Failed to save config: {e}")
     
+    def save_later(self) -> None:
+        """Schedule a save, coalescing calls within SAVE_DEBOUNCE_SECONDS."""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            timer = threading.Timer(SAVE_DEBOUNCE_SECONDS, self.flush_save)
+            timer.daemon = True
+            self._save_timer = timer
+            _pending_saves[id(self)] = self
+            timer.start()
+    
+    def flush_save(self) -> None:
+        """Write a save scheduled by save_later() now, if one is pending."""
+        with self._save_lock:
+            timer, self._save_timer = self._save_timer, None
+            _pending_saves.pop(id(self), None)
+        if timer is None:
+            return
+        timer.cancel()
+        self.save()
+    
+    def retire(self) -> None:
+        """
+        Stop this instance from writing the config file again.
+        
+        A pending save is cancelled, and one already running finishes
+        before this returns.
+        """
+        with self._save_lock:
+            timer, self._save_timer = self._save_timer, None
+            _pending_saves.pop(id(self), None)
+            self._retired = True
+        if timer is not None:
+            timer.cancel()
+    
     def update(self, **kwargs) -> None:
         """Update config values and save."""
-        for key, value in kwargs.items():
-            if hasattr(self, key):
-                setattr(self, key, value)
-            elif "." in key:
-                # Handle nested keys like "download.max_workers"
-                parts = key.split(".")
-                obj = self
-                for part in parts[:-1]:
-                    obj = getattr(obj, part)
-                setattr(obj, parts[-1], value)
-        self.save()
+        with self._state_lock:
+            for key, value in kwargs.items():
+                if hasattr(self, key):
+                    setattr(self, key, value)
+                elif "." in key:
+                    # Handle nested keys like "download.max_workers"
+                    parts = key.split(".")
+                    obj = self
+                    for part in parts[:-1]:
+                        obj = getattr(obj, part)
+                    setattr(obj, parts[-1], value)
+        self.save_later()
     
     def add_recent_repo(self, repo_id: str) -> None:
         """Add repo to recent list (most recent first)."""
-        if repo_id in self.recent_repos:
-            self.recent_repos.remove(repo_id)
-        self.recent_repos.insert(0, repo_id)
-        self.recent_repos = self.recent_repos[:20]  # Keep last 20
-        self.save()
+        with self._state_lock:
+            if not isinstance(self.recent_repos, deque):
+                # Plain assignment bypasses validation
+                self.recent_repos = self._bound_recent_repos(self.recent_repos)
+            try:
+                self.recent_repos.remove(repo_id)
+            except ValueError:
+                pass
+            # maxlen drops the oldest entry
+            self.recent_repos.appendleft(repo_id)
+        self.save_later()
     
     def get_effective_endpoint(self, platform: str) -> str:
         """Get the effective endpoint URL for a platform."""
         if platform == "huggingface":
             if self.network.use_hf_mirror:
-                return PLATFORMS["huggingface"]["mirror_endpoint"]
+                return PLATFORMS["huggingface"].mirror_endpoint
             return self.network.hf_endpoint
         elif platform == "modelscope":
             return self.network.ms_endpoint
-        return PLATFORMS.get(platform, {}).get("default_endpoint", "")
-
-
-# Global config instance
-_config_instance: Optional[Config] = None
+        info = PLATFORMS.get(platform)
+        return info.default_endpoint if info else ""
 
 
+@lru_cache(maxsize=1)
 def get_config() -> Config:
     """Get the global config instance."""
-    global _config_instance
-    if _config_instance is None:
-        _config_instance = Config.load()
-    return _config_instance
+    return Config.load()
 
 
 def reset_config() -> Config:
     """Reset config to defaults."""
-    global _config_instance
-    _config_instance = Config()
-    _config_instance.save()
-    return _config_instance
+    # A debounced save of a replaced instance must not land on the reset file
+    for config in list(_pending_saves.values()):
+        config.retire()
+    if get_config.cache_info().currsize:
+        get_config().retire()
+    Config().save()
+    get_config.cache_clear()
+    return get_config()
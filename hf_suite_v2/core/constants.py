@@ -2,7 +2,10 @@
 Application constants and default values.
 """
 
+from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
+from typing import Optional, Tuple
 import os
 
 # Application info
@@ -17,34 +20,69 @@ DATABASE_PATH = APP_DATA_DIR / "suite.db"
 LOGS_DIR = APP_DATA_DIR / "logs"
 CACHE_DIR = APP_DATA_DIR / "cache"
 
-# Ensure directories exist
-APP_DATA_DIR.mkdir(parents=True, exist_ok=True)
-LOGS_DIR.mkdir(parents=True, exist_ok=True)
-CACHE_DIR.mkdir(parents=True, exist_ok=True)
-
-# Platform configurations
-PLATFORMS = {
-    "huggingface": {
-        "name": "Hugging Face",
-        "icon": "huggingface_logo.png",
-        "default_endpoint": "https://huggingface.co",
-        "mirror_endpoint": "https://hf-mirror.com",
-        "token_env": "HF_TOKEN",
-        "models_url": "https://huggingface.co/models",
-        "datasets_url": "https://huggingface.co/datasets",
-        "token_url": "https://huggingface.co/settings/tokens",
-    },
-    "modelscope": {
-        "name": "ModelScope",
-        "icon": "modelscope_logo.png",
-        "default_endpoint": "https://modelscope.cn",
-        "mirror_endpoint": "https://modelscope.cn",
-        "token_env": "MODELSCOPE_API_TOKEN",
-        "models_url": "https://modelscope.cn/models",
-        "datasets_url": "https://modelscope.cn/datasets",
-        "token_url": "https://modelscope.cn/my/myaccesstoken",
-    },
-}
+_dirs_ready = False
+
+
+def ensure_app_dirs() -> None:
+    """
+    Create the application directories on first use.
+    
+    Called by code that writes into them rather than at import, so
+    importing the package never touches the filesystem.
+    """
+    global _dirs_ready
+    if _dirs_ready:
+        return
+    APP_DATA_DIR.mkdir(parents=True, exist_ok=True)
+    LOGS_DIR.mkdir(parents=True, exist_ok=True)
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    _dirs_ready = True
+
+
+@dataclass(frozen=True, slots=True)
+class PlatformInfo:
+    """Static description of a model hub."""
+    name: str
+    icon: str
+    default_endpoint: str
+    mirror_endpoint: str
+    token_env: str
+    models_url: str
+    datasets_url: str
+    token_url: str
+
+
+@dataclass(frozen=True, slots=True)
+class FileCategory:
+    """A group of repository files shown as one filter option."""
+    label: str
+    extensions: Tuple[str, ...]
+    patterns: Tuple[str, ...]
+
+
+# Platform configurations (read-only)
+PLATFORMS = MappingProxyType({
+    "huggingface": PlatformInfo(
+        name="Hugging Face",
+        icon="huggingface_logo.png",
+        default_endpoint="https://huggingface.co",
+        mirror_endpoint="https://hf-mirror.com",
+        token_env="HF_TOKEN",
+        models_url="https://huggingface.co/models",
+        datasets_url="https://huggingface.co/datasets",
+        token_url="https://huggingface.co/settings/tokens",
+    ),
+    "modelscope": PlatformInfo(
+        name="ModelScope",
+        icon="modelscope_logo.png",
+        default_endpoint="https://modelscope.cn",
+        mirror_endpoint="https://modelscope.cn",
+        token_env="MODELSCOPE_API_TOKEN",
+        models_url="https://modelscope.cn/models",
+        datasets_url="https://modelscope.cn/datasets",
+        token_url="https://modelscope.cn/my/myaccesstoken",
+    ),
+})
 
 # Download settings
 DEFAULT_MAX_WORKERS = 3
@@ -55,38 +93,38 @@ DEFAULT_CHUNK_SIZE = 8192  # bytes
 DEFAULT_TIMEOUT = 300  # seconds
 
 # File type categories for filtering
-FILE_CATEGORIES = {
-    "checkpoints": {
-        "label": "Checkpoints",
-        "extensions": [".safetensors", ".ckpt", ".pt", ".pth", ".bin"],
-        "patterns": ["**/checkpoint*", "**/model*"],
-    },
-    "lora": {
-        "label": "LoRA",
-        "extensions": [".safetensors", ".pt"],
-        "patterns": ["**/lora*", "**/adapter*"],
-    },
-    "vae": {
-        "label": "VAE",
-        "extensions": [".safetensors", ".pt", ".ckpt"],
-        "patterns": ["**/vae*"],
-    },
-    "controlnet": {
-        "label": "ControlNet",
-        "extensions": [".safetensors", ".pth"],
-        "patterns": ["**/controlnet*", "**/control*"],
-    },
-    "gguf": {
-        "label": "GGUF (Quantized)",
-        "extensions": [".gguf"],
-        "patterns": ["**/*.gguf"],
-    },
-    "config": {
-        "label": "Config Files",
-        "extensions": [".json", ".yaml", ".yml", ".txt"],
-        "patterns": ["**/config*", "**/tokenizer*"],
-    },
-}
+FILE_CATEGORIES = MappingProxyType({
+    "checkpoints": FileCategory(
+        label="Checkpoints",
+        extensions=(".safetensors", ".ckpt", ".pt", ".pth", ".bin"),
+        patterns=("**/checkpoint*", "**/model*"),
+    ),
+    "lora": FileCategory(
+        label="LoRA",
+        extensions=(".safetensors", ".pt"),
+        patterns=("**/lora*", "**/adapter*"),
+    ),
+    "vae": FileCategory(
+        label="VAE",
+        extensions=(".safetensors", ".pt", ".ckpt"),
+        patterns=("**/vae*",),
+    ),
+    "controlnet": FileCategory(
+        label="ControlNet",
+        extensions=(".safetensors", ".pth"),
+        patterns=("**/controlnet*", "**/control*"),
+    ),
+    "gguf": FileCategory(
+        label="GGUF (Quantized)",
+        extensions=(".gguf",),
+        patterns=("**/*.gguf",),
+    ),
+    "config": FileCategory(
+        label="Config Files",
+        extensions=(".json", ".yaml", ".yml", ".txt"),
+        patterns=("**/config*", "**/tokenizer*"),
+    ),
+})
 
 # Ignore patterns (files to skip by default)
 DEFAULT_IGNORE_PATTERNS = [
@@ -100,6 +138,21 @@ DEFAULT_IGNORE_PATTERNS = [
     "*.pyc",
 ]
 
+
+# Extension -> first category (in FILE_CATEGORIES order) that lists it
+FILE_EXTENSION_CATEGORY = {}
+for _key, _info in FILE_CATEGORIES.items():
+    for _ext in _info.extensions:
+        FILE_EXTENSION_CATEGORY.setdefault(_ext, _key)
+del _key, _info, _ext
+
+
+def file_category(path: str) -> Optional[str]:
+    """Category key of a repo file, from FILE_EXTENSION_CATEGORY, or None."""
+    dot = path.rfind(".")
+    return FILE_EXTENSION_CATEGORY.get(path[dot:].lower()) if dot >= 0 else None
+
+
 # UI Constants
 WINDOW_MIN_WIDTH = 1000
 WINDOW_MIN_HEIGHT = 700
@@ -141,4 +194,4 @@ MODEL_TYPES = [
 ]
 
 # List of platform keys for iteration
-PLATFORM_KEYS = list(PLATFORMS.keys())
+PLATFORM_KEYS = tuple(PLATFORMS)
@@ -2,22 +2,91 @@
 SQLite database layer using SQLAlchemy.
 """
 
+import atexit
 import logging
-from datetime import datetime
+import queue
+import sqlite3
+import threading
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from contextlib import contextmanager
+from functools import lru_cache
+from itertools import groupby
+from operator import attrgetter
 
-from sqlalchemy import create_engine, Column, Integer, String, Boolean, DateTime, Float, Text, ForeignKey, Index
-from sqlalchemy.orm import declarative_base, sessionmaker, Session, relationship
+from sqlalchemy import create_engine, event, func, insert, select, text, Column, Integer, String, Boolean, DateTime, Float, Text, ForeignKey, Index
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import declarative_base, scoped_session, sessionmaker, Session, relationship
 from sqlalchemy.pool import StaticPool
 
-from .constants import DATABASE_PATH
+from .constants import DATABASE_PATH, ensure_app_dirs
 
 logger = logging.getLogger(__name__)
 
 Base = declarative_base()
 
+# Applied to every new SQLite connection. WAL lets the UI read while the
+# download manager writes progress, and with synchronous=NORMAL commits
+# no longer fsync; cache_size is in KiB when negative
+SQLITE_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA busy_timeout=30000",
+)
+# Only meaningful for file-backed databases
+SQLITE_FILE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA mmap_size=268435456",
+    # Checkpoint automatically once the WAL reaches this many pages
+    "PRAGMA wal_autocheckpoint=1000",
+)
+
+WAL_CHECKPOINT_MODES = ("PASSIVE", "FULL", "RESTART", "TRUNCATE")
+
+# INSERT ... RETURNING needs SQLite 3.35; older builds (e.g. Ubuntu 20.04,
+# RHEL 8) read new ids back through lastrowid or a select instead
+SQLITE_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35)
+
+UPDATE_PROGRESS_SQL = (
+    "UPDATE downloads SET downloaded_bytes = ?, total_bytes = ?, speed_bps = ? WHERE id = ?"
+)
+
+UPSERT_SETTING_SQL = (
+    "INSERT INTO settings (key, value) VALUES (?, ?) "
+    "ON CONFLICT(key) DO UPDATE SET value = excluded.value, "
+    "updated_at = datetime('now', 'localtime')"
+)
+
+# Seconds between writes of queued set_setting() calls by the settings
+# writer thread; reads are always served from memory
+SETTINGS_FLUSH_INTERVAL = 1.0
+
+# Indexes superseded by composite ones, dropped from existing databases
+OBSOLETE_INDEXES = ("idx_downloads_status",)
+
+# Rows per INSERT statement in add_local_models(), which keeps bound
+# parameters well under SQLite's variable limit
+LOCAL_MODELS_UPSERT_CHUNK = 500
+
+# Timestamp columns are filled in by SQLite rather than per row in Python.
+# Local time, like the datetime.now() values older versions wrote;
+# CURRENT_TIMESTAMP would be UTC
+LOCAL_TIMESTAMP_SQL = "datetime('now', 'localtime')"
+LOCAL_TIMESTAMP = text(f"({LOCAL_TIMESTAMP_SQL})")
+
+
+def _set_sqlite_pragmas(dbapi_connection, in_memory: bool) -> None:
+    """Apply SQLITE_PRAGMAS (and SQLITE_FILE_PRAGMAS) to a raw connection."""
+    pragmas = SQLITE_PRAGMAS if in_memory else SQLITE_FILE_PRAGMAS + SQLITE_PRAGMAS
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in pragmas:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
 
 # SQLAlchemy Models
 
@@ -40,14 +109,16 @@ class DownloadTable(Base):
     error_message = Column(Text)
     started_at = Column(DateTime)
     completed_at = Column(DateTime)
-    created_at = Column(DateTime, default=datetime.now)
+    created_at = Column(DateTime, server_default=LOCAL_TIMESTAMP)
     profile_id = Column(Integer, ForeignKey("profiles.id"))
     
     files = relationship("DownloadFileTable", back_populates="download", cascade="all, delete-orphan")
     
     __table_args__ = (
-        Index("idx_downloads_status", "status"),
+        # Serves status filters and get_pending_downloads()' ORDER BY priority
+        Index("idx_downloads_status_priority", "status", "priority"),
         Index("idx_downloads_platform", "platform"),
+        Index("idx_downloads_profile", "profile_id"),
     )
 
 
@@ -78,7 +149,7 @@ class HistoryTable(Base):
     save_path = Column(String, nullable=False)
     total_bytes = Column(Integer)
     duration_seconds = Column(Integer)
-    completed_at = Column(DateTime, default=datetime.now)
+    completed_at = Column(DateTime, server_default=LOCAL_TIMESTAMP)
     is_favorite = Column(Boolean, default=False)
     tags = Column(Text)  # JSON array
     
@@ -99,7 +170,7 @@ class ProfileTable(Base):
     default_path = Column(String)
     token_id = Column(Integer, ForeignKey("tokens.id"))
     file_filters = Column(Text)  # JSON array
-    created_at = Column(DateTime, default=datetime.now)
+    created_at = Column(DateTime, server_default=LOCAL_TIMESTAMP)
 
 
 class TokenTable(Base):
@@ -124,7 +195,7 @@ class LocationTable(Base):
     path = Column(String, nullable=False)
     tool_type = Column(String)
     model_type = Column(String)
-    created_at = Column(DateTime, default=datetime.now)
+    created_at = Column(DateTime, server_default=LOCAL_TIMESTAMP)
 
 
 class LocalModelTable(Base):
@@ -139,7 +210,7 @@ class LocalModelTable(Base):
     model_type = Column(String)
     source_repo = Column(String)
     source_platform = Column(String)
-    scanned_at = Column(DateTime, default=datetime.now)
+    scanned_at = Column(DateTime, server_default=LOCAL_TIMESTAMP)
     metadata_json = Column(Text)
     
     __table_args__ = (
@@ -154,7 +225,7 @@ class SettingsTable(Base):
     
     key = Column(String, primary_key=True)
     value = Column(Text)
-    updated_at = Column(DateTime, default=datetime.now)
+    updated_at = Column(DateTime, server_default=LOCAL_TIMESTAMP)
 
 
 class Database:
@@ -172,24 +243,144 @@ class Database:
         if self._initialized:
             return
             
+        if db_path is None:
+            ensure_app_dirs()
         self.db_path = db_path or DATABASE_PATH
+        in_memory = str(self.db_path) == ":memory:"
+        # File databases use SQLAlchemy's default pool, so each thread's
+        # session runs its own transaction on its own connection. An
+        # in-memory database only exists on the connection that created it
+        pool_args = {"poolclass": StaticPool} if in_memory else {}
         self.engine = create_engine(
             f"sqlite:///{self.db_path}",
             connect_args={"check_same_thread": False},
-            poolclass=StaticPool,
-            echo=False
+            echo=False,
+            **pool_args
+        )
+        event.listen(
+            self.engine, "connect",
+            lambda dbapi_connection, _record: _set_sqlite_pragmas(dbapi_connection, in_memory),
         )
         
         # Create tables
         Base.metadata.create_all(self.engine)
+        self._migrate_indexes()
+        self._migrate_timestamp_defaults()
+        
+        # One session per thread, reused across calls, each checking out
+        # its own pooled connection per transaction (all sessions share the
+        # one connection of an in-memory database). Objects keep their
+        # loaded values after commit instead of reloading on access
+        self.SessionLocal = scoped_session(sessionmaker(bind=self.engine, expire_on_commit=False))
+        # Settings and profiles change rarely and are kept in memory. The
+        # settings table is loaded whole here and set_setting() writes
+        # through a background thread; profiles load on first use
+        self._cache_lock = threading.Lock()
+        
+        # Progress and settings writes bypass SQLAlchemy (see
+        # bulk_update_progress()) on a sqlite3 connection of their own, so
+        # their commits never take in a session's open transaction. An
+        # in-memory database only exists on the pool's single connection,
+        # which then has to be shared
+        self._owns_raw_conn = not in_memory
+        if self._owns_raw_conn:
+            self._raw_conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            _set_sqlite_pragmas(self._raw_conn, in_memory)
+        else:
+            self._raw_conn = self.engine.raw_connection().driver_connection
+        self._raw_lock = threading.Lock()
+        self._settings_cache: Dict[str, str] = dict(
+            self._fetch_rows(select(SettingsTable.key, SettingsTable.value))
+        )
+        self._profile_cache: Optional[Dict[int, Row]] = None
+        
+        self._settings_queue: "queue.SimpleQueue[Tuple[str, str]]" = queue.SimpleQueue()
+        self._settings_stop = threading.Event()
+        self._settings_writer = threading.Thread(
+            target=self._run_settings_writer, name="SettingsWriter", daemon=True
+        )
+        self._settings_writer.start()
         
-        self.SessionLocal = sessionmaker(bind=self.engine)
         self._initialized = True
+        atexit.register(self.close)
         logger.info(f"Database initialized at {self.db_path}")
     
+    def _migrate_indexes(self) -> None:
+        """Bring indexes of tables created by older versions up to date."""
+        # create_all() only adds indexes along with a new table
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(self.engine, checkfirst=True)
+        with self.engine.begin() as conn:
+            for name in OBSOLETE_INDEXES:
+                conn.exec_driver_sql(f"DROP INDEX IF EXISTS {name}")
+    
+    def _migrate_timestamp_defaults(self) -> None:
+        """
+        Fill timestamp columns of tables created by older versions.
+        
+        Those tables have no SQL default, which SQLite cannot add to an
+        existing column, so an AFTER INSERT trigger sets the value instead.
+        """
+        with self.engine.begin() as conn:
+            for table in Base.metadata.sorted_tables:
+                columns = [
+                    c.name for c in table.columns
+                    if c.server_default is not None and c.server_default.arg is LOCAL_TIMESTAMP
+                ]
+                if not columns:
+                    continue
+                defaults = {
+                    row[1]: row[4]
+                    for row in conn.exec_driver_sql(f"PRAGMA table_info({table.name})")
+                }
+                for column in columns:
+                    if defaults.get(column) is not None:
+                        continue
+                    conn.exec_driver_sql(
+                        f"CREATE TRIGGER IF NOT EXISTS trg_{table.name}_{column} "
+                        f"AFTER INSERT ON {table.name} WHEN NEW.{column} IS NULL BEGIN "
+                        f"UPDATE {table.name} SET {column} = {LOCAL_TIMESTAMP_SQL} "
+                        f"WHERE rowid = NEW.rowid; END"
+                    )
+    
+    def checkpoint(self, mode: str = "PASSIVE") -> Optional[tuple]:
+        """
+        Copy WAL content back into the database file.
+        
+        Args:
+            mode: PASSIVE (never waits on readers or writers), FULL,
+                RESTART or TRUNCATE (also empties the WAL file)
+            
+        Returns:
+            (busy, WAL pages, pages checkpointed) as reported by SQLite
+        """
+        mode = mode.upper()
+        if mode not in WAL_CHECKPOINT_MODES:
+            raise ValueError(f"Invalid checkpoint mode: {mode}")
+        with self._raw_lock:
+            return self._raw_conn.execute(f"PRAGMA wal_checkpoint({mode})").fetchone()
+    
+    def close(self) -> None:
+        """Write queued settings and checkpoint the WAL, then release connections."""
+        self._settings_stop.set()
+        if self._settings_writer is not threading.current_thread():
+            self._settings_writer.join()
+        try:
+            self.flush_settings()
+            self.checkpoint("TRUNCATE")
+            with self.engine.connect() as conn:
+                conn.exec_driver_sql("PRAGMA optimize")
+        except Exception as e:
+            logger.debug(f"Database shutdown maintenance failed: {e}")
+        if self._owns_raw_conn:
+            with self._raw_lock:
+                self._raw_conn.close()
+        self.engine.dispose()
+    
     @contextmanager
     def session(self) -> Session:
-        """Get a database session context manager."""
+        """Get a database session context manager that commits on success."""
         session = self.SessionLocal()
         try:
             yield session
@@ -197,44 +388,83 @@ class Database:
         except Exception:
             session.rollback()
             raise
+        finally:
+            # Ends the transaction and clears the identity map; the
+            # thread's session object itself is reused
+            session.close()
+    
+    @contextmanager
+    def read_session(self) -> Session:
+        """Get a session context manager for queries that write nothing."""
+        session = self.SessionLocal()
+        try:
+            yield session
         finally:
             session.close()
     
+    def _fetch_rows(self, stmt) -> List[Row]:
+        """
+        Run a Core SELECT and return its rows.
+        
+        Used by the list getters instead of ORM queries: rows are read-only,
+        expose columns as attributes like the table classes, and skip ORM
+        instrumentation and identity-map bookkeeping.
+        """
+        with self.engine.connect() as conn:
+            return conn.execute(stmt).all()
+    
+    def _raw_executemany(self, sql: str, params: List[tuple]) -> None:
+        """Run a statement for each parameter tuple in one raw transaction."""
+        with self._raw_lock:
+            try:
+                self._raw_conn.executemany(sql, params)
+                self._raw_conn.commit()
+            except Exception:
+                # Don't leave a failed batch open for the next writer to commit
+                self._raw_conn.rollback()
+                raise
+    
+    def _insert(self, table, data: Dict[str, Any]) -> int:
+        """
+        Insert one row and return its primary key.
+        
+        A Core INSERT ... RETURNING: one statement, and no ORM object
+        to build and flush just to read the id back. Without RETURNING
+        support the id comes from the cursor's lastrowid.
+        """
+        stmt = insert(table).values(**data)
+        with self.session() as session:
+            if SQLITE_HAS_RETURNING:
+                return session.execute(stmt.returning(table.id)).scalar_one()
+            return session.execute(stmt).inserted_primary_key[0]
+    
     # Download operations
     
     def add_download(self, download_data: Dict[str, Any]) -> int:
         """Add a new download task."""
-        with self.session() as session:
-            download = DownloadTable(**download_data)
-            session.add(download)
-            session.flush()
-            return download.id
+        return self._insert(DownloadTable, download_data)
     
     def get_download(self, download_id: int) -> Optional[DownloadTable]:
         """Get download by ID."""
-        with self.session() as session:
+        with self.read_session() as session:
             result = session.query(DownloadTable).filter_by(id=download_id).first()
             if result:
                 session.expunge(result)
             return result
     
-    def get_downloads_by_status(self, status: str) -> List[DownloadTable]:
+    def get_downloads_by_status(self, status: str) -> List[Row]:
         """Get all downloads with given status."""
-        with self.session() as session:
-            results = session.query(DownloadTable).filter_by(status=status).all()
-            for r in results:
-                session.expunge(r)
-            return results
+        return self._fetch_rows(
+            select(DownloadTable.__table__).where(DownloadTable.status == status)
+        )
     
-    def get_pending_downloads(self) -> List[DownloadTable]:
+    def get_pending_downloads(self) -> List[Row]:
         """Get all pending/queued downloads ordered by priority."""
-        with self.session() as session:
-            results = session.query(DownloadTable).filter(
+        return self._fetch_rows(
+            select(DownloadTable.__table__).where(
                 DownloadTable.status.in_(["pending", "queued"])
-            ).order_by(DownloadTable.priority).all()
-            for r in results:
-                session.expunge(r)
-            return results
+            ).order_by(DownloadTable.priority)
+        )
     
     def update_download(self, download_id: int, **updates) -> bool:
         """Update download fields."""
@@ -242,6 +472,26 @@ class Database:
             result = session.query(DownloadTable).filter_by(id=download_id).update(updates)
             return result > 0
     
+    def bulk_update_progress(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        Update progress columns of several downloads in one transaction.
+        
+        Runs on a separate raw sqlite3 connection, bypassing SQLAlchemy,
+        since the download manager calls it every PROGRESS_FLUSH_INTERVAL.
+        
+        Args:
+            rows: Dicts with "id", "downloaded_bytes", "total_bytes"
+                and "speed_bps"
+        """
+        if not rows:
+            return
+        params = [
+            (row["downloaded_bytes"], row["total_bytes"], row["speed_bps"], row["id"])
+            for row in rows
+        ]
+        # sqlite3 keeps the compiled statement in its statement cache
+        self._raw_executemany(UPDATE_PROGRESS_SQL, params)
+    
     def delete_download(self, download_id: int) -> bool:
         """Delete a download task."""
         with self.session() as session:
@@ -252,22 +502,14 @@ class Database:
     
     def add_to_history(self, history_data: Dict[str, Any]) -> int:
         """Add completed download to history."""
-        with self.session() as session:
-            history = HistoryTable(**history_data)
-            session.add(history)
-            session.flush()
-            return history.id
+        return self._insert(HistoryTable, history_data)
     
-    def get_history(self, limit: int = 100, favorites_only: bool = False) -> List[HistoryTable]:
+    def get_history(self, limit: int = 100, favorites_only: bool = False) -> List[Row]:
         """Get download history."""
-        with self.session() as session:
-            query = session.query(HistoryTable)
-            if favorites_only:
-                query = query.filter_by(is_favorite=True)
-            results = query.order_by(HistoryTable.completed_at.desc()).limit(limit).all()
-            for r in results:
-                session.expunge(r)
-            return results
+        stmt = select(HistoryTable.__table__)
+        if favorites_only:
+            stmt = stmt.where(HistoryTable.is_favorite.is_(True))
+        return self._fetch_rows(stmt.order_by(HistoryTable.completed_at.desc()).limit(limit))
     
     def toggle_favorite(self, history_id: int) -> bool:
         """Toggle favorite status."""
@@ -282,43 +524,55 @@ class Database:
     
     def get_setting(self, key: str, default: Any = None) -> Any:
         """Get a setting value."""
-        with self.session() as session:
-            setting = session.query(SettingsTable).filter_by(key=key).first()
-            return setting.value if setting else default
+        return self._settings_cache.get(key, default)
     
     def set_setting(self, key: str, value: str) -> None:
-        """Set a setting value."""
-        with self.session() as session:
-            setting = session.query(SettingsTable).filter_by(key=key).first()
-            if setting:
-                setting.value = value
-                setting.updated_at = datetime.now()
-            else:
-                session.add(SettingsTable(key=key, value=value))
+        """
+        Set a setting value.
+        
+        The in-memory value changes immediately; the row is written by the
+        settings writer thread within SETTINGS_FLUSH_INTERVAL.
+        """
+        with self._cache_lock:
+            self._settings_cache[key] = value
+        self._settings_queue.put((key, value))
     
     def get_all_settings(self) -> Dict[str, str]:
         """Get all settings as dictionary."""
-        with self.session() as session:
-            settings = session.query(SettingsTable).all()
-            return {s.key: s.value for s in settings}
+        with self._cache_lock:
+            return dict(self._settings_cache)
+    
+    def flush_settings(self) -> None:
+        """Write settings queued by set_setting() in one transaction."""
+        pending: Dict[str, str] = {}
+        while True:
+            try:
+                key, value = self._settings_queue.get_nowait()
+            except queue.Empty:
+                break
+            # Only the last value set for a key is written
+            pending[key] = value
+        if not pending:
+            return
+        self._raw_executemany(UPSERT_SETTING_SQL, list(pending.items()))
+    
+    def _run_settings_writer(self) -> None:
+        """Settings writer thread loop, stopped by close()."""
+        while not self._settings_stop.wait(SETTINGS_FLUSH_INTERVAL):
+            try:
+                self.flush_settings()
+            except Exception as e:
+                logger.error(f"Failed to write settings: {e}")
     
     # Location operations
     
     def add_location(self, location_data: Dict[str, Any]) -> int:
         """Add a named location."""
-        with self.session() as session:
-            location = LocationTable(**location_data)
-            session.add(location)
-            session.flush()
-            return location.id
+        return self._insert(LocationTable, location_data)
     
-    def get_locations(self) -> List[LocationTable]:
+    def get_locations(self) -> List[Row]:
         """Get all named locations."""
-        with self.session() as session:
-            results = session.query(LocationTable).order_by(LocationTable.name).all()
-            for r in results:
-                session.expunge(r)
-            return results
+        return self._fetch_rows(select(LocationTable.__table__).order_by(LocationTable.name))
     
     def delete_location(self, location_id: int) -> bool:
         """Delete a location."""
@@ -330,86 +584,109 @@ class Database:
     
     def add_profile(self, profile_data: Dict[str, Any]) -> int:
         """Add a profile."""
-        with self.session() as session:
-            profile = ProfileTable(**profile_data)
-            session.add(profile)
-            session.flush()
-            return profile.id
+        profile_id = self._insert(ProfileTable, profile_data)
+        self._profile_cache = None
+        return profile_id
     
-    def get_profiles(self) -> List[ProfileTable]:
+    def get_profiles(self) -> List[Row]:
         """Get all profiles."""
-        with self.session() as session:
-            results = session.query(ProfileTable).order_by(ProfileTable.name).all()
-            for r in results:
-                session.expunge(r)
-            return results
+        return self._fetch_rows(select(ProfileTable.__table__).order_by(ProfileTable.name))
     
-    def get_profile(self, profile_id: int) -> Optional[ProfileTable]:
+    def get_profile(self, profile_id: int) -> Optional[Row]:
         """Get profile by ID."""
-        with self.session() as session:
-            result = session.query(ProfileTable).filter_by(id=profile_id).first()
-            if result:
-                session.expunge(result)
-            return result
+        profiles = self._profile_cache
+        if profiles is None:
+            profiles = self._profile_cache = {
+                row.id: row for row in self._fetch_rows(select(ProfileTable.__table__))
+            }
+        return profiles.get(profile_id)
     
     # Local model operations
     
     def add_local_model(self, model_data: Dict[str, Any]) -> int:
         """Add or update a scanned local model."""
+        return self.add_local_models([model_data])[0]
+    
+    def add_local_models(self, models_data: List[Dict[str, Any]]) -> List[int]:
+        """
+        Add or update many scanned local models in a single transaction.
+        
+        Rows are upserted on file_path with INSERT ... ON CONFLICT DO UPDATE,
+        LOCAL_MODELS_UPSERT_CHUNK rows per statement; existing rows get the
+        given columns updated in place. Ids come back through RETURNING, or
+        a select of the chunk's paths where SQLite lacks it.
+        
+        Returns:
+            Model IDs in the same order as models_data
+        """
+        if not models_data:
+            return []
+        
+        # Rows for one path collapse to the last one, as sequential updates would
+        latest = {data["file_path"]: data for data in models_data}
+        # A multi-row INSERT needs the same columns in every row
+        by_columns: Dict[tuple, List[Dict[str, Any]]] = {}
+        for data in latest.values():
+            by_columns.setdefault(tuple(sorted(data)), []).append(data)
+        
+        ids: Dict[str, int] = {}
         with self.session() as session:
-            existing = session.query(LocalModelTable).filter_by(
-                file_path=model_data["file_path"]
-            ).first()
-            
-            if existing:
-                for key, value in model_data.items():
-                    setattr(existing, key, value)
-                return existing.id
-            else:
-                model = LocalModelTable(**model_data)
-                session.add(model)
-                session.flush()
-                return model.id
-    
-    def get_local_models(self, model_type: str = None) -> List[LocalModelTable]:
+            for columns, rows in by_columns.items():
+                for start in range(0, len(rows), LOCAL_MODELS_UPSERT_CHUNK):
+                    chunk = rows[start:start + LOCAL_MODELS_UPSERT_CHUNK]
+                    stmt = sqlite_insert(LocalModelTable).values(chunk)
+                    stmt = stmt.on_conflict_do_update(
+                        index_elements=["file_path"],
+                        set_={c: stmt.excluded[c] for c in columns if c != "file_path"},
+                    )
+                    if SQLITE_HAS_RETURNING:
+                        result = session.execute(
+                            stmt.returning(LocalModelTable.id, LocalModelTable.file_path)
+                        )
+                    else:
+                        session.execute(stmt)
+                        result = session.execute(
+                            select(LocalModelTable.id, LocalModelTable.file_path).where(
+                                LocalModelTable.file_path.in_([row["file_path"] for row in chunk])
+                            )
+                        )
+                    ids.update((path, model_id) for model_id, path in result)
+        
+        return [ids[data["file_path"]] for data in models_data]
+    
+    def get_local_models(self, model_type: str = None) -> List[Row]:
         """Get local models, optionally filtered by type."""
-        with self.session() as session:
-            query = session.query(LocalModelTable)
-            if model_type:
-                query = query.filter_by(model_type=model_type)
-            results = query.order_by(LocalModelTable.file_name).all()
-            for r in results:
-                session.expunge(r)
-            return results
+        stmt = select(LocalModelTable.__table__)
+        if model_type:
+            stmt = stmt.where(LocalModelTable.model_type == model_type)
+        return self._fetch_rows(stmt.order_by(LocalModelTable.file_name))
     
     def find_duplicates(self) -> List[tuple]:
         """Find duplicate models by file hash."""
-        with self.session() as session:
-            from sqlalchemy import func
-            duplicates = session.query(
-                LocalModelTable.file_hash,
-                func.count(LocalModelTable.id).label('count')
-            ).filter(
+        with self.read_session() as session:
+            dup_hashes = select(LocalModelTable.file_hash).filter(
                 LocalModelTable.file_hash.isnot(None)
             ).group_by(
                 LocalModelTable.file_hash
             ).having(
-                func.count(LocalModelTable.id) > 1
-            ).all()
+                func.count() > 1
+            )
             
-            result = []
-            for file_hash, count in duplicates:
-                models = session.query(LocalModelTable).filter_by(file_hash=file_hash).all()
-                result.append((file_hash, models))
-            return result
+            # One query for every duplicated row, grouped here
+            models = session.query(LocalModelTable).filter(
+                LocalModelTable.file_hash.in_(dup_hashes)
+            ).order_by(LocalModelTable.file_hash, LocalModelTable.id).all()
+            for m in models:
+                session.expunge(m)
+            
+            return [
+                (file_hash, list(group))
+                for file_hash, group in groupby(models, key=attrgetter("file_hash"))
+            ]
 
 
 # Convenience functions
-_db_instance = None
-
+@lru_cache(maxsize=1)
 def get_db() -> Database:
     """Get the global database instance."""
-    global _db_instance
-    if _db_instance is None:
-        _db_instance = Database()
-    return _db_instance
+    return Database()
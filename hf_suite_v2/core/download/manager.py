@@ -2,14 +2,16 @@
 Download queue manager with worker pool.
 """
 
+import heapq
+import itertools
 import logging
 import threading
 import time
-from queue import PriorityQueue
-from typing import Optional, List, Dict, Callable
+from collections import deque
+from typing import Optional, List, Dict, Callable, Deque, Tuple
 from dataclasses import dataclass, field
 
-from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtCore import QObject, Qt, pyqtSignal
 
 from ..models import DownloadTask, DownloadStatus, ProgressInfo
 from ..database import get_db
@@ -19,14 +21,35 @@ from .worker import DownloadWorker
 
 logger = logging.getLogger(__name__)
 
+# Worker progress is kept in memory and written to the database at most
+# this often, in one transaction for all active downloads
+PROGRESS_FLUSH_INTERVAL = 1.0  # seconds
+
+# Passive WAL checkpoints keep the database's WAL file short while
+# downloads keep writing
+CHECKPOINT_INTERVAL = 300  # seconds
+
 
 @dataclass(order=True)
 class PrioritizedTask:
     """Wrapper for priority queue ordering."""
     priority: int
+    # Insertion order, so equal priorities start first-in, first-out
+    seq: int
     task: DownloadTask = field(compare=False)
 
 
+@dataclass
+class TaskSlot:
+    """A task known to the manager and the worker running it, if any."""
+    task: DownloadTask
+    # Set from the task's first start until it leaves the manager; a
+    # paused worker waits in place and keeps its task
+    worker: Optional[DownloadWorker] = None
+    # QUEUED (waiting in the heap), DOWNLOADING or PAUSED
+    state: DownloadStatus = DownloadStatus.QUEUED
+
+
 class DownloadManager(QObject):
     """
     Central download queue manager with worker pool.
@@ -58,15 +81,34 @@ class DownloadManager(QObject):
         self.max_workers = max_workers or config.download.max_workers
         self.bandwidth_limit = config.download.bandwidth_limit
         
-        self._queue: PriorityQueue[PrioritizedTask] = PriorityQueue()
-        self._workers: Dict[int, DownloadWorker] = {}  # task_id -> worker
-        self._active_tasks: Dict[int, DownloadTask] = {}
-        self._paused_tasks: Dict[int, DownloadTask] = {}
+        # task_id -> slot for every queued, downloading or paused task
+        self._slots: Dict[int, TaskSlot] = {}
         
         self._lock = threading.Lock()
+        # Heap of queued tasks; the manager thread waits on _cv until a
+        # task is queued or a worker slot frees up. Entries whose slot is
+        # gone or no longer queued (cancelled tasks) are skipped when popped
+        self._queue: List[PrioritizedTask] = []
+        self._seq = itertools.count()
+        self._cv = threading.Condition(self._lock)
+        # task_id -> latest progress columns not yet written to the database
+        self._progress_buffer: Dict[int, Dict] = {}
+        # Workers are created on demand, up to max_workers, and reused:
+        # once a task leaves its slot the worker is retired, and goes back
+        # to the idle pool when its finished signal arrives
+        self._idle_workers: Deque[DownloadWorker] = deque()
+        self._retired_workers: List[DownloadWorker] = []
+        self._last_progress_flush = 0.0
+        self._last_checkpoint = time.monotonic()
         self._running = False
         self._manager_thread: Optional[threading.Thread] = None
         
+        # Read without the lock by get_active_downloads()/get_status();
+        # rebuilt by _refresh_snapshot() whenever the state above changes
+        self._active_snapshot: Tuple[DownloadTask, ...] = ()
+        self._status_snapshot: Dict = {}
+        self._refresh_snapshot()
+        
         self.db = get_db()
         self.event_bus = EventBus()
         
@@ -77,8 +119,8 @@ class DownloadManager(QObject):
         """Restore pending downloads from database on startup."""
         try:
             pending = self.db.get_pending_downloads()
-            for download in pending:
-                task = DownloadTask(
+            restored = [
+                DownloadTask(
                     id=download.id,
                     repo_id=download.repo_id,
                     platform=download.platform,
@@ -89,7 +131,18 @@ class DownloadManager(QObject):
                     total_bytes=download.total_bytes,
                     downloaded_bytes=download.downloaded_bytes,
                 )
-                self._queue.put(PrioritizedTask(task.priority, task))
+                for download in pending
+            ]
+            # Build the heap in one pass and publish it under a single
+            # lock acquisition rather than pushing task by task
+            entries = [PrioritizedTask(task.priority, next(self._seq), task) for task in restored]
+            with self._cv:
+                for task in restored:
+                    self._slots[task.id] = TaskSlot(task)
+                self._queue.extend(entries)
+                heapq.heapify(self._queue)
+                self._refresh_snapshot()
+                self._cv.notify_all()
             
             if pending:
                 logger.info(f"Restored {len(pending)} pending downloads")
@@ -101,61 +154,118 @@ class DownloadManager(QObject):
         if self._running:
             return
         
-        self._running = True
+        with self._lock:
+            self._running = True
+            self._refresh_snapshot()
         self._manager_thread = threading.Thread(target=self._run_manager, daemon=True)
         self._manager_thread.start()
         logger.info(f"Download manager started with {self.max_workers} workers")
     
     def stop(self) -> None:
         """Stop the download manager and all workers."""
-        self._running = False
-        
         # Cancel all active downloads
-        with self._lock:
-            for task_id, worker in list(self._workers.items()):
-                worker.cancel()
-            self._workers.clear()
+        with self._cv:
+            self._running = False
+            for task_id, slot in list(self._slots.items()):
+                if slot.worker is not None:
+                    slot.worker.cancel()
+                    self._retire(self._slots.pop(task_id))
+            self._refresh_snapshot()
+            self._cv.notify_all()
         
         if self._manager_thread and self._manager_thread.is_alive():
             self._manager_thread.join(timeout=5)
         
+        self._flush_progress()
+        try:
+            self.db.checkpoint()
+        except Exception as e:
+            logger.warning(f"WAL checkpoint failed: {e}")
         logger.info("Download manager stopped")
     
     def _run_manager(self) -> None:
         """Main manager loop that assigns tasks to workers."""
         while self._running:
             try:
-                # Check if we can start more downloads
-                with self._lock:
-                    active_count = len(self._workers)
-                
-                if active_count < self.max_workers and not self._queue.empty():
-                    try:
-                        prioritized = self._queue.get_nowait()
-                        task = prioritized.task
-                        self._start_download(task)
-                    except Exception:
-                        pass
+                # Take the next task if a worker slot is free, otherwise
+                # sleep until add()/resume() or a freed slot wakes us
+                task = None
+                with self._cv:
+                    if self._queue and self._status_snapshot["active_count"] < self.max_workers:
+                        task = heapq.heappop(self._queue).task
+                        slot = self._slots.get(task.id)
+                        if slot is None or slot.task is not task or slot.state != DownloadStatus.QUEUED:
+                            task = None
+                    elif self._running:
+                        self._cv.wait(timeout=PROGRESS_FLUSH_INTERVAL)
                 
-                # Clean up completed workers
-                self._cleanup_workers()
+                if task is not None:
+                    self._start_download(task)
                 
-                time.sleep(0.5)
+                now = time.monotonic()
+                if now - self._last_progress_flush >= PROGRESS_FLUSH_INTERVAL:
+                    self._flush_progress()
+                if now - self._last_checkpoint >= CHECKPOINT_INTERVAL:
+                    self._last_checkpoint = now
+                    self.db.checkpoint()
                 
             except Exception as e:
                 logger.error(f"Manager loop error: {e}")
     
-    def _cleanup_workers(self) -> None:
-        """Remove finished workers."""
-        with self._lock:
-            finished = [
-                task_id for task_id, worker in self._workers.items()
-                if not worker.is_running()
-            ]
-            for task_id in finished:
-                del self._workers[task_id]
-                if task_id in self._active_tasks:
-                    del self._active_tasks[task_id]
+    def _on_worker_finished(self, worker: Optional[DownloadWorker] = None) -> None:
+        """
+        Handle a worker thread exiting and return the worker to the idle pool.
+        
+        QThread.finished is queued behind the worker's own completed or
+        failed signal, so those have been handled by now. A worker that
+        still holds its slot exited without either, and frees it here.
+        """
+        worker = worker if worker is not None else self.sender()
+        with self._cv:
+            if worker in self._retired_workers:
+                self._retired_workers.remove(worker)
+            else:
+                slot = self._slots.get(worker.task.id) if worker.task is not None else None
+                if slot is None or slot.worker is not worker:
+                    return
+                logger.warning(f"Download worker exited without a result: {worker.task.id}")
+                self._slots.pop(worker.task.id)
+                self._refresh_snapshot()
+                self._cv.notify()
+            worker.reset()
+            self._idle_workers.append(worker)
+    
+    def _retire(self, slot: Optional[TaskSlot]) -> None:
+        """Take the worker off a slot that is leaving. Call with _lock held."""
+        if slot is not None and slot.worker is not None:
+            self._retired_workers.append(slot.worker)
+            slot.worker = None
+    
+    def _new_worker(self) -> DownloadWorker:
+        """Create a pooled worker; its signals are connected once, here."""
+        worker = DownloadWorker()
+        # Always queued: progress is emitted from the worker thread and
+        # handled on the manager's thread
+        worker.progress.connect(self._on_worker_progress, Qt.ConnectionType.QueuedConnection)
+        worker.completed.connect(self._on_worker_completed)
+        worker.failed.connect(self._on_worker_failed)
+        worker.finished.connect(self._on_worker_finished, Qt.ConnectionType.QueuedConnection)
+        return worker
+    
+    def _refresh_snapshot(self) -> None:
+        """Rebuild the lock-free status snapshots. Call with _lock held."""
+        slots = self._slots.values()
+        # Paused workers wait in place but do not count toward max_workers
+        self._active_snapshot = tuple(
+            slot.task for slot in slots if slot.state == DownloadStatus.DOWNLOADING
+        )
+        self._status_snapshot = {
+            "running": self._running,
+            "active_count": len(self._active_snapshot),
+            "paused_count": sum(slot.state == DownloadStatus.PAUSED for slot in slots),
+            "queue_size": sum(slot.state == DownloadStatus.QUEUED for slot in slots),
+            "max_workers": self.max_workers,
+        }
     
     def add(
         self,
@@ -207,7 +317,7 @@ class DownloadManager(QObject):
         )
         
         # Add to queue
-        self._queue.put(PrioritizedTask(priority, task))
+        self._enqueue(task)
         
         # Emit events
         self.queue_changed.emit()
@@ -216,25 +326,45 @@ class DownloadManager(QObject):
         logger.info(f"Added download to queue: {repo_id} (ID: {task_id})")
         return task_id
     
+    def _enqueue(self, task: DownloadTask) -> None:
+        """Queue a task and wake the manager thread."""
+        with self._cv:
+            self._push(TaskSlot(task))
+    
+    def _push(self, slot: TaskSlot) -> None:
+        """Put a slot's task in the heap and wake the manager. Call with _lock held."""
+        task = slot.task
+        slot.state = task.status = DownloadStatus.QUEUED
+        self._slots[task.id] = slot
+        heapq.heappush(self._queue, PrioritizedTask(task.priority, next(self._seq), task))
+        self._refresh_snapshot()
+        self._cv.notify()
+    
     def _start_download(self, task: DownloadTask) -> None:
-        """Start a download worker for a task."""
+        """Start a download worker for a task, or wake its paused one."""
         with self._lock:
-            if task.id in self._workers:
+            slot = self._slots.get(task.id)
+            if slot is None or slot.state != DownloadStatus.QUEUED:
                 return
             
-            worker = DownloadWorker(task)
-            
-            # Connect worker signals
-            worker.progress.connect(self._on_worker_progress)
-            worker.completed.connect(self._on_worker_completed)
-            worker.failed.connect(self._on_worker_failed)
+            worker = slot.worker
+            resumed = worker is not None
+            if not resumed:
+                worker = self._idle_workers.popleft() if self._idle_workers else self._new_worker()
+                worker.assign(task)
+                slot.worker = worker
             
-            self._workers[task.id] = worker
-            self._active_tasks[task.id] = task
+            slot.state = task.status = DownloadStatus.DOWNLOADING
+            self._refresh_snapshot()
         
         # Update database
         self.db.update_download(task.id, status="downloading")
         
+        if resumed:
+            worker.resume()
+            logger.info(f"Download continues: {task.repo_id}")
+            return
+        
         # Start worker
         worker.start()
         
@@ -245,19 +375,24 @@ class DownloadManager(QObject):
         logger.info(f"Started download: {task.repo_id}")
     
     def pause(self, task_id: int) -> bool:
-        """Pause an active download."""
-        with self._lock:
-            if task_id not in self._workers:
+        """
+        Pause an active download.
+        
+        The worker starts no new files and waits in place once those
+        running finish; the task stops counting toward max_workers, so
+        the next queued task can start.
+        """
+        with self._cv:
+            slot = self._slots.get(task_id)
+            if slot is None or slot.state != DownloadStatus.DOWNLOADING:
                 return False
             
-            worker = self._workers[task_id]
-            worker.pause()
-            
-            task = self._active_tasks.get(task_id)
-            if task:
-                task.status = DownloadStatus.PAUSED
-                self._paused_tasks[task_id] = task
+            slot.worker.pause()
+            slot.state = slot.task.status = DownloadStatus.PAUSED
+            self._refresh_snapshot()
+            self._cv.notify()
         
+        self._flush_progress(task_id)
         self.db.update_download(task_id, status="paused")
         self.event_bus.emit(Events.DOWNLOAD_PAUSED, task_id=task_id)
         
@@ -265,16 +400,19 @@ class DownloadManager(QObject):
         return True
     
     def resume(self, task_id: int) -> bool:
-        """Resume a paused download."""
-        with self._lock:
-            if task_id not in self._paused_tasks:
+        """
+        Resume a paused download.
+        
+        The task is queued again, so resuming never goes over
+        max_workers; its paused worker continues when its turn comes.
+        """
+        with self._cv:
+            slot = self._slots.get(task_id)
+            if slot is None or slot.state != DownloadStatus.PAUSED:
                 return False
             
-            task = self._paused_tasks.pop(task_id)
-            task.status = DownloadStatus.QUEUED
+            self._push(slot)
         
-        # Re-add to queue
-        self._queue.put(PrioritizedTask(task.priority, task))
         self.db.update_download(task_id, status="queued")
         
         self.queue_changed.emit()
@@ -285,21 +423,18 @@ class DownloadManager(QObject):
     
     def cancel(self, task_id: int) -> bool:
         """Cancel a download."""
-        with self._lock:
-            # Cancel active download
-            if task_id in self._workers:
-                self._workers[task_id].cancel()
-                del self._workers[task_id]
+        with self._cv:
+            # Queued entries of a removed slot are skipped by _run_manager()
+            slot = self._slots.pop(task_id, None)
+            if slot is not None and slot.worker is not None:
+                slot.worker.cancel()
+                self._retire(slot)
+                self._cv.notify()
             
-            # Remove from active tasks
-            if task_id in self._active_tasks:
-                del self._active_tasks[task_id]
-            
-            # Remove from paused
-            if task_id in self._paused_tasks:
-                del self._paused_tasks[task_id]
+            self._refresh_snapshot()
         
         # Update database
+        self._flush_progress(task_id)
         self.db.update_download(task_id, status="cancelled")
         
         # Emit events
@@ -324,7 +459,10 @@ class DownloadManager(QObject):
         """
         paused_count = 0
         with self._lock:
-            task_ids = list(self._workers.keys())
+            task_ids = [
+                task_id for task_id, slot in self._slots.items()
+                if slot.state == DownloadStatus.DOWNLOADING
+            ]
         
         for task_id in task_ids:
             if self.pause(task_id):
@@ -341,7 +479,10 @@ class DownloadManager(QObject):
         """
         resumed_count = 0
         with self._lock:
-            task_ids = list(self._paused_tasks.keys())
+            task_ids = [
+                task_id for task_id, slot in self._slots.items()
+                if slot.state == DownloadStatus.PAUSED
+            ]
         
         for task_id in task_ids:
             if self.resume(task_id):
@@ -352,56 +493,97 @@ class DownloadManager(QObject):
     
     def get_active_downloads(self) -> List[DownloadTask]:
         """Get list of active downloads."""
-        with self._lock:
-            return list(self._active_tasks.values())
+        return list(self._active_snapshot)
     
     def get_queue_size(self) -> int:
         """Get number of items in queue."""
-        return self._queue.qsize()
+        return self._status_snapshot["queue_size"]
     
     def get_status(self) -> Dict:
         """Get overall manager status."""
-        with self._lock:
-            return {
-                "running": self._running,
-                "active_count": len(self._workers),
-                "paused_count": len(self._paused_tasks),
-                "queue_size": self._queue.qsize(),
-                "max_workers": self.max_workers,
-            }
+        return dict(self._status_snapshot)
     
-    def _on_worker_progress(self, progress: ProgressInfo) -> None:
+    def _owned_slot(self, task_id: int, worker: Optional[DownloadWorker]) -> Optional[TaskSlot]:
+        """
+        Get a task's slot if worker, or else the signal's sender, runs it.
+        
+        Worker signals are queued, so a cancelled or stopped worker's
+        progress and result can arrive after its task left the manager.
+        Call with _lock held.
+        """
+        if worker is None:
+            worker = self.sender()
+        slot = self._slots.get(task_id)
+        if slot is None or slot.worker is None or slot.worker is not worker:
+            return None
+        return slot
+    
+    def _on_worker_progress(self, progress: ProgressInfo, worker: Optional[DownloadWorker] = None) -> None:
         """Handle worker progress update."""
-        self.task_progress.emit(progress)
+        # Progress of a task that was cancelled, completed or failed would
+        # overwrite its final row
+        with self._lock:
+            if self._owned_slot(progress.task_id, worker) is None:
+                return
+            # Written by _flush_progress(); only the latest update per task is kept
+            self._progress_buffer[progress.task_id] = {
+                "id": progress.task_id,
+                "downloaded_bytes": progress.downloaded_bytes,
+                "total_bytes": progress.total_bytes,
+                "speed_bps": progress.speed_bps,
+            }
         
-        # Update database periodically (not every update)
-        self.db.update_download(
-            progress.task_id,
-            downloaded_bytes=progress.downloaded_bytes,
-            total_bytes=progress.total_bytes,
-            speed_bps=progress.speed_bps,
-        )
+        self.task_progress.emit(progress)
     
-    def _on_worker_completed(self, task_id: int, save_path: str) -> None:
-        """Handle worker completion."""
+    def _flush_progress(self, task_id: Optional[int] = None) -> None:
+        """
+        Write buffered progress to the database.
+        
+        Args:
+            task_id: Only flush this task, or None to flush all tasks
+        """
         with self._lock:
-            if task_id in self._active_tasks:
-                task = self._active_tasks.pop(task_id)
+            if task_id is None:
+                rows = list(self._progress_buffer.values())
+                self._progress_buffer.clear()
+                self._last_progress_flush = time.monotonic()
             else:
-                task = None
+                row = self._progress_buffer.pop(task_id, None)
+                rows = [row] if row else []
+        
+        if not rows:
+            return
+        try:
+            self.db.bulk_update_progress(rows)
+        except Exception as e:
+            logger.error(f"Failed to save download progress: {e}")
+    
+    def _on_worker_completed(
+        self, task_id: int, save_path: str, worker: Optional[DownloadWorker] = None
+    ) -> None:
+        """Handle worker completion."""
+        with self._cv:
+            slot = self._owned_slot(task_id, worker)
+            if slot is None:
+                return
+            task = self._slots.pop(task_id).task
+            self._retire(slot)
+            self._refresh_snapshot()
+            # The worker is finishing, so its slot is free
+            self._cv.notify()
         
         # Update database
+        self._flush_progress(task_id)
         self.db.update_download(task_id, status="completed")
         
         # Add to history
-        if task:
-            self.db.add_to_history({
-                "repo_id": task.repo_id,
-                "platform": task.platform,
-                "repo_type": task.repo_type,
-                "save_path": save_path,
-                "total_bytes": task.total_bytes,
-            })
+        self.db.add_to_history({
+            "repo_id": task.repo_id,
+            "platform": task.platform,
+            "repo_type": task.repo_type,
+            "save_path": save_path,
+            "total_bytes": task.total_bytes,
+        })
         
         # Emit events
         self.task_completed.emit(task_id, save_path)
@@ -410,13 +592,18 @@ class DownloadManager(QObject):
         
         logger.info(f"Download completed: {task_id}")
     
-    def _on_worker_failed(self, task_id: int, error: str) -> None:
+    def _on_worker_failed(self, task_id: int, error: str, worker: Optional[DownloadWorker] = None) -> None:
         """Handle worker failure."""
-        with self._lock:
-            if task_id in self._active_tasks:
-                del self._active_tasks[task_id]
+        with self._cv:
+            slot = self._owned_slot(task_id, worker)
+            if slot is None:
+                return
+            self._retire(self._slots.pop(task_id))
+            self._refresh_snapshot()
+            self._cv.notify()
         
         # Update database
+        self._flush_progress(task_id)
         self.db.update_download(task_id, status="failed", error_message=error)
         
         # Emit events
@@ -8,27 +8,204 @@ Supports:
 - Progress tracking: Speed, ETA, and progress updates
 """
 
+import atexit
 import logging
 import os
+import queue
 import time
 import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 import json
 import shutil
 from pathlib import Path
-from typing import Optional, List, Dict
+from typing import Any, Deque, Optional, List, Dict, Tuple
 
 from PyQt6.QtCore import QThread, pyqtSignal
 
 from ..models import DownloadTask, ProgressInfo, DownloadStatus
 from ..config import get_config
 from ..constants import APP_DATA_DIR
-from ..exceptions import InsufficientSpaceError, AuthenticationError, GatedModelError
+from ..exceptions import HFSuiteError, InsufficientSpaceError, AuthenticationError, GatedModelError
+
+try:
+    import orjson
+except ImportError:  # Optional: the stdlib json module is used instead
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
-# Resume state file location
+# Resume state file location. Each task has a small task_<id>.json with
+# its counters, rewritten whole, and a task_<id>.completed.log listing
+# completed files one per line, only ever appended to
 RESUME_STATE_DIR = APP_DATA_DIR / "resume_states"
-RESUME_STATE_DIR.mkdir(parents=True, exist_ok=True)
+COMPLETED_LOG_SUFFIX = ".completed.log"
+
+# Minimum seconds between progress signals
+PROGRESS_EMIT_INTERVAL = 0.5
+# The same in integer nanoseconds, compared against time.monotonic_ns()
+PROGRESS_EMIT_INTERVAL_NS = int(PROGRESS_EMIT_INTERVAL * 1_000_000_000)
+
+# Most recent speed samples averaged into the reported speed
+SPEED_SAMPLES = 10
+
+# Files downloaded concurrently, selected files and full repositories
+# alike, in batches that share one repo lookup; each batch is recorded
+# for resume as soon as it finishes, and no new batches start while paused
+SELECTED_FILES_WORKERS = 8
+
+# Selected-file concurrency starts low and grows by one per window while
+# throughput keeps improving by the growth factor, up to
+# SELECTED_FILES_WORKERS; it shrinks again when throughput falls back
+SELECTED_FILES_START_WORKERS = 2
+CONCURRENCY_WINDOW = 5.0  # seconds
+CONCURRENCY_GROWTH = 1.10
+
+# Resume state is rewritten at most this often, or once this many more
+# files have completed; it is always written when a download pauses or
+# its run ends without completing
+RESUME_STATE_SAVE_INTERVAL = 2.0  # seconds
+RESUME_STATE_SAVE_FILES = 8
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize resume state to JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Any:
+    """Deserialize JSON bytes."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+class _StateWriter:
+    """
+    Background thread that writes the resume state files of all workers.
+    
+    Workers hand over serialized state and carry on downloading; updates
+    queued for the same file are coalesced, so only the newest is written.
+    """
+    
+    def __init__(self):
+        self._queue: "queue.Queue[Tuple[Path, Optional[bytes]]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+    
+    def put(self, path: Path, payload: Optional[bytes]) -> None:
+        """Queue payload to be written to path, or None to delete the file."""
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._run, name="ResumeStateWriter", daemon=True
+                    )
+                    self._thread.start()
+        self._queue.put((path, payload))
+    
+    def flush(self) -> None:
+        """Block until every queued update has been written."""
+        if self._thread is not None:
+            self._queue.join()
+    
+    def _run(self) -> None:
+        """Writer thread loop."""
+        while True:
+            items = [self._queue.get()]
+            while True:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            # The last update queued for each path wins
+            for path, payload in dict(items).items():
+                try:
+                    if payload is None:
+                        path.unlink(missing_ok=True)
+                    else:
+                        # Written aside and renamed, so a crash never leaves half a file
+                        tmp_file = path.with_suffix(".tmp")
+                        tmp_file.write_bytes(payload)
+                        os.replace(tmp_file, path)
+                except Exception as e:
+                    logger.warning(f"Failed to write resume state {path.name}: {e}")
+            
+            for _ in items:
+                self._queue.task_done()
+
+
+_STATE_WRITER = _StateWriter()
+atexit.register(_STATE_WRITER.flush)
+
+
+def _bytes_on_disk(path: str) -> int:
+    """Total size of the files under path, or 0 if it does not exist."""
+    total = 0
+    pending = [path]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    total += entry.stat(follow_symlinks=False).st_size
+    return total
+
+
+class _AdaptiveConcurrency:
+    """
+    Picks how many selected files to download at once from measured throughput.
+    
+    Each window compares the bytes written since the previous one. While
+    every slot is busy and throughput grew by CONCURRENCY_GROWTH the target
+    goes up by one; if throughput dropped by the same factor (a stalled or
+    congested link) it goes down by one.
+    """
+    
+    def __init__(self):
+        self.target = SELECTED_FILES_START_WORKERS
+        self._window_start = 0.0
+        self._window_bytes = 0
+        self._last_rate: Optional[float] = None
+    
+    def restart(self, now: float, bytes_done: int) -> None:
+        """Begin a fresh measurement window, e.g. after a pause."""
+        self._window_start = now
+        self._window_bytes = bytes_done
+        self._last_rate = None
+    
+    def due(self, now: float) -> bool:
+        """Whether the current measurement window has elapsed."""
+        return now - self._window_start >= CONCURRENCY_WINDOW
+    
+    def update(self, now: float, bytes_done: int, saturated: bool) -> None:
+        """
+        Close the current window and adjust the target concurrency.
+        
+        Args:
+            now: Current monotonic time in seconds
+            bytes_done: Bytes written so far
+            saturated: Whether every allowed download slot is in use
+        """
+        rate = (bytes_done - self._window_bytes) / (now - self._window_start)
+        last = self._last_rate
+        if last is not None:
+            if saturated and rate >= last * CONCURRENCY_GROWTH:
+                self.target = min(self.target + 1, SELECTED_FILES_WORKERS)
+            elif rate * CONCURRENCY_GROWTH <= last:
+                self.target = max(self.target - 1, 1)
+        
+        self._window_start = now
+        self._window_bytes = bytes_done
+        self._last_rate = rate
 
 
 class DownloadWorker(QThread):
@@ -47,48 +224,97 @@ class DownloadWorker(QThread):
     completed = pyqtSignal(int, str)
     failed = pyqtSignal(int, str)
     
-    def __init__(self, task: DownloadTask, resume: bool = True):
+    def __init__(self, task: Optional[DownloadTask] = None, resume: bool = True):
         super().__init__()
         
-        self.task = task
         self.config = get_config()
         self.resume_enabled = resume
         
         self._cancel_event = threading.Event()
-        self._pause_event = threading.Event()
+        # A paused worker blocks on this until resume() or cancel()
+        # notifies it
+        self._pause_cond = threading.Condition()
+        self._paused = False
         self._is_running = False
         
+        self.reset()
+        if task is not None:
+            self.assign(task)
+    
+    def assign(self, task: DownloadTask) -> None:
+        """
+        Set up the worker for a task before start().
+        
+        The download manager reuses idle workers, so this may be called
+        again once the previous run has finished.
+        """
+        self.reset()
+        self.task = task
+        
+        # Settings are read once per task, so a download keeps the retry
+        # policy and endpoint it started with even if the config changes
+        download = self.config.download
+        self._max_retries = download.max_retries if download.auto_retry else 0
+        self._retry_delay = download.retry_delay
+        self._hf_endpoint = self.config.get_effective_endpoint("huggingface")
+        
         # Progress tracking
         self._downloaded_bytes = task.downloaded_bytes
         self._total_bytes = task.total_bytes
-        self._speed_samples = []
-        self._last_progress_time = 0
+        
+        # Resume state
+        RESUME_STATE_DIR.mkdir(parents=True, exist_ok=True)
+        self._resume_state_file = RESUME_STATE_DIR / f"task_{task.id}.json"
+        self._completed_log_file = RESUME_STATE_DIR / f"task_{task.id}{COMPLETED_LOG_SUFFIX}"
+        self._resume_state = self._load_resume_state()
+    
+    def reset(self) -> None:
+        """Drop all state of the last assigned task."""
+        self.task: Optional[DownloadTask] = None
+        self._cancel_event.clear()
+        self._paused = False
+        
+        # Progress tracking
+        self._downloaded_bytes = 0
+        self._total_bytes = 0
+        self._speed_samples: Deque[float] = deque(maxlen=SPEED_SAMPLES)
+        # Running total of _speed_samples, so averaging is one division
+        self._speed_sum = 0.0
+        self._last_progress_ns = 0
+        self._last_emit_ns = 0
         self._files_completed = 0
         self._files_total = 0
         self._current_file = None
         
         # Resume state
-        self._resume_state_file = RESUME_STATE_DIR / f"task_{task.id}.json"
-        self._resume_state = self._load_resume_state()
+        self._close_completed_log()
+        self._resume_state_file: Optional[Path] = None
+        self._completed_log_file: Optional[Path] = None
+        self._completed_log = None  # Append handle, opened on first use
+        self._resume_state: Dict = {}
+        self._state_dirty = False
+        self._state_files_unsaved = 0
+        self._last_state_save = 0.0
+        
+        # HuggingFaceAPI for the current run, set by _prepare_huggingface()
+        self._hf = None
     
     def run(self) -> None:
         """Main worker execution."""
         self._is_running = True
         self._cancel_event.clear()
-        self._pause_event.clear()
-        
-        # Store original environment variables for cleanup
-        original_env = {
-            "HF_ENDPOINT": os.environ.get("HF_ENDPOINT"),
-            "HF_HUB_DISABLE_SSL_VERIFICATION": os.environ.get("HF_HUB_DISABLE_SSL_VERIFICATION"),
-        }
+        self._paused = False
         
         try:
             # Retry configuration
-            max_retries = self.config.download.max_retries if self.config.download.auto_retry else 0
-            retry_delay = self.config.download.retry_delay
+            max_retries = self._max_retries
+            retry_delay = self._retry_delay
             last_error = None
             
+            # Done once per run rather than on every attempt
+            if self.task.platform == "huggingface":
+                self._prepare_huggingface()
+            
             for attempt in range(max_retries + 1):
                 try:
                     if self.task.platform == "huggingface":
@@ -103,24 +329,25 @@ class DownloadWorker(QThread):
                     self.completed.emit(self.task.id, save_path)
                     return  # Exit on success
                     
-                except (InsufficientSpaceError, AuthenticationError, GatedModelError) as e:
-                    # These errors should not be retried
-                    logger.error(f"Non-retryable error: {e}")
-                    self.failed.emit(self.task.id, str(e))
-                    return
-                    
                 except KeyboardInterrupt:
                     # User cancelled
                     logger.info(f"Download cancelled: {self.task.id}")
                     return
                     
                 except Exception as e:
-                    last_error = e
-                    
+                    # A cancelled task reports nothing, however it ended
                     if self._cancel_event.is_set():
                         logger.info(f"Download cancelled: {self.task.id}")
                         return
                     
+                    # Errors of this app declare whether a retry can help
+                    if isinstance(e, HFSuiteError) and not e.is_retryable:
+                        logger.error(f"Non-retryable error: {e}")
+                        self.failed.emit(self.task.id, str(e))
+                        return
+                    
+                    last_error = e
+                    
                     if attempt < max_retries:
                         # Calculate exponential backoff delay
                         backoff_delay = retry_delay * (2 ** attempt)
@@ -129,137 +356,175 @@ class DownloadWorker(QThread):
                             f"Retrying in {backoff_delay}s..."
                         )
                         
-                        # Wait with backoff, checking for cancel
-                        for _ in range(backoff_delay):
-                            if self._cancel_event.is_set():
-                                logger.info(f"Download cancelled during retry wait: {self.task.id}")
-                                return
-                            time.sleep(1)
+                        # Wait with backoff; cancel() ends the wait at once
+                        if self._cancel_event.wait(timeout=backoff_delay):
+                            logger.info(f"Download cancelled during retry wait: {self.task.id}")
+                            return
                     else:
                         # All retries exhausted
                         error_msg = str(last_error)
                         logger.error(f"Download failed after {max_retries + 1} attempts: {error_msg}")
                         self.failed.emit(self.task.id, error_msg)
         finally:
+            # Keep what a failed or cancelled run got done
+            self._save_resume_state()
+            self._close_completed_log()
             self._is_running = False
-            # Restore original environment variables
-            self._restore_environment(original_env)
     
-    def _restore_environment(self, original_env: dict) -> None:
-        """Restore original environment variables."""
-        for key, value in original_env.items():
-            if value is None:
-                os.environ.pop(key, None)
-            else:
-                os.environ[key] = value
+    def _prepare_huggingface(self) -> None:
+        """
+        Set up the API client used by every attempt.
+        
+        The endpoint is bound to the client rather than set through
+        HF_ENDPOINT, which is process-wide and shared by all workers.
+        """
+        self._hf = self._hf_client()
     
     def _download_huggingface(self) -> None:
         """Download from HuggingFace with resume support."""
-        from huggingface_hub import snapshot_download, hf_hub_download, HfFolder, HfApi
-        
-        # Set up token if available
-        token = os.environ.get("HF_TOKEN")
-        if token:
-            HfFolder.save_token(token)
-        
-        # Set up endpoint
-        endpoint = self.config.get_effective_endpoint("huggingface")
-        if endpoint:
-            os.environ["HF_ENDPOINT"] = endpoint
-            if "hf-mirror.com" in endpoint:
-                os.environ["HF_HUB_DISABLE_SSL_VERIFICATION"] = "1"
+        repo_dir = os.path.join(self.task.save_path, self.task.repo_name)
         
         # Estimate download size and check disk space
         estimated_size = self._estimate_repo_size()
-        self._check_disk_space(self.task.save_path, estimated_size)
+        self._check_disk_space(self.task.save_path, estimated_size, repo_dir)
         
         # Prepare download directory
-        repo_dir = os.path.join(self.task.save_path, self.task.repo_name)
         os.makedirs(repo_dir, exist_ok=True)
         
         # Check if we have specific files to download
         if self.task.selected_files:
-            self._download_selected_files_hf(repo_dir, token, endpoint)
+            self._download_files_hf(repo_dir, self.task.selected_files)
         else:
-            self._download_full_repo_hf(repo_dir, token, endpoint)
+            self._download_full_repo_hf(repo_dir)
         
         # Clean up resume state on success
         self._cleanup_resume_state()
         
         logger.info(f"HuggingFace download completed: {repo_dir}")
     
-    def _download_selected_files_hf(self, repo_dir: str, token: str, endpoint: str) -> None:
-        """Download selected files with resume support."""
-        from huggingface_hub import hf_hub_download
+    def _hf_client(self):
+        """
+        Get a HuggingFaceAPI for the configured endpoint and token.
+        
+        Its HfApi client is shared with the rest of the app and across
+        retries and tasks; all of them go through huggingface_hub's single
+        pooled HTTP client, so file downloads reuse open keep-alive
+        connections. Repo info is served from the API layer's caches.
+        """
+        from ..api.huggingface import HuggingFaceAPI
+        return HuggingFaceAPI(endpoint=self._hf_endpoint)
+    
+    def _download_files_hf(self, repo_dir: str, files: List[str]) -> None:
+        """
+        Download files concurrently, with pause and resume support.
         
-        files = self.task.selected_files
+        Whenever download slots are free, the pending files that fit are
+        fetched together with one download_files() call, which resolves
+        the repo once for the whole batch.
+        """
         self._files_total = len(files)
         
         # Get files already completed from resume state
-        completed_files = set(self._resume_state.get("completed_files", []))
+        completed_files = self._resume_state["completed_files"]
+        pending = deque(f for f in files if f not in completed_files)
+        self._files_completed = self._files_total - len(pending)
         
-        for i, file_path in enumerate(files):
+        def fetch(batch: Tuple[str, ...]) -> None:
+            # A batch whose turn comes after a cancel is never started
             if self._cancel_event.is_set():
                 raise KeyboardInterrupt("Download cancelled")
-            
-            # Skip if already completed
-            if file_path in completed_files:
-                self._files_completed = i + 1
-                logger.debug(f"Skipping already downloaded: {file_path}")
-                continue
-            
-            # Wait if paused
-            while self._pause_event.is_set():
-                self._save_resume_state()
-                time.sleep(0.5)
+            self._hf.download_files(
+                self.task.repo_id,
+                list(batch),
+                repo_dir,
+                repo_type=self.task.repo_type,
+                max_workers=len(batch),
+            )
+        
+        # Partial files are written under repo_dir too, so its size on disk
+        # tracks bytes received across all running downloads
+        concurrency = _AdaptiveConcurrency()
+        concurrency.restart(time.monotonic(), _bytes_on_disk(repo_dir))
+        
+        in_flight: Dict[Future, Tuple[str, ...]] = {}
+        running = 0  # Files across all batches in flight
+        pool = ThreadPoolExecutor(max_workers=SELECTED_FILES_WORKERS, thread_name_prefix="hf-file")
+        try:
+            while pending or in_flight:
                 if self._cancel_event.is_set():
                     raise KeyboardInterrupt("Download cancelled")
-            
-            self._current_file = file_path
-            self._files_completed = i
-            
-            try:
-                # Download with resume support
-                local_path = hf_hub_download(
-                    repo_id=self.task.repo_id,
-                    filename=file_path,
-                    repo_type=self.task.repo_type,
-                    local_dir=repo_dir,
-                    token=token,
-                    resume_download=True,  # Enable resume
-                    force_download=False,
-                    endpoint=endpoint,
-                )
                 
-                # Mark as completed
-                completed_files.add(file_path)
-                self._resume_state["completed_files"] = list(completed_files)
-                self._save_resume_state()
+                on_disk = self._report_disk_progress(repo_dir)
                 
-                logger.debug(f"Downloaded: {file_path} -> {local_path}")
+                # Start nothing new while paused
+                if pending and not self._paused:
+                    now = time.monotonic()
+                    if concurrency.due(now):
+                        concurrency.update(
+                            now,
+                            on_disk,
+                            saturated=running >= concurrency.target,
+                        )
+                    free = min(concurrency.target - running, len(pending))
+                    if free > 0:
+                        batch = tuple(pending.popleft() for _ in range(free))
+                        self._current_file = batch[0]
+                        in_flight[pool.submit(fetch, batch)] = batch
+                        running += len(batch)
                 
-            except Exception as e:
-                logger.error(f"Failed to download {file_path}: {e}")
-                raise
+                if not in_flight:
+                    # Paused with no downloads left running
+                    self._wait_while_paused()
+                    concurrency.restart(time.monotonic(), _bytes_on_disk(repo_dir))
+                    continue
+                
+                done, _ = wait(in_flight, timeout=PROGRESS_EMIT_INTERVAL, return_when=FIRST_COMPLETED)
+                for future in done:
+                    batch = in_flight.pop(future)
+                    running -= len(batch)
+                    try:
+                        future.result()
+                    except Exception as e:
+                        logger.error(f"Failed to download {', '.join(batch)}: {e}")
+                        raise
+                    for file_path in batch:
+                        self._record_completed_file(file_path)
+                    logger.debug(f"Downloaded {len(batch)} file(s) to {repo_dir}")
+                
+                self._maybe_save_resume_state()
+        except BaseException:
+            # Downloads cannot be interrupted, so a cancel or a failed batch
+            # still waits for the batches already running (at most
+            # concurrency.target files); nothing new is started. Those that
+            # finish are kept for resume
+            pool.shutdown(wait=True, cancel_futures=True)
+            for future, batch in in_flight.items():
+                if not future.cancelled() and future.exception() is None:
+                    for file_path in batch:
+                        self._record_completed_file(file_path)
+            raise
+        pool.shutdown()
         
         self._files_completed = self._files_total
+        self._report_disk_progress(repo_dir, final=True)
     
-    def _download_full_repo_hf(self, repo_dir: str, token: str, endpoint: str) -> None:
-        """Download full repository with resume support."""
-        from huggingface_hub import snapshot_download
-        
-        # snapshot_download already supports resume via local_dir
-        result = snapshot_download(
-            repo_id=self.task.repo_id,
-            repo_type=self.task.repo_type,
-            local_dir=repo_dir,
-            token=token,
-            force_download=False,  # This enables resume
-            resume_download=True,
-            endpoint=endpoint,
-        )
+    def _record_completed_file(self, file_path: str) -> None:
+        """Mark a selected file as downloaded in the resume state."""
+        self._resume_state["completed_files"].add(file_path)
+        self._log_completed_file(file_path)
+        self._files_completed += 1
+        self._mark_resume_state_dirty(files=1)
+    
+    def _download_full_repo_hf(self, repo_dir: str) -> None:
+        """
+        Download every file of the repository, with resume support.
         
-        return result
+        Files go through the same batches as selected files rather than
+        one snapshot_download() call, which could be neither paused nor
+        cancelled until the whole repository was in.
+        """
+        files = [f.path for f in self._hf.iter_files(self.task.repo_id, self.task.repo_type)]
+        self._download_files_hf(repo_dir, files)
     
     def _download_modelscope(self) -> None:
         """Download from ModelScope."""
@@ -281,13 +546,16 @@ class DownloadWorker(QThread):
         
         logger.info(f"ModelScope download completed: {result}")
     
-    def _check_disk_space(self, save_path: str, required_bytes: int) -> None:
+    def _check_disk_space(self, save_path: str, required_bytes: int, repo_dir: Optional[str] = None) -> None:
         """
         Check if there's enough disk space for the download.
         
+        Bytes a resumed download already has on disk are not required again.
+        
         Args:
             save_path: Directory where files will be saved
             required_bytes: Estimated bytes needed for download
+            repo_dir: Directory the repository is downloaded into, if known
             
         Raises:
             InsufficientSpaceError: If not enough space available
@@ -296,29 +564,34 @@ class DownloadWorker(QThread):
             return  # Skip check if size is unknown
         
         try:
-            # Get disk usage for the save path
-            # Ensure parent directory exists for the check
-            check_path = Path(save_path)
-            while not check_path.exists():
-                check_path = check_path.parent
-                if check_path == check_path.parent:
-                    break  # Reached root
+            # Credit what is already downloaded; files on disk may include
+            # some the progress counter has not seen
+            already_downloaded = self._downloaded_bytes
+            if repo_dir is not None and already_downloaded < required_bytes:
+                already_downloaded = max(already_downloaded, _bytes_on_disk(repo_dir))
+            needed = max(0, required_bytes - already_downloaded)
+            if needed == 0:
+                return
+            
+            # Get disk usage for the nearest existing ancestor of the save path
+            save_dir = Path(save_path)
+            check_path = next((p for p in (save_dir, *save_dir.parents) if p.exists()), save_dir.anchor)
             
             disk_usage = shutil.disk_usage(str(check_path))
             available = disk_usage.free
             
             # Add 10% buffer for safety
-            required_with_buffer = int(required_bytes * 1.1)
+            required_with_buffer = int(needed * 1.1)
             
             if available < required_with_buffer:
                 raise InsufficientSpaceError(
-                    required_bytes=required_bytes,
+                    required_bytes=needed,
                     available_bytes=available,
                     path=str(check_path)
                 )
             
             logger.debug(
-                f"Disk space check passed: need {required_bytes / 1e9:.2f} GB, "
+                f"Disk space check passed: need {needed / 1e9:.2f} GB, "
                 f"have {available / 1e9:.2f} GB"
             )
         except InsufficientSpaceError:
@@ -344,29 +617,18 @@ class DownloadWorker(QThread):
     
     def _estimate_hf_repo_size(self) -> int:
         """Estimate HuggingFace repository size."""
-        from huggingface_hub import HfApi
-        
-        api = HfApi()
-        token = os.environ.get("HF_TOKEN")
-        
         try:
-            # Get repo info with file details
-            repo_info = api.repo_info(
-                repo_id=self.task.repo_id,
-                repo_type=self.task.repo_type,
-                token=token,
-                files_metadata=True
-            )
+            # Retries within REPO_INFO_CACHE_TTL reuse the listing in memory;
+            # after that a stored response is revalidated by ETag. It is
+            # only summed, so it is walked in place rather than copied
+            files = self._hf.iter_files(self.task.repo_id, self.task.repo_type)
             
             # Sum up file sizes
-            total_size = 0
             selected_files = set(self.task.selected_files) if self.task.selected_files else None
-            
-            if hasattr(repo_info, 'siblings'):
-                for sibling in repo_info.siblings:
-                    if selected_files is None or sibling.rfilename in selected_files:
-                        if hasattr(sibling, 'size') and sibling.size:
-                            total_size += sibling.size
+            total_size = sum(
+                f.size for f in files
+                if selected_files is None or f.path in selected_files
+            )
             
             # Update task with total bytes
             self._total_bytes = total_size
@@ -386,34 +648,62 @@ class DownloadWorker(QThread):
         # ModelScope API is less consistent, return 0 to skip check
         return 0
     
-    def _update_progress(self, downloaded: int, total: int) -> None:
-        """Update and emit progress."""
-        now = time.time()
+    def _report_disk_progress(self, repo_dir: str, final: bool = False) -> int:
+        """
+        Report the bytes under repo_dir as download progress.
+        
+        Downloads write partial files inside repo_dir, so its size
+        grows as data arrives. The directory is scanned at most once per
+        PROGRESS_EMIT_INTERVAL, unless final is set.
+        
+        Args:
+            repo_dir: Directory the repository is downloaded into
+            final: The download has finished; scan and emit regardless
+            
+        Returns:
+            Bytes downloaded so far
+        """
+        now_ns = time.monotonic_ns()
+        if not final and now_ns - self._last_progress_ns < PROGRESS_EMIT_INTERVAL_NS:
+            return self._downloaded_bytes
+        
+        downloaded = _bytes_on_disk(repo_dir)
+        if self._total_bytes > 0:
+            downloaded = min(downloaded, self._total_bytes)
+        self._update_progress(downloaded, self._total_bytes, force=final)
+        return downloaded
+    
+    def _update_progress(self, downloaded: int, total: int, force: bool = False) -> None:
+        """Update and emit progress; force emits even within the throttle interval."""
+        now_ns = time.monotonic_ns()
         
         # Calculate speed
-        if self._last_progress_time > 0:
-            time_delta = now - self._last_progress_time
+        if self._last_progress_ns > 0:
+            time_delta_ns = now_ns - self._last_progress_ns
             bytes_delta = downloaded - self._downloaded_bytes
-            if time_delta > 0:
-                speed = bytes_delta / time_delta
+            if time_delta_ns > 0:
+                speed = bytes_delta * 1_000_000_000 / time_delta_ns
+                # The deque drops its oldest sample once full
+                if len(self._speed_samples) == SPEED_SAMPLES:
+                    self._speed_sum -= self._speed_samples[0]
                 self._speed_samples.append(speed)
-                # Keep last 10 samples for averaging
-                self._speed_samples = self._speed_samples[-10:]
+                self._speed_sum += speed
         
         self._downloaded_bytes = downloaded
         self._total_bytes = total
-        self._last_progress_time = now
+        self._last_progress_ns = now_ns
         
-        # Calculate average speed
-        avg_speed = sum(self._speed_samples) / len(self._speed_samples) if self._speed_samples else 0
-        
-        # Calculate ETA
-        remaining = total - downloaded
-        eta = int(remaining / avg_speed) if avg_speed > 0 else None
-        
-        # Emit progress (throttle to every 0.5 seconds)
-        if now - getattr(self, '_last_emit_time', 0) >= 0.5:
-            self._last_emit_time = now
+        # Each emit is queued across threads, so updates between emits
+        # are only folded into the speed samples
+        if force or now_ns - self._last_emit_ns >= PROGRESS_EMIT_INTERVAL_NS:
+            self._last_emit_ns = now_ns
+            
+            # Calculate average speed
+            avg_speed = self._speed_sum / len(self._speed_samples) if self._speed_samples else 0
+            
+            # Calculate ETA
+            remaining = total - downloaded
+            eta = int(remaining / avg_speed) if avg_speed > 0 else None
             
             progress = ProgressInfo(
                 task_id=self.task.id,
@@ -421,23 +711,33 @@ class DownloadWorker(QThread):
                 total_bytes=total,
                 speed_bps=avg_speed,
                 eta_seconds=eta,
+                current_file=self._current_file,
+                files_completed=self._files_completed,
+                files_total=self._files_total,
             )
             self.progress.emit(progress)
     
     def pause(self) -> None:
         """Pause the download."""
-        self._pause_event.set()
+        with self._pause_cond:
+            self._paused = True
+        # Written by the worker thread once running files finish
+        self._mark_resume_state_dirty()
         logger.debug(f"Worker paused: {self.task.id}")
     
     def resume(self) -> None:
         """Resume the download."""
-        self._pause_event.clear()
+        with self._pause_cond:
+            self._paused = False
+            self._pause_cond.notify_all()
         logger.debug(f"Worker resumed: {self.task.id}")
     
     def cancel(self) -> None:
         """Cancel the download."""
         self._cancel_event.set()
-        self._pause_event.clear()  # Unpause to allow cancellation
+        with self._pause_cond:
+            self._paused = False  # Unpause to allow cancellation
+            self._pause_cond.notify_all()
         logger.debug(f"Worker cancelled: {self.task.id}")
     
     def is_running(self) -> bool:
@@ -446,43 +746,109 @@ class DownloadWorker(QThread):
     
     def is_paused(self) -> bool:
         """Check if worker is paused."""
-        return self._pause_event.is_set()
+        return self._paused
+    
+    def _wait_while_paused(self) -> None:
+        """Save the resume state once, then block until resumed or cancelled."""
+        self._save_resume_state()
+        with self._pause_cond:
+            while self._paused and not self._cancel_event.is_set():
+                self._pause_cond.wait(timeout=5.0)
     
     # Resume state management
     
     def _load_resume_state(self) -> Dict:
-        """Load resume state from file."""
-        if self._resume_state_file.exists():
+        """Load resume state from file, with completed files as a set."""
+        state = {"downloaded_bytes": 0}
+        completed = set()
+        try:
+            if self._resume_state_file.exists():
+                state = _loads(self._resume_state_file.read_bytes())
+                # Older versions kept the whole list in the state file
+                legacy = state.pop("completed_files", None)
+                if legacy:
+                    completed.update(legacy)
+                    for file_path in legacy:
+                        self._log_completed_file(file_path)
+            if self._completed_log_file.exists():
+                completed.update(
+                    line.decode("utf-8")
+                    for line in self._completed_log_file.read_bytes().splitlines()
+                    if line
+                )
+        except Exception as e:
+            logger.warning(f"Failed to load resume state: {e}")
+        state["completed_files"] = completed
+        return state
+    
+    def _log_completed_file(self, file_path: str) -> None:
+        """Append a completed file to the task's completed-files log."""
+        try:
+            if self._completed_log is None:
+                self._completed_log = open(self._completed_log_file, "ab")
+            self._completed_log.write(file_path.encode("utf-8") + b"\n")
+        except Exception as e:
+            logger.warning(f"Failed to record completed file: {e}")
+    
+    def _close_completed_log(self) -> None:
+        """Close the completed-files log handle, if open."""
+        log = getattr(self, "_completed_log", None)
+        if log is not None:
+            self._completed_log = None
             try:
-                with open(self._resume_state_file, "r") as f:
-                    return json.load(f)
+                log.close()
             except Exception as e:
-                logger.warning(f"Failed to load resume state: {e}")
-        return {"completed_files": [], "downloaded_bytes": 0}
+                logger.warning(f"Failed to close completed files log: {e}")
+    
+    def _mark_resume_state_dirty(self, files: int = 0) -> None:
+        """Note a change to the resume state, written by _maybe_save_resume_state()."""
+        self._state_dirty = True
+        self._state_files_unsaved += files
+    
+    def _maybe_save_resume_state(self) -> None:
+        """Save the resume state if enough files or time have passed since the last save."""
+        if self._state_dirty and (
+            self._state_files_unsaved >= RESUME_STATE_SAVE_FILES
+            or time.monotonic() - self._last_state_save >= RESUME_STATE_SAVE_INTERVAL
+        ):
+            self._save_resume_state()
     
     def _save_resume_state(self) -> None:
-        """Save current state for resume."""
+        """Save current state for resume, if it changed since the last save."""
+        if not self._state_dirty:
+            return
         try:
+            # Completed files are already in the log; hand them to the OS
+            if self._completed_log is not None:
+                self._completed_log.flush()
+            
             self._resume_state["downloaded_bytes"] = self._downloaded_bytes
             self._resume_state["current_file"] = self._current_file
             self._resume_state["files_completed"] = self._files_completed
+            state = {k: v for k, v in self._resume_state.items() if k != "completed_files"}
+            _STATE_WRITER.put(self._resume_state_file, _dumps(state))
             
-            with open(self._resume_state_file, "w") as f:
-                json.dump(self._resume_state, f)
+            self._state_dirty = False
+            self._state_files_unsaved = 0
+            self._last_state_save = time.monotonic()
         except Exception as e:
             logger.warning(f"Failed to save resume state: {e}")
     
     def _cleanup_resume_state(self) -> None:
-        """Remove resume state file on successful completion."""
+        """Remove resume state files on successful completion."""
+        self._state_dirty = False
+        self._close_completed_log()
+        # Queued behind any pending write of the state file
+        _STATE_WRITER.put(self._resume_state_file, None)
         try:
-            if self._resume_state_file.exists():
-                self._resume_state_file.unlink()
+            self._completed_log_file.unlink(missing_ok=True)
         except Exception as e:
             logger.warning(f"Failed to cleanup resume state: {e}")
     
     @staticmethod
     def get_resumable_downloads() -> List[int]:
         """Get list of task IDs that can be resumed."""
+        _STATE_WRITER.flush()
         resumable = []
         for state_file in RESUME_STATE_DIR.glob("task_*.json"):
             try:
@@ -495,9 +861,11 @@ class DownloadWorker(QThread):
     @staticmethod
     def clear_resume_state(task_id: int) -> bool:
         """Clear resume state for a task."""
+        _STATE_WRITER.flush()
         state_file = RESUME_STATE_DIR / f"task_{task_id}.json"
         if state_file.exists():
             try:
+                (RESUME_STATE_DIR / f"task_{task_id}{COMPLETED_LOG_SUFFIX}").unlink(missing_ok=True)
                 state_file.unlink()
                 return True
             except Exception:
@@ -2,8 +2,7 @@
 Event bus system for decoupled component communication.
 """
 
-from collections import defaultdict
-from typing import Callable, Any
+from typing import Callable, Any, Dict, Tuple
 import threading
 import logging
 
@@ -54,6 +53,9 @@ class EventBus:
     """
     Thread-safe singleton event bus for application-wide communication.
     
+    Subscriber lists are immutable tuples replaced on every change, so
+    emit() reads them without taking a lock.
+    
     Usage:
         bus = EventBus()
         bus.subscribe(Events.DOWNLOAD_COMPLETED, my_handler)
@@ -68,7 +70,7 @@ class EventBus:
             with cls._lock:
                 if cls._instance is None:
                     cls._instance = super().__new__(cls)
-                    cls._instance._subscribers = defaultdict(list)
+                    cls._instance._subscribers: Dict[str, Tuple[Callable, ...]] = {}
                     cls._instance._subscriber_lock = threading.Lock()
         return cls._instance
     
@@ -81,8 +83,9 @@ class EventBus:
             callback: Function to call when event is emitted
         """
         with self._subscriber_lock:
-            if callback not in self._subscribers[event]:
-                self._subscribers[event].append(callback)
+            callbacks = self._subscribers.get(event, ())
+            if callback not in callbacks:
+                self._subscribers[event] = callbacks + (callback,)
                 logger.debug(f"Subscribed to {event}: {callback.__name__}")
     
     def unsubscribe(self, event: str, callback: Callable) -> None:
@@ -94,8 +97,9 @@ class EventBus:
             callback: Previously subscribed callback
         """
         with self._subscriber_lock:
-            if callback in self._subscribers[event]:
-                self._subscribers[event].remove(callback)
+            callbacks = self._subscribers.get(event, ())
+            if callback in callbacks:
+                self._subscribers[event] = tuple(c for c in callbacks if c != callback)
                 logger.debug(f"Unsubscribed from {event}: {callback.__name__}")
     
     def emit(self, event: str, *args, **kwargs) -> None:
@@ -106,8 +110,8 @@ class EventBus:
             event: Event name
             *args, **kwargs: Arguments to pass to callbacks
         """
-        with self._subscriber_lock:
-            callbacks = list(self._subscribers[event])
+        # A tuple is never modified, only replaced, so no lock is needed
+        callbacks = self._subscribers.get(event, ())
         
         for callback in callbacks:
             try:
@@ -140,14 +144,13 @@ class EventBus:
         """
         with self._subscriber_lock:
             if event:
-                self._subscribers[event].clear()
+                self._subscribers.pop(event, None)
             else:
                 self._subscribers.clear()
     
     def get_subscriber_count(self, event: str) -> int:
         """Get number of subscribers for an event."""
-        with self._subscriber_lock:
-            return len(self._subscribers[event])
+        return len(self._subscribers.get(event, ()))
 
 
 # Convenience function
@@ -25,7 +25,9 @@ class HFSuiteError(Exception):
 
 class DownloadError(HFSuiteError):
     """Base class for download-related errors."""
-    pass
+    
+    # Retried unless a subclass knows a retry cannot help
+    is_retryable = True
 
 
 class InsufficientSpaceError(DownloadError):
@@ -56,6 +58,8 @@ class InsufficientSpaceError(DownloadError):
 class AuthenticationError(HFSuiteError):
     """Raised when authentication fails."""
     
+    is_retryable = False
+    
     def __init__(self, platform: str, reason: str = None):
         self.platform = platform
         self.reason = reason
@@ -109,6 +113,8 @@ class NetworkError(DownloadError):
 class RepositoryNotFoundError(HFSuiteError):
     """Raised when repository doesn't exist or is inaccessible."""
     
+    is_retryable = False
+    
     def __init__(self, repo_id: str, platform: str):
         self.repo_id = repo_id
         self.platform = platform
@@ -125,6 +131,8 @@ class RepositoryNotFoundError(HFSuiteError):
 class GatedModelError(HFSuiteError):
     """Raised when trying to access a gated model without permission."""
     
+    is_retryable = False
+    
     def __init__(self, repo_id: str):
         self.repo_id = repo_id
         
@@ -140,6 +148,8 @@ class GatedModelError(HFSuiteError):
 class DownloadInterruptedError(HFSuiteError):
     """Raised when download is interrupted (can be resumed)."""
     
+    is_retryable = True
+    
     def __init__(self, task_id: int, progress_percent: float):
         self.task_id = task_id
         self.progress_percent = progress_percent
@@ -152,6 +162,8 @@ class DownloadInterruptedError(HFSuiteError):
 class FileVerificationError(HFSuiteError):
     """Raised when downloaded file fails verification."""
     
+    is_retryable = False
+    
     def __init__(self, file_path: str, expected_hash: str = None, actual_hash: str = None):
         self.file_path = file_path
         self.expected_hash = expected_hash
@@ -9,7 +9,7 @@ from pathlib import Path
 from logging.handlers import RotatingFileHandler
 from typing import Optional
 
-from .constants import LOGS_DIR, APP_NAME
+from .constants import LOGS_DIR, APP_NAME, ensure_app_dirs
 
 # Log format
 LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -85,6 +85,7 @@ def setup_logging(
     
     # File handler
     if log_file:
+        ensure_app_dirs()
         log_path = LOGS_DIR / f"hf_suite_{datetime.now().strftime('%Y%m%d')}.log"
         
         file_handler = RotatingFileHandler(
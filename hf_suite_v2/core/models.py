@@ -2,6 +2,7 @@
 Data models using Pydantic for validation and serialization.
 """
 
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 from pydantic import BaseModel, Field, field_validator, ConfigDict
@@ -162,8 +163,14 @@ class LocalModel(BaseModel):
     model_config = ConfigDict(use_enum_values=True)
 
 
-class ProgressInfo(BaseModel):
-    """Download progress information for UI updates."""
+@dataclass(slots=True)
+class ProgressInfo:
+    """Download progress information for UI updates.
+    
+    A plain slotted dataclass rather than a Pydantic model: workers emit
+    one per progress tick and the fields are always produced internally,
+    so validation would only add per-emit overhead.
+    """
     
     task_id: int
     downloaded_bytes: int
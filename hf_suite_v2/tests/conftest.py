@@ -28,6 +28,27 @@ def temp_db_path(temp_dir: Path) -> Path:
     return temp_dir / "test_suite.db"
 
 
+@pytest.fixture
+def temp_db(tmp_path: Path):
+    """Create a fresh Database singleton in a temporary directory."""
+    from hf_suite_v2.core.database import Database
+    
+    Database._instance = None
+    db = Database(tmp_path / "test.db")
+    yield db
+    Database._instance = None
+
+
+@pytest.fixture
+def resume_dir(tmp_path: Path, monkeypatch) -> Path:
+    """Keep download resume state files in a temporary directory."""
+    from hf_suite_v2.core.download import worker as worker_module
+    
+    path = tmp_path / "resume_states"
+    monkeypatch.setattr(worker_module, "RESUME_STATE_DIR", path)
+    return path
+
+
 @pytest.fixture
 def sample_workflow() -> dict:
     """Sample ComfyUI workflow for testing."""
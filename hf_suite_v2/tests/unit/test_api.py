@@ -43,6 +43,205 @@ class TestAPIBase:
         
         assert HuggingFaceAPI is not None
         assert ModelScopeAPI is not None
+    
+    def test_validate_repo_id(self):
+        """Test repo ID validation accepts owner/name only."""
+        from hf_suite_v2.core.api import HuggingFaceAPI
+        
+        api = HuggingFaceAPI()
+        assert api.validate_repo_id("owner/model.v2")
+        for bad in ("", "model", "a/b/c", ".owner/model", "owner/.model", "/model", "owner/"):
+            assert not api.validate_repo_id(bad)
+    
+    def test_repo_records_are_slotted(self):
+        """Test that file and metadata records carry no per-instance dict."""
+        from hf_suite_v2.core.api.base import RepoFile, RepoMetadata
+        
+        meta = RepoMetadata(repo_id="owner/model", platform="huggingface")
+        assert meta.tags == []
+        assert not hasattr(meta, "__dict__")
+        assert not hasattr(RepoFile(path="model.bin", size=1), "__dict__")
+    
+    def test_clients_shared_per_endpoint_and_token(self):
+        """Test that instances with equal settings share one HfApi client."""
+        from hf_suite_v2.core.api import HuggingFaceAPI
+        
+        api_a = HuggingFaceAPI(token="hf_a", endpoint="https://example.test")
+        api_b = HuggingFaceAPI(token="hf_a", endpoint="https://example.test")
+        api_c = HuggingFaceAPI(token="hf_c", endpoint="https://example.test")
+        
+        assert api_a.api is api_b.api
+        assert api_a.api is not api_c.api
+    
+    def test_repo_info_and_files_share_one_request(self):
+        """Test that metadata and file list come from one cached request."""
+        from types import SimpleNamespace
+        from unittest.mock import patch
+        from hf_suite_v2.core.api import HuggingFaceAPI
+        from hf_suite_v2.core.api.huggingface import _INFO_CACHE
+        
+        api = HuggingFaceAPI(token="hf_info_cache")
+        _INFO_CACHE.clear()
+        info = SimpleNamespace(
+            id="owner/model", author="owner", downloads=1, likes=2, tags=["t"],
+            siblings=[
+                SimpleNamespace(rfilename="b.bin", size=2, blob_id="2", lfs=None),
+                SimpleNamespace(rfilename="a.bin", size=1, blob_id="1", lfs=None),
+            ],
+        )
+        
+        with patch.object(HuggingFaceAPI, "_request_info", return_value=info) as request:
+            assert api.get_repo_info("owner/model").likes == 2
+            assert [f.path for f in api.list_files("owner/model")] == ["a.bin", "b.bin"]
+            assert sum(f.size for f in api.iter_files("owner/model")) == 3
+            assert request.call_count == 1
+            
+            api.invalidate("owner/model")
+            api.list_files("owner/model")
+            assert request.call_count == 2
+    
+    def test_repo_info_revalidates_with_etag(self):
+        """Test that a stored response is reused when the server answers 304."""
+        from unittest.mock import MagicMock, patch
+        from hf_suite_v2.core.api import HuggingFaceAPI
+        from hf_suite_v2.core.api.cache import get_cache
+        from hf_suite_v2.core.api.huggingface import _load_hub
+        
+        _load_hub()
+        api = HuggingFaceAPI(token="hf_etag_test")
+        api._api = MagicMock()
+        body = {
+            "id": "owner/etag-model",
+            "cardData": {"license": "mit"},
+            "siblings": [{"rfilename": "a.bin", "size": 1}],
+        }
+        fresh = MagicMock(status_code=200, headers={"ETag": 'W/"1"'})
+        fresh.json.return_value = body
+        unchanged = MagicMock(status_code=304, headers={})
+        
+        session = MagicMock()
+        session.get.side_effect = [fresh, unchanged]
+        with patch("hf_suite_v2.core.api.huggingface._get_session", return_value=session):
+            first = api._request_info("owner/etag-model", "model")
+            second = api._request_info("owner/etag-model", "model")
+        
+        assert first.id == second.id == "owner/etag-model"
+        assert session.get.call_args_list[1].kwargs["headers"]["If-None-Match"] == 'W/"1"'
+        assert session.get.call_args_list[0].kwargs["timeout"] > 0
+        
+        # Only the fields that are read are stored with the ETag
+        cache = get_cache()
+        stored = cache.get(cache.make_key("hf_etag", api._client_key(), "models", "owner/etag-model"))
+        assert "cardData" not in stored["body"]
+        assert stored["body"]["siblings"] == [{"rfilename": "a.bin", "size": 1}]
+    
+    def test_repo_info_falls_back_to_hfapi(self):
+        """Test that the public HfApi call is used when the raw request does not fit."""
+        from unittest.mock import MagicMock, patch
+        from hf_suite_v2.core.api import HuggingFaceAPI
+        from hf_suite_v2.core.api.huggingface import _EtagUnavailable
+        
+        api = HuggingFaceAPI(token="hf_etag_fallback")
+        api._api = MagicMock()
+        unavailable = _EtagUnavailable("unexpected field")
+        with patch.object(HuggingFaceAPI, "_request_info_etag", side_effect=unavailable):
+            info = api._request_info("owner/model", "model")
+        
+        api._api.model_info.assert_called_once_with("owner/model", files_metadata=True)
+        assert info is api._api.model_info.return_value
+    
+    def test_repo_info_errors_not_swallowed(self):
+        """Test that other errors of the raw request are raised, not retried via HfApi."""
+        from unittest.mock import MagicMock, patch
+        from hf_suite_v2.core.api import HuggingFaceAPI
+        
+        api = HuggingFaceAPI(token="hf_etag_error")
+        api._api = MagicMock()
+        with patch.object(HuggingFaceAPI, "_request_info_etag", side_effect=KeyError("id")):
+            with pytest.raises(KeyError):
+                api._request_info("owner/model", "model")
+        
+        api._api.model_info.assert_not_called()
+    
+    def test_get_repo_infos_keeps_order(self):
+        """Test bulk lookup returns results in input order with None for failures."""
+        from hf_suite_v2.core.api import HuggingFaceAPI
+        from hf_suite_v2.core.api.base import NotFoundError, RepoMetadata
+        
+        def fake_info(repo_id, repo_type="model"):
+            if repo_id == "missing/repo":
+                raise NotFoundError(repo_id)
+            return RepoMetadata(repo_id=repo_id, platform="huggingface")
+        
+        api = HuggingFaceAPI()
+        api.get_repo_info = fake_info
+        results = api.get_repo_infos(["a/one", "missing/repo", "b/two"])
+        
+        assert [r.repo_id if r else None for r in results] == ["a/one", None, "b/two"]
+    
+    def test_download_files_uses_one_snapshot(self):
+        """Test that several files are fetched with one literal-pattern snapshot."""
+        from unittest.mock import MagicMock
+        from hf_suite_v2.core.api import HuggingFaceAPI
+        
+        api = HuggingFaceAPI(token="hf_download_files")
+        api._api = MagicMock()
+        api.download_files("owner/model", ["a.bin", "b[1].bin"], "/tmp/out")
+        
+        kwargs = api._api.snapshot_download.call_args.kwargs
+        assert api._api.snapshot_download.call_count == 1
+        assert kwargs["allow_patterns"] == ["a.bin", "b[[]1].bin"]
+    
+    def test_search_filters_reuse_cached_page(self):
+        """Test that changing filters does not repeat the search request."""
+        from types import SimpleNamespace
+        from unittest.mock import MagicMock
+        from hf_suite_v2.core.api import HuggingFaceAPI
+        
+        api = HuggingFaceAPI(token="hf_search_cache")
+        api._api = MagicMock()
+        api._api.list_models.return_value = [
+            SimpleNamespace(id="a/one", downloads=2, likes=0, tags=["text-generation"]),
+            SimpleNamespace(id="b/two", downloads=1, likes=0, tags=["image-classification"]),
+        ]
+        
+        assert [m.repo_id for m in api.search("cached query", limit=1)] == ["a/one"]
+        found = api.search("cached query", limit=1, filters={"task": "image-classification"})
+        
+        assert [m.repo_id for m in found] == ["b/two"]
+        assert api._api.list_models.call_count == 1
+        assert api._api.list_models.call_args.kwargs["limit"] == 2
+    
+    def test_whoami_is_cached(self):
+        """Test that whoami() hits the network once until invalidated."""
+        from unittest.mock import MagicMock
+        from hf_suite_v2.core.api import HuggingFaceAPI
+        
+        api = HuggingFaceAPI(token="hf_whoami")
+        api._api = MagicMock()
+        api._api.whoami.return_value = {"name": "user"}
+        
+        assert api.is_authenticated()
+        assert api.whoami() == {"name": "user"}
+        assert api._api.whoami.call_count == 1
+        
+        api.invalidate_auth()
+        api.whoami()
+        assert api._api.whoami.call_count == 2
+    
+    def test_repo_info_errors_use_status_codes(self):
+        """Test that hub exceptions map to API errors by type and status."""
+        from unittest.mock import MagicMock
+        from huggingface_hub.utils import GatedRepoError, HfHubHTTPError
+        from hf_suite_v2.core.api.base import AuthenticationError, RateLimitError
+        from hf_suite_v2.core.api.huggingface import _repo_info_error
+        
+        gated = GatedRepoError("denied", response=MagicMock(status_code=403, headers={}))
+        limited = HfHubHTTPError("slow down", response=MagicMock(status_code=429, headers={}))
+        
+        assert isinstance(_repo_info_error(gated, "a/b"), AuthenticationError)
+        assert isinstance(_repo_info_error(limited, "a/b"), RateLimitError)
+        assert type(_repo_info_error(ValueError("404 in message"), "a/b")).__name__ == "APIError"
 
 
 class TestAPICaching:
@@ -193,12 +392,32 @@ class TestPlatformConstants:
         from hf_suite_v2.core.constants import PLATFORMS
         
         for name, platform in PLATFORMS.items():
-            assert "default_endpoint" in platform
-            assert "token_url" in platform
+            assert platform.default_endpoint
+            assert platform.token_url
     
     def test_huggingface_endpoint(self):
         """Test HuggingFace endpoint is valid."""
         from hf_suite_v2.core.constants import PLATFORMS
         
         hf = PLATFORMS["huggingface"]
-        assert "huggingface" in hf["default_endpoint"].lower()
+        assert "huggingface" in hf.default_endpoint.lower()
+
+
+class TestFileCategoryConstants:
+    """Tests for file category lookups."""
+    
+    def test_extension_category_keeps_first_listed(self):
+        """Test extensions map to the first category that lists them."""
+        from hf_suite_v2.core.constants import FILE_EXTENSION_CATEGORY
+        
+        assert FILE_EXTENSION_CATEGORY[".safetensors"] == "checkpoints"
+        assert FILE_EXTENSION_CATEGORY[".gguf"] == "gguf"
+    
+    def test_file_category_uses_extension_map(self):
+        """Test paths are categorized by their lowercased extension."""
+        from hf_suite_v2.core.constants import file_category
+        
+        assert file_category("unet/Model.SafeTensors") == "checkpoints"
+        assert file_category("tokenizer.json") == "config"
+        assert file_category("README") is None
+        assert file_category("v1.0/LICENSE") is None
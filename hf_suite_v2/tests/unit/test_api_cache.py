@@ -14,9 +14,7 @@ class TestAPICache:
     
     def setup_method(self):
         """Set up test fixtures."""
-        # Reset singleton for each test
         from hf_suite_v2.core.api.cache import APICache
-        APICache._instance = None
         self.temp_dir = Path(tempfile.mkdtemp())
         
         # Patch CACHE_DIR
@@ -106,14 +104,67 @@ class TestAPICache:
     
     def test_cache_key_generation(self):
         """Test that cache keys are unique for different inputs."""
-        key1 = self.cache._get_cache_key("prefix", "arg1", kwarg="val1")
-        key2 = self.cache._get_cache_key("prefix", "arg1", kwarg="val2")
-        key3 = self.cache._get_cache_key("prefix", "arg2", kwarg="val1")
+        key1 = self.cache.make_key("prefix", "arg1", kwarg="val1")
+        key2 = self.cache.make_key("prefix", "arg1", kwarg="val2")
+        key3 = self.cache.make_key("prefix", "arg2", kwarg="val1")
         
         assert key1 != key2
         assert key1 != key3
         assert key2 != key3
-    
+
+    def test_cache_key_is_canonical(self):
+        """Test that equal arguments give equal keys regardless of ordering."""
+        key1 = self.cache.make_key("prefix", {"a": 1, "b": 2}, limit=5)
+        key2 = self.cache.make_key("prefix", {"b": 2, "a": 1}, limit=5)
+        key3 = self.cache.make_key(
+            "prefix", {"a": 1, "b": 2}, limit=5, progress_callback=lambda n: n
+        )
+
+        assert key1 == key2 == key3
+
+    def test_cache_key_rejects_unserializable_args(self):
+        """Test that objects without a stable encoding are refused."""
+        with pytest.raises(TypeError):
+            self.cache.make_key("prefix", object())
+
+    def test_entry_without_header_is_discarded(self):
+        """Test that files from the old plain-JSON format are treated as misses."""
+        legacy_path = self.cache._get_cache_path("legacy")
+        legacy_path.write_text('{"value": 1, "expires_at": 9999999999}')
+
+        assert self.cache.get("legacy") is None
+        assert not legacy_path.exists()
+
+    def test_set_leaves_no_temp_files(self):
+        """Test that writes are renamed into place, including failed ones."""
+        assert self.cache.set("ok", [1, 2, 3])
+        assert not self.cache.set("bad", object())
+        
+        assert [p.name for p in self.temp_dir.iterdir()] == [
+            self.cache._get_cache_path("ok").name
+        ]
+
+    def test_memory_layer_serves_hot_keys(self):
+        """Test that repeated gets are served from memory, not disk."""
+        self.cache.set("hot_key", {"data": "value"})
+        for cache_file in self.temp_dir.glob("*.json"):
+            cache_file.unlink()
+
+        assert self.cache.get("hot_key") == {"data": "value"}
+
+        self.cache.delete("hot_key")
+        assert self.cache.get("hot_key") is None
+
+    def test_memory_layer_is_bounded(self):
+        """Test that the memory layer evicts least recently used keys."""
+        self.cache._mem_cap = 2
+        self.cache.set("a", 1)
+        self.cache.set("b", 2)
+        self.cache.get("a")
+        self.cache.set("c", 3)
+
+        assert list(self.cache._mem) == ["a", "c"]
+
     def test_complex_data_types(self):
         """Test caching complex data structures."""
         complex_data = {
@@ -135,8 +186,8 @@ class TestCachedDecorator:
     
     def setup_method(self):
         """Set up test fixtures."""
-        from hf_suite_v2.core.api.cache import APICache
-        APICache._instance = None
+        from hf_suite_v2.core.api.cache import get_cache
+        get_cache.cache_clear()
         self.temp_dir = Path(tempfile.mkdtemp())
     
     def teardown_method(self):
@@ -180,6 +231,57 @@ class TestCachedDecorator:
         
         assert result1 == 6
         assert result2 == 20
+    
+    def test_cached_decorator_remembers_negative_results(self):
+        """Test that None results and NotFoundError are cached briefly."""
+        from hf_suite_v2.core.api.base import NotFoundError
+        from hf_suite_v2.core.api.cache import cached
+        
+        calls = []
+        
+        @cached("neg_func", ttl=60, neg_ttl=60)
+        def lookup(repo_id):
+            calls.append(repo_id)
+            if repo_id == "missing/repo":
+                raise NotFoundError("Repository not found")
+            return None
+        
+        assert lookup("gated/repo") is None
+        assert lookup("gated/repo") is None
+        
+        for _ in range(2):
+            with pytest.raises(NotFoundError, match="Repository not found"):
+                lookup("missing/repo")
+        
+        assert calls == ["gated/repo", "missing/repo"]
+
+
+    def test_cached_method_keys_on_client_not_instance(self):
+        """Test that methods share entries across instances with equal clients."""
+        import uuid
+        from hf_suite_v2.core.api.cache import cached
+        
+        calls = []
+        
+        class Client:
+            def __init__(self, token):
+                self.token = token
+            
+            def _client_key(self):
+                return self.token
+            
+            @cached("client_method", ttl=60)
+            def lookup(self, repo_id):
+                calls.append((self.token, repo_id))
+                return repo_id
+        
+        # Unique per run, as entries persist in the shared cache directory
+        repo_id = f"owner/{uuid.uuid4().hex}"
+        assert Client("a").lookup(repo_id) == repo_id
+        assert Client("a").lookup(repo_id) == repo_id
+        assert Client("b").lookup(repo_id) == repo_id
+        
+        assert calls == [("a", repo_id), ("b", repo_id)]
 
 
 class TestTTLConstants:
@@ -0,0 +1,115 @@
+"""
+Tests for CLI helpers.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from hf_suite_v2.cli.main import SCAN_BATCH_SIZE, _detect_model_type, _scan_batch_size, _scan_roots
+
+
+class TestScan:
+    """Tests for the local model scanner."""
+
+    @pytest.fixture
+    def model_tree(self, tmp_path: Path) -> Path:
+        """Create a small directory tree with model and non-model files."""
+        (tmp_path / "loras" / "nested").mkdir(parents=True)
+        (tmp_path / "vae").mkdir()
+        (tmp_path / "loras" / "nested" / "style.safetensors").write_bytes(b"x" * 10)
+        (tmp_path / "vae" / "decoder.PT").write_bytes(b"x" * 20)
+        (tmp_path / "vae" / "config.json").write_text("{}")
+        (tmp_path / "base.gguf").write_bytes(b"x" * 30)
+        return tmp_path
+
+    def _scan(self, *roots) -> dict:
+        records = [r for batch in _scan_roots([str(r) for r in roots]) for r in batch]
+        return {os.path.relpath(r["file_path"], roots[0]): r for r in records}
+
+    def test_finds_model_files_in_all_subdirectories(self, model_tree):
+        """Test that every model file is found and others are ignored."""
+        found = self._scan(model_tree)
+
+        assert sorted(found) == sorted([
+            os.path.join("loras", "nested", "style.safetensors"),
+            os.path.join("vae", "decoder.PT"),
+            "base.gguf",
+        ])
+        assert found["base.gguf"]["file_size"] == 30
+        assert found[os.path.join("vae", "decoder.PT")]["model_type"] == "vae"
+
+    def test_missing_root_is_skipped(self, model_tree):
+        """Test that an unreadable root does not abort the scan."""
+        found = self._scan(model_tree, model_tree / "does-not-exist")
+        assert len(found) == 3
+
+    def test_skips_hidden_and_cache_blob_directories(self, model_tree):
+        """Test that hidden directories and cache repo blob stores are not walked."""
+        (model_tree / ".git").mkdir()
+        (model_tree / ".git" / "old.safetensors").write_bytes(b"x")
+        blobs = model_tree / "models--owner--model" / "blobs"
+        blobs.mkdir(parents=True)
+        (blobs / "dup.safetensors").write_bytes(b"x")
+
+        assert len(self._scan(model_tree)) == 3
+
+    def test_scans_ordinary_blobs_and_refs_directories(self, model_tree):
+        """Test that folders named blobs or refs outside a cache repo are walked."""
+        for name in ("blobs", "refs"):
+            (model_tree / name).mkdir()
+            (model_tree / name / f"{name}.safetensors").write_bytes(b"x")
+
+        found = self._scan(model_tree)
+
+        assert os.path.join("blobs", "blobs.safetensors") in found
+        assert os.path.join("refs", "refs.safetensors") in found
+
+    def test_hub_cache_walks_snapshots_only(self, tmp_path):
+        """Test that a HuggingFace hub root is narrowed to model snapshots."""
+        repo = tmp_path / "hub" / "models--owner--model"
+        (repo / "snapshots" / "abc123").mkdir(parents=True)
+        (repo / "other").mkdir()
+        (repo / "snapshots" / "abc123" / "model.safetensors").write_bytes(b"x")
+        (repo / "other" / "stray.safetensors").write_bytes(b"x")
+
+        found = self._scan(tmp_path / "hub")
+
+        assert list(found) == [
+            os.path.join("models--owner--model", "snapshots", "abc123", "model.safetensors")
+        ]
+
+    def test_hub_cache_includes_datasets_and_spaces(self, tmp_path):
+        """Test that dataset and space caches in a hub root are scanned too."""
+        for name in ("datasets--owner--data", "spaces--owner--demo"):
+            snapshot = tmp_path / "hub" / name / "snapshots" / "abc123"
+            snapshot.mkdir(parents=True)
+            (snapshot / "weights.safetensors").write_bytes(b"x")
+
+        found = self._scan(tmp_path / "hub")
+
+        assert sorted(found) == [
+            os.path.join(name, "snapshots", "abc123", "weights.safetensors")
+            for name in ("datasets--owner--data", "spaces--owner--demo")
+        ]
+
+    def test_model_type_precedence(self):
+        """Test that lora wins over vae when both keywords appear."""
+        assert _detect_model_type("/models/vae/my_lora.safetensors") == "lora"
+        assert _detect_model_type("/models/unet.safetensors") == "checkpoint"
+
+    @pytest.mark.parametrize("raw, expected", [
+        (None, SCAN_BATCH_SIZE),
+        ("250", 250),
+        ("0", 1),
+        ("lots", SCAN_BATCH_SIZE),
+    ])
+    def test_scan_batch_size_from_environment(self, monkeypatch, raw, expected):
+        """Test the batch size override is clamped and bad values are ignored."""
+        if raw is None:
+            monkeypatch.delenv("HF_SUITE_SCAN_BATCH_SIZE", raising=False)
+        else:
+            monkeypatch.setenv("HF_SUITE_SCAN_BATCH_SIZE", raw)
+
+        assert _scan_batch_size() == expected
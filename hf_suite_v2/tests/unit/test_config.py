@@ -36,8 +36,9 @@ class TestConfig:
         # Save
         config.save(config_path)
         
-        # Verify file exists
+        # Verify file exists and stays readable for hand editing
         assert config_path.exists()
+        assert '\n  "download": {\n' in config_path.read_text()
         
         # Load and verify
         loaded = Config.load(config_path)
@@ -54,6 +55,20 @@ class TestConfig:
         assert config_path.exists()
         assert config.download.max_workers == 3
     
+    def test_unchanged_save_is_skipped(self, tmp_path: Path):
+        """Test that saving an unchanged config does not rewrite the file."""
+        config_path = tmp_path / "skip_test.json"
+        config = Config()
+        config.save(config_path)
+        config_path.write_text("{}")
+        
+        config.save(config_path)
+        assert config_path.read_text() == "{}"
+        
+        config.first_run = False
+        config.save(config_path)
+        assert Config.load(config_path).first_run is False
+    
     def test_update(self, tmp_path: Path):
         """Test updating config values."""
         config_path = tmp_path / "update_test.json"
@@ -69,6 +84,37 @@ class TestConfig:
         loaded = Config.load(config_path)
         assert loaded.first_run is False
     
+    def test_update_saves_are_debounced(self, tmp_path: Path):
+        """Test that a burst of updates results in one deferred write."""
+        from unittest.mock import patch
+        
+        config = Config()
+        with patch.object(Config, "save") as save:
+            for i in range(5):
+                config.update(last_tab=i)
+            assert save.call_count == 0
+            
+            config.flush_save()
+            assert save.call_count == 1
+            
+            config.flush_save()
+            assert save.call_count == 1
+    
+    def test_retired_config_never_writes(self, tmp_path: Path):
+        """Test that retire() cancels a pending save and blocks later writes."""
+        from unittest.mock import patch
+        
+        config_path = tmp_path / "retired.json"
+        config = Config()
+        with patch.object(Config, "save") as save:
+            config.update(last_tab=1)
+            config.retire()
+            config.flush_save()
+            assert save.call_count == 0
+        
+        config.save(config_path)
+        assert not config_path.exists()
+    
     def test_add_recent_repo(self):
         """Test adding recent repositories."""
         config = Config()
@@ -4,6 +4,7 @@ Tests for database layer.
 
 import pytest
 import tempfile
+import threading
 from pathlib import Path
 from datetime import datetime
 
@@ -16,23 +17,66 @@ from hf_suite_v2.core.database import (
 class TestDatabase:
     """Tests for Database singleton and operations."""
     
-    @pytest.fixture
-    def temp_db(self, tmp_path: Path):
-        """Create a temporary database for testing."""
-        db_path = tmp_path / "test.db"
-        # Reset singleton for testing
-        Database._instance = None
-        db = Database(db_path)
-        yield db
-        # Cleanup
-        Database._instance = None
-    
     def test_singleton(self, temp_db):
         """Test that Database is a singleton."""
         db1 = Database()
         db2 = Database()
         assert db1 is db2
     
+    def test_connection_pragmas(self, temp_db):
+        """Test that file databases use WAL with relaxed syncing."""
+        from sqlalchemy import text
+        
+        with temp_db.engine.connect() as conn:
+            assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+    
+    def test_checkpoint(self, temp_db):
+        """Test WAL checkpointing and mode validation."""
+        temp_db.add_download({"repo_id": "a/b", "platform": "huggingface", "save_path": "/tmp"})
+        
+        busy, _, _ = temp_db.checkpoint("truncate")
+        assert busy == 0
+        with pytest.raises(ValueError):
+            temp_db.checkpoint("bogus; DROP TABLE downloads")
+    
+    def test_sessions_reused_per_thread(self, temp_db):
+        """Test that read and write sessions share one session per thread."""
+        with temp_db.read_session() as read:
+            pass
+        with temp_db.session() as write:
+            pass
+        
+        assert read is write
+    
+    def test_sessions_use_separate_connections_per_thread(self, temp_db):
+        """Test that sessions on different threads do not share a transaction."""
+        connections = []
+        
+        def record():
+            with temp_db.read_session() as session:
+                connections.append(session.connection().connection.driver_connection)
+                barrier.wait()
+        
+        barrier = threading.Barrier(2)
+        threads = [threading.Thread(target=record) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert connections[0] is not connections[1]
+    
+    def test_pending_downloads_use_composite_index(self, temp_db):
+        """Test that the pending-download query is served by (status, priority)."""
+        with temp_db.engine.connect() as conn:
+            plan = conn.exec_driver_sql(
+                "EXPLAIN QUERY PLAN SELECT * FROM downloads "
+                "WHERE status IN ('pending', 'queued') ORDER BY priority"
+            ).all()
+        
+        assert any("idx_downloads_status_priority" in row[-1] for row in plan)
+    
     def test_add_download(self, temp_db):
         """Test adding a download task."""
         task_id = temp_db.add_download({
@@ -115,6 +159,50 @@ class TestDatabase:
         assert download.status == "downloading"
         assert download.downloaded_bytes == 1000
     
+    def test_bulk_update_progress(self, temp_db):
+        """Test updating progress for several downloads at once."""
+        ids = [
+            temp_db.add_download({
+                "repo_id": f"test/model{i}",
+                "platform": "huggingface",
+                "repo_type": "model",
+                "save_path": "/tmp",
+            })
+            for i in range(2)
+        ]
+        
+        temp_db.bulk_update_progress([
+            {"id": task_id, "downloaded_bytes": 10 * n, "total_bytes": 100, "speed_bps": 1.0}
+            for n, task_id in enumerate(ids, 1)
+        ])
+        
+        assert [temp_db.get_download(i).downloaded_bytes for i in ids] == [10, 20]
+    
+    def test_bulk_update_progress_isolated_from_sessions(self, temp_db):
+        """Test that progress writes do not commit another thread's transaction."""
+        task_id = temp_db.add_download({
+            "repo_id": "test/model",
+            "platform": "huggingface",
+            "save_path": "/tmp",
+        })
+        writer = threading.Thread(
+            target=temp_db.bulk_update_progress,
+            args=([{"id": task_id, "downloaded_bytes": 5, "total_bytes": 10, "speed_bps": 1.0}],),
+        )
+        
+        with pytest.raises(RuntimeError):
+            with temp_db.session() as session:
+                session.add(DownloadTable(repo_id="ghost/row", platform="huggingface", save_path="/tmp"))
+                session.flush()
+                writer.start()
+                # Gives the write time to land unless our open transaction blocks it
+                writer.join(timeout=0.5)
+                raise RuntimeError("roll back")
+        writer.join()
+        
+        assert [d.repo_id for d in temp_db.get_downloads_by_status("pending")] == ["test/model"]
+        assert temp_db.get_download(task_id).downloaded_bytes == 5
+    
     def test_delete_download(self, temp_db):
         """Test deleting a download."""
         task_id = temp_db.add_download({
@@ -134,15 +222,6 @@ class TestDatabase:
 class TestHistoryOperations:
     """Tests for history operations."""
     
-    @pytest.fixture
-    def temp_db(self, tmp_path: Path):
-        """Create a temporary database for testing."""
-        db_path = tmp_path / "test_history.db"
-        Database._instance = None
-        db = Database(db_path)
-        yield db
-        Database._instance = None
-    
     def test_add_to_history(self, temp_db):
         """Test adding to history."""
         history_id = temp_db.add_to_history({
@@ -193,15 +272,6 @@ class TestHistoryOperations:
 class TestSettingsOperations:
     """Tests for settings operations."""
     
-    @pytest.fixture
-    def temp_db(self, tmp_path: Path):
-        """Create a temporary database for testing."""
-        db_path = tmp_path / "test_settings.db"
-        Database._instance = None
-        db = Database(db_path)
-        yield db
-        Database._instance = None
-    
     def test_set_and_get_setting(self, temp_db):
         """Test setting and getting a setting."""
         temp_db.set_setting("theme", "dark")
@@ -232,19 +302,78 @@ class TestSettingsOperations:
         assert "key1" in settings
         assert "key2" in settings
         assert settings["key1"] == "value1"
-
-
-class TestLocalModelOperations:
-    """Tests for local model operations."""
     
-    @pytest.fixture
-    def temp_db(self, tmp_path: Path):
-        """Create a temporary database for testing."""
-        db_path = tmp_path / "test_local.db"
+    def test_settings_served_from_cache(self, temp_db):
+        """Test that settings are read once and kept current by set_setting()."""
+        from unittest.mock import patch
+        
+        temp_db.set_setting("cached", "1")
+        assert temp_db.get_setting("cached") == "1"
+        
+        with patch.object(temp_db, "_fetch_rows", side_effect=AssertionError("queried")):
+            temp_db.set_setting("cached", "2")
+            assert temp_db.get_setting("cached") == "2"
+            assert temp_db.get_all_settings()["cached"] == "2"
+    
+    def test_flush_settings_persists(self, temp_db):
+        """Test that queued settings are written once and loaded on startup."""
+        temp_db.set_setting("theme", "light")
+        temp_db.set_setting("theme", "dark")
+        temp_db.flush_settings()
+        
+        with temp_db.engine.connect() as conn:
+            rows = conn.exec_driver_sql("SELECT value FROM settings WHERE key = 'theme'").all()
+        assert [row[0] for row in rows] == ["dark"]
+        assert temp_db.get_setting("theme") == "dark"
+        
+        temp_db.close()
+        Database._instance = None
+        reopened = Database(temp_db.db_path)
+        assert reopened.get_setting("theme") == "dark"
+        reopened.close()
+    
+    def test_flush_settings_isolated_from_sessions(self, temp_db):
+        """Test that the settings writer does not commit another thread's transaction."""
+        temp_db.set_setting("theme", "dark")
+        writer = threading.Thread(target=temp_db.flush_settings)
+        
+        with pytest.raises(RuntimeError):
+            with temp_db.session() as session:
+                session.add(SettingsTable(key="ghost", value="row"))
+                session.flush()
+                writer.start()
+                writer.join(timeout=0.5)
+                raise RuntimeError("roll back")
+        writer.join()
+        
+        with temp_db.engine.connect() as conn:
+            rows = conn.exec_driver_sql("SELECT key, value FROM settings").all()
+        assert [tuple(row) for row in rows] == [("theme", "dark")]
+    
+    def test_timestamps_filled_for_older_tables(self, tmp_path: Path):
+        """Test that tables without SQL timestamp defaults still get timestamps."""
+        import sqlite3
+        
+        db_path = tmp_path / "old.db"
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE settings (key VARCHAR PRIMARY KEY, value TEXT, updated_at DATETIME)")
+        conn.commit()
+        conn.close()
+        
         Database._instance = None
         db = Database(db_path)
-        yield db
+        db.set_setting("theme", "dark")
+        db.flush_settings()
+        
+        with db.engine.connect() as conn:
+            updated_at = conn.exec_driver_sql("SELECT updated_at FROM settings").scalar_one()
+        assert updated_at is not None
+        db.close()
         Database._instance = None
+
+
+class TestLocalModelOperations:
+    """Tests for local model operations."""
     
     def test_add_local_model(self, temp_db):
         """Test adding a local model."""
@@ -279,6 +408,55 @@ class TestLocalModelOperations:
         assert len(models) == 1
         assert models[0].file_size == 6000000
     
+    def test_add_local_models(self, temp_db):
+        """Test bulk insert mixes new rows with updates to existing paths."""
+        existing_id = temp_db.add_local_model({
+            "file_path": "/models/a.safetensors",
+            "file_name": "a.safetensors",
+            "file_size": 1,
+            "model_type": "checkpoint",
+        })
+
+        ids = temp_db.add_local_models([
+            {
+                "file_path": "/models/a.safetensors",
+                "file_name": "a.safetensors",
+                "file_size": 2,
+                "model_type": "checkpoint",
+            },
+            {
+                "file_path": "/models/b.safetensors",
+                "file_name": "b.safetensors",
+                "file_size": 3,
+                "model_type": "lora",
+            },
+        ])
+
+        assert ids[0] == existing_id
+        assert len(set(ids)) == 2
+        sizes = {m.file_name: m.file_size for m in temp_db.get_local_models()}
+        assert sizes == {"a.safetensors": 2, "b.safetensors": 3}
+
+    def test_inserts_without_returning(self, temp_db, monkeypatch):
+        """Test ids are read back on SQLite builds older than 3.35."""
+        from hf_suite_v2.core import database
+        monkeypatch.setattr(database, "SQLITE_HAS_RETURNING", False)
+        
+        first = temp_db.add_local_model({
+            "file_path": "/models/a.safetensors",
+            "file_name": "a.safetensors",
+            "model_type": "checkpoint",
+        })
+        ids = temp_db.add_local_models([
+            {"file_path": "/models/b.safetensors", "file_name": "b.safetensors", "model_type": "lora"},
+            {"file_path": "/models/a.safetensors", "file_name": "a.safetensors", "model_type": "vae"},
+        ])
+        task_id = temp_db.add_download({"repo_id": "a/b", "platform": "huggingface", "save_path": "/tmp"})
+        
+        assert ids[1] == first
+        assert len(set(ids)) == 2
+        assert temp_db.get_download(task_id).repo_id == "a/b"
+
     def test_get_local_models_by_type(self, temp_db):
         """Test filtering local models by type."""
         temp_db.add_local_model({
@@ -323,20 +501,12 @@ class TestLocalModelOperations:
         assert len(duplicates) == 1
         assert duplicates[0][0] == "abc123"
         assert len(duplicates[0][1]) == 2
+        assert {m.file_name for m in duplicates[0][1]} == {"model1.safetensors", "model2.safetensors"}
 
 
 class TestLocationOperations:
     """Tests for location operations."""
     
-    @pytest.fixture
-    def temp_db(self, tmp_path: Path):
-        """Create a temporary database for testing."""
-        db_path = tmp_path / "test_locations.db"
-        Database._instance = None
-        db = Database(db_path)
-        yield db
-        Database._instance = None
-    
     def test_add_location(self, temp_db):
         """Test adding a location."""
         loc_id = temp_db.add_location({
@@ -6,6 +6,7 @@ import pytest
 
 from hf_suite_v2.core.exceptions import (
     HFSuiteError,
+    DownloadError,
     InsufficientSpaceError,
     AuthenticationError,
     NetworkError,
@@ -30,6 +31,16 @@ class TestHFSuiteError:
         error = HFSuiteError("Test error", "Try this fix")
         assert "Test error" in str(error)
         assert "Try this fix" in str(error)
+    
+    def test_retryable_flags(self):
+        """Test which errors the download worker retries."""
+        assert DownloadError("Stalled").is_retryable
+        assert NetworkError(reason="Timed out").is_retryable
+        assert DownloadInterruptedError(task_id=1, progress_percent=50.0).is_retryable
+        assert not AuthenticationError("huggingface").is_retryable
+        assert not GatedModelError("org/model").is_retryable
+        assert not RepositoryNotFoundError("org/model", "huggingface").is_retryable
+        assert not FileVerificationError("/models/a.bin").is_retryable
 
 
 class TestInsufficientSpaceError:
@@ -0,0 +1,217 @@
+"""
+Tests for the download queue manager.
+"""
+
+import time
+
+import pytest
+
+from hf_suite_v2.core.download import manager as manager_module
+from hf_suite_v2.core.download.manager import DownloadManager
+
+
+class StubWorker:
+    """Stands in for DownloadWorker; runs until the test finishes it."""
+    
+    def __init__(self, log):
+        self.task = None
+        self.started = []
+        # Task IDs started by all stub workers, in order
+        self.log = log
+        # The thread (isRunning) and whether run() has begun (is_running);
+        # start() only starts the thread, as QThread.start() does
+        self.thread_running = False
+        self.running = False
+        # cancel() only asks the worker to stop; the test ends the thread
+        self.cancelled = False
+        self.paused = False
+    
+    def assign(self, task):
+        self.task = task
+    
+    def reset(self):
+        self.task = None
+        self.cancelled = self.paused = False
+    
+    def start(self):
+        self.started.append(self.task.id)
+        self.log.append(self.task.id)
+        self.thread_running = True
+    
+    def finish(self):
+        self.thread_running = self.running = False
+    
+    def is_running(self):
+        return self.running
+    
+    def isRunning(self):
+        return self.thread_running
+    
+    def cancel(self):
+        self.cancelled = True
+        self.paused = False
+    
+    def pause(self):
+        self.paused = True
+    
+    def resume(self):
+        self.paused = False
+
+
+def wait_for(condition, timeout: float = 5.0) -> None:
+    """Poll until condition() is true, failing after timeout seconds."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.01)
+
+
+class TestDownloadManager:
+    """Tests for dispatching queued tasks to pooled workers."""
+    
+    @pytest.fixture
+    def workers(self):
+        """Workers created by the manager, in creation order."""
+        return []
+    
+    @pytest.fixture
+    def started(self):
+        """Task IDs in the order workers started them."""
+        return []
+    
+    @pytest.fixture
+    def manager(self, temp_db, monkeypatch, workers, started):
+        """A started single-worker manager backed by a temporary database."""
+        monkeypatch.setattr(manager_module, "get_db", lambda: temp_db)
+        
+        def new_worker(self):
+            workers.append(StubWorker(started))
+            return workers[-1]
+        
+        monkeypatch.setattr(DownloadManager, "_new_worker", new_worker)
+        manager = DownloadManager(max_workers=1)
+        manager.start()
+        yield manager
+        manager.stop()
+    
+    def complete(self, manager, workers, task_id):
+        """Finish a running task the way a real worker reports it."""
+        worker = next(w for w in workers if w.task is not None and w.task.id == task_id)
+        manager._on_worker_completed(task_id, "/tmp", worker)
+        worker.finish()
+        manager._on_worker_finished(worker)
+    
+    def test_dispatch_by_priority_then_fifo(self, manager, workers, started):
+        """Test that the lowest priority value starts first, ties in order."""
+        manager.stop()
+        first = manager.add("test/a", "/tmp", priority=5)
+        second = manager.add("test/b", "/tmp", priority=5)
+        urgent = manager.add("test/c", "/tmp", priority=1)
+        manager.start()
+        
+        for expected in (urgent, first, second):
+            wait_for(lambda expected=expected: expected in started)
+            assert started[-1] == expected
+            assert manager.get_status()["active_count"] == 1
+            self.complete(manager, workers, expected)
+    
+    def test_cancelled_entries_skipped(self, manager, workers, started):
+        """Test that a task cancelled while queued never starts."""
+        running = manager.add("test/a", "/tmp")
+        wait_for(lambda: started == [running])
+        cancelled = manager.add("test/b", "/tmp")
+        queued = manager.add("test/c", "/tmp")
+        manager.cancel(cancelled)
+        
+        self.complete(manager, workers, running)
+        
+        wait_for(lambda: queued in started)
+        assert cancelled not in started
+        assert manager.get_queue_size() == 0
+    
+    def test_workers_reused(self, manager, workers, started):
+        """Test that a worker whose thread exited runs the next task."""
+        first = manager.add("test/a", "/tmp")
+        wait_for(lambda: started == [first])
+        self.complete(manager, workers, first)
+        wait_for(lambda: len(manager._idle_workers) == 1)
+        
+        second = manager.add("test/b", "/tmp")
+        wait_for(lambda: second in started)
+        
+        assert len(workers) == 1
+        assert workers[0].started == [first, second]
+    
+    def test_pause_frees_worker_slot(self, manager, workers, started):
+        """Test that a paused task lets the next one start and waits its turn on resume."""
+        paused = manager.add("test/a", "/tmp")
+        wait_for(lambda: started == [paused])
+        queued = manager.add("test/b", "/tmp")
+        
+        assert manager.pause(paused)
+        assert workers[0].paused
+        wait_for(lambda: queued in started)
+        assert manager.get_status()["paused_count"] == 1
+        
+        assert manager.resume(paused)
+        assert manager.get_queue_size() == 1
+        assert workers[0].paused
+        self.complete(manager, workers, queued)
+        
+        # The paused worker continues in place rather than starting over
+        wait_for(lambda: not workers[0].paused)
+        assert started.count(paused) == 1
+        assert manager.get_status()["active_count"] == 1
+    
+    def test_late_results_of_cancelled_worker_ignored(self, manager, workers, started, temp_db):
+        """Test that a cancelled worker finishing later changes nothing."""
+        from hf_suite_v2.core.models import ProgressInfo
+        
+        cancelled = manager.add("test/a", "/tmp")
+        wait_for(lambda: started == [cancelled])
+        manager.cancel(cancelled)
+        stale = workers[0]
+        assert stale.cancelled
+        
+        # The stale worker is still running, so the next task gets another
+        running = manager.add("test/b", "/tmp")
+        wait_for(lambda: running in started)
+        
+        manager._on_worker_progress(ProgressInfo(
+            task_id=cancelled, downloaded_bytes=100, total_bytes=200, speed_bps=0.0,
+        ), stale)
+        manager._on_worker_completed(cancelled, "/tmp", stale)
+        stale.finish()
+        manager._on_worker_finished(stale)
+        
+        assert temp_db.get_download(cancelled).status == "cancelled"
+        assert temp_db.get_history() == []
+        assert cancelled not in manager._progress_buffer
+        assert [task.id for task in manager.get_active_downloads()] == [running]
+        assert stale in manager._idle_workers
+    
+    def test_late_progress_dropped(self, manager, workers, started):
+        """Test that progress arriving after cancel() is not written."""
+        from hf_suite_v2.core.models import ProgressInfo
+        
+        task_id = manager.add("test/a", "/tmp")
+        wait_for(lambda: started == [task_id])
+        manager.cancel(task_id)
+        
+        manager._on_worker_progress(ProgressInfo(
+            task_id=task_id, downloaded_bytes=100, total_bytes=200, speed_bps=0.0,
+        ), workers[0])
+        
+        assert task_id not in manager._progress_buffer
+    
+    def test_started_worker_keeps_slot(self, manager, workers, started):
+        """Test that a worker whose run() has not begun is not reaped."""
+        running = manager.add("test/a", "/tmp")
+        wait_for(lambda: started == [running])
+        manager.add("test/b", "/tmp")
+        time.sleep(0.2)
+        
+        assert not workers[0].is_running()
+        assert started == [running]
+        assert manager.get_status()["active_count"] == 1
+        assert manager.get_queue_size() == 1
@@ -0,0 +1,260 @@
+"""
+Tests for the download worker and its helpers.
+"""
+
+import os
+import threading
+
+import pytest
+from PyQt6.QtCore import Qt
+
+from hf_suite_v2.core.download import worker as worker_module
+from hf_suite_v2.core.download.worker import (
+    DownloadWorker, _AdaptiveConcurrency, _StateWriter,
+    CONCURRENCY_WINDOW, SELECTED_FILES_START_WORKERS, SELECTED_FILES_WORKERS,
+)
+from hf_suite_v2.core.models import DownloadTask
+
+
+class TestAdaptiveConcurrency:
+    """Tests for the selected-files concurrency controller."""
+    
+    def run_windows(self, controller, rates, saturated=True):
+        """Feed one window per rate (bytes/second) and collect the targets."""
+        now, done = 0.0, 0
+        controller.restart(now, done)
+        targets = []
+        for rate in rates:
+            now += CONCURRENCY_WINDOW
+            done += int(rate * CONCURRENCY_WINDOW)
+            assert controller.due(now)
+            controller.update(now, done, saturated=saturated)
+            targets.append(controller.target)
+        return targets
+    
+    def test_starts_low(self):
+        """Test the initial target and window timing."""
+        controller = _AdaptiveConcurrency()
+        controller.restart(100.0, 0)
+        
+        assert controller.target == SELECTED_FILES_START_WORKERS
+        assert not controller.due(100.0 + CONCURRENCY_WINDOW / 2)
+        assert controller.due(100.0 + CONCURRENCY_WINDOW)
+    
+    def test_grows_while_throughput_improves(self):
+        """Test that the target grows by one per improving window."""
+        targets = self.run_windows(_AdaptiveConcurrency(), [100, 200, 300, 310])
+        
+        start = SELECTED_FILES_START_WORKERS
+        assert targets == [start, start + 1, start + 2, start + 2]
+    
+    def test_no_growth_when_unsaturated(self):
+        """Test that idle slots keep the target where it is."""
+        targets = self.run_windows(_AdaptiveConcurrency(), [100, 200, 400], saturated=False)
+        
+        assert targets == [SELECTED_FILES_START_WORKERS] * 3
+    
+    def test_shrinks_when_throughput_drops(self):
+        """Test backing off, never below one download."""
+        targets = self.run_windows(_AdaptiveConcurrency(), [1000, 500, 200, 50, 10])
+        
+        assert targets[1] == SELECTED_FILES_START_WORKERS - 1
+        assert min(targets) == 1
+    
+    def test_capped(self):
+        """Test that the target never exceeds the pool size."""
+        rates = [100 * 2 ** i for i in range(SELECTED_FILES_WORKERS + 4)]
+        targets = self.run_windows(_AdaptiveConcurrency(), rates)
+        
+        assert max(targets) == SELECTED_FILES_WORKERS
+
+
+class TestStateWriter:
+    """Tests for the background resume state writer."""
+    
+    def test_write_and_delete(self, tmp_path):
+        """Test that flush() waits for writes and None deletes the file."""
+        writer = _StateWriter()
+        path = tmp_path / "task_1.json"
+        
+        writer.put(path, b'{"a": 1}')
+        writer.flush()
+        assert path.read_bytes() == b'{"a": 1}'
+        
+        writer.put(path, None)
+        writer.flush()
+        assert not path.exists()
+        assert not path.with_suffix(".tmp").exists()
+    
+    def test_coalesces_updates(self, tmp_path, monkeypatch):
+        """Test that updates queued during a write only write the newest."""
+        writer = _StateWriter()
+        path = tmp_path / "task_1.json"
+        started = threading.Event()
+        release = threading.Event()
+        replaced = []
+        real_replace = os.replace
+        
+        def slow_replace(src, dst):
+            replaced.append(dst)
+            started.set()
+            release.wait(timeout=5)
+            real_replace(src, dst)
+        
+        monkeypatch.setattr(worker_module.os, "replace", slow_replace)
+        writer.put(path, b"1")
+        assert started.wait(timeout=5)
+        for payload in (b"2", b"3", b"4"):
+            writer.put(path, payload)
+        release.set()
+        writer.flush()
+        
+        assert path.read_bytes() == b"4"
+        assert len(replaced) == 2
+    
+    def test_flush_without_writes(self):
+        """Test that flushing an unused writer returns at once."""
+        _StateWriter().flush()
+
+
+@pytest.mark.usefixtures("resume_dir")
+class TestDownloadWorkerReuse:
+    """Tests for reusing one worker across tasks."""
+    
+    def make_task(self, task_id, tmp_path):
+        """Create a selected-files task saving under tmp_path."""
+        return DownloadTask(
+            id=task_id,
+            repo_id=f"test/model{task_id}",
+            save_path=str(tmp_path),
+            selected_files=["model.safetensors"],
+        )
+    
+    def test_assign_clears_previous_task(self, tmp_path):
+        """Test that assign() starts from clean state."""
+        worker = DownloadWorker(self.make_task(1, tmp_path))
+        worker.cancel()
+        worker._files_completed = 3
+        worker._update_progress(100, 1000)
+        worker._resume_state["completed_files"].add("model.safetensors")
+        
+        worker.reset()
+        worker.assign(self.make_task(2, tmp_path))
+        
+        assert worker.task.id == 2
+        assert not worker._cancel_event.is_set()
+        assert not worker.is_paused()
+        assert worker._files_completed == 0
+        assert len(worker._speed_samples) == 0
+        assert worker._resume_state_file.name == "task_2.json"
+        assert worker._resume_state["completed_files"] == set()
+    
+    def test_runs_again_after_reset(self, tmp_path):
+        """Test that a worker thread can run a second task."""
+        worker = DownloadWorker()
+        ran, completed = [], []
+        worker._prepare_huggingface = lambda: None
+        worker._download_huggingface = lambda: ran.append(worker.task.id)
+        worker.completed.connect(
+            lambda task_id, path: completed.append(task_id), Qt.ConnectionType.DirectConnection
+        )
+        
+        for task_id in (1, 2):
+            worker.assign(self.make_task(task_id, tmp_path))
+            worker.start()
+            assert worker.wait(5000)
+            worker.reset()
+        
+        assert ran == [1, 2]
+        assert completed == [1, 2]
+        assert not worker.is_running()
+
+
+@pytest.mark.usefixtures("resume_dir")
+class TestSelectedFiles:
+    """Tests for downloading a task's selected files."""
+    
+    def test_batches_go_through_download_files(self, tmp_path):
+        """Test that files are fetched in download_files() batches and all recorded."""
+        from unittest.mock import MagicMock
+        
+        files = [f"model-{i}.safetensors" for i in range(5)]
+        worker = DownloadWorker(DownloadTask(
+            id=1, repo_id="test/model", save_path=str(tmp_path), selected_files=files,
+        ))
+        worker._hf = MagicMock()
+        
+        worker._download_files_hf(str(tmp_path / "model"), files)
+        
+        batches = [c.args[1] for c in worker._hf.download_files.call_args_list]
+        assert sorted(f for batch in batches for f in batch) == files
+        assert all(len(batch) <= SELECTED_FILES_WORKERS for batch in batches)
+        assert worker._resume_state["completed_files"] == set(files)
+        assert worker._files_completed == len(files)
+    
+    def test_paused_worker_starts_no_batches(self, tmp_path):
+        """Test that a paused download waits in place until resumed."""
+        import time
+        from unittest.mock import MagicMock
+        
+        files = [f"model-{i}.safetensors" for i in range(3)]
+        worker = DownloadWorker(DownloadTask(id=1, repo_id="test/model", save_path=str(tmp_path)))
+        worker._hf = MagicMock()
+        worker.pause()
+        
+        thread = threading.Thread(target=worker._download_files_hf, args=(str(tmp_path / "model"), files))
+        thread.start()
+        time.sleep(0.2)
+        assert worker._hf.download_files.call_count == 0
+        
+        worker.resume()
+        thread.join(timeout=5)
+        
+        assert not thread.is_alive()
+        assert worker._resume_state["completed_files"] == set(files)
+
+
+class TestDiskProgress:
+    """Tests for progress read off the disk while files download."""
+    
+    @pytest.fixture(autouse=True)
+    def fast_progress(self, resume_dir, monkeypatch):
+        """Poll often and keep resume state in a temporary directory."""
+        monkeypatch.setattr(worker_module, "PROGRESS_EMIT_INTERVAL", 0.01)
+        monkeypatch.setattr(worker_module, "PROGRESS_EMIT_INTERVAL_NS", 10_000_000)
+    
+    def test_full_repo_progress_is_monotonic_and_complete(self, tmp_path):
+        """Test emitted bytes never go back and finish at the total."""
+        import time
+        from types import SimpleNamespace
+        from unittest.mock import MagicMock
+        
+        chunk, chunks = 1000, 20
+        total = chunk * chunks
+        
+        def fake_download_files(repo_id, filenames, local_dir, **kwargs):
+            # Writes the file a chunk at a time, as a download would
+            os.makedirs(local_dir, exist_ok=True)
+            with open(os.path.join(local_dir, "model.safetensors"), "wb") as f:
+                for _ in range(chunks):
+                    f.write(b"\0" * chunk)
+                    f.flush()
+                    time.sleep(0.005)
+            return local_dir
+        
+        worker = DownloadWorker(DownloadTask(id=1, repo_id="test/model", save_path=str(tmp_path)))
+        worker._total_bytes = total
+        emitted = []
+        worker.progress.connect(
+            lambda info: emitted.append(info.downloaded_bytes), Qt.ConnectionType.DirectConnection
+        )
+        worker._hf = MagicMock()
+        worker._hf.iter_files.return_value = iter([SimpleNamespace(path="model.safetensors", size=total)])
+        worker._hf.download_files.side_effect = fake_download_files
+        
+        worker._download_full_repo_hf(str(tmp_path / "model"))
+        
+        assert len(emitted) > 1
+        assert emitted == sorted(emitted)
+        assert emitted[-1] == total
+        assert worker._resume_state["completed_files"] == {"model.safetensors"}
@@ -3,6 +3,7 @@ File selection dialog - Browse and select files from a repository.
 """
 
 import logging
+from operator import attrgetter
 from typing import List, Dict, Optional
 from dataclasses import dataclass
 
@@ -16,7 +17,7 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, QThread, pyqtSignal
 
 from ...core import get_config
-from ...core.constants import FILE_CATEGORIES
+from ...core.constants import FILE_CATEGORIES, file_category
 
 logger = logging.getLogger(__name__)
 
@@ -36,11 +37,12 @@ class FetchFilesWorker(QThread):
     files_ready = pyqtSignal(list)  # List[RepoFile]
     error = pyqtSignal(str)
     
-    def __init__(self, repo_id: str, platform: str, repo_type: str):
+    def __init__(self, repo_id: str, platform: str, repo_type: str, refresh: bool = False):
         super().__init__()
         self.repo_id = repo_id
         self.platform = platform
         self.repo_type = repo_type
+        self.refresh = refresh
     
     def run(self):
         try:
@@ -54,25 +56,19 @@ class FetchFilesWorker(QThread):
         files = []
         
         if self.platform == "huggingface":
-            from huggingface_hub import HfApi
+            from ...core.api import HuggingFaceAPI
             
-            api = HfApi()
+            # Shares the API layer's repo info cache with the rest of the app
+            api = HuggingFaceAPI(endpoint=get_config().get_effective_endpoint("huggingface"))
+            if self.refresh:
+                api.invalidate(self.repo_id)
             
             try:
-                if self.repo_type == "model":
-                    repo_info = api.model_info(self.repo_id, files_metadata=True)
-                else:
-                    repo_info = api.dataset_info(self.repo_id, files_metadata=True)
+                files = [
+                    RepoFile(path=f.path, size=f.size, blob_id=f.blob_id, lfs=f.lfs)
+                    for f in api.list_files(self.repo_id, self.repo_type)
+                ]
                 
-                if repo_info.siblings:
-                    for sibling in repo_info.siblings:
-                        files.append(RepoFile(
-                            path=sibling.rfilename,
-                            size=sibling.size or 0,
-                            blob_id=sibling.blob_id,
-                            lfs=sibling.lfs is not None if hasattr(sibling, 'lfs') else False,
-                        ))
-                        
             except Exception as e:
                 logger.error(f"Failed to fetch HF files: {e}")
                 raise
@@ -95,7 +91,8 @@ class FetchFilesWorker(QThread):
                 logger.error(f"Failed to fetch ModelScope files: {e}")
                 raise
         
-        return sorted(files, key=lambda f: f.path)
+        files.sort(key=attrgetter("path"))
+        return files
 
 
 class FileSelectionDialog(QDialog):
@@ -223,7 +220,7 @@ class FileSelectionDialog(QDialog):
         self.type_filter = QComboBox()
         self.type_filter.addItem("All Types", "all")
         for key, info in FILE_CATEGORIES.items():
-            self.type_filter.addItem(info["label"], key)
+            self.type_filter.addItem(info.label, key)
         self.type_filter.currentIndexChanged.connect(self._filter_tree)
         self.type_filter.setFixedWidth(150)
         layout.addWidget(self.type_filter)
@@ -269,6 +266,12 @@ class FileSelectionDialog(QDialog):
         recommend_btn.clicked.connect(self._recommend_files)
         layout.addWidget(recommend_btn)
         
+        # Refresh button
+        refresh_btn = QPushButton("🔄 Refresh")
+        refresh_btn.setToolTip("Fetch the file list again")
+        refresh_btn.clicked.connect(self._refresh_files)
+        layout.addWidget(refresh_btn)
+        
         layout.addStretch()
         
         # Cancel button
@@ -285,17 +288,29 @@ class FileSelectionDialog(QDialog):
         
         return widget
     
-    def _start_fetch(self) -> None:
-        """Start fetching the file list."""
+    def _start_fetch(self, refresh: bool = False) -> None:
+        """Start fetching the file list, bypassing cached info if refresh is set."""
         self._fetch_worker = FetchFilesWorker(
             self.repo_id,
             self.platform,
-            self.repo_type
+            self.repo_type,
+            refresh=refresh,
         )
         self._fetch_worker.files_ready.connect(self._on_files_ready)
         self._fetch_worker.error.connect(self._on_fetch_error)
         self._fetch_worker.start()
     
+    def _refresh_files(self) -> None:
+        """Refetch the file list, e.g. after the repo was pushed to."""
+        if self._fetch_worker is not None and self._fetch_worker.isRunning():
+            return
+        
+        self.tree.hide()
+        self.loading_label.setText("Fetching file list...")
+        self.loading_progress.show()
+        self.loading_frame.show()
+        self._start_fetch(refresh=True)
+    
     def _on_files_ready(self, files: List[RepoFile]) -> None:
         """Handle files fetched successfully."""
         self._files = files
@@ -329,8 +344,9 @@ class FileSelectionDialog(QDialog):
             item.setData(2, Qt.ItemDataRole.UserRole, file.size)
             
             # Type
-            file_type = self._detect_file_type(file.path)
-            item.setText(3, file_type)
+            category = file_category(file.path)
+            item.setText(3, self._detect_file_type(file.path, category))
+            item.setData(3, Qt.ItemDataRole.UserRole, category)
             
             # Store file data
             item.setData(0, Qt.ItemDataRole.UserRole, file)
@@ -339,16 +355,13 @@ class FileSelectionDialog(QDialog):
         
         self._update_summary()
     
-    def _detect_file_type(self, path: str) -> str:
-        """Detect file type from path."""
-        path_lower = path.lower()
-        
-        for key, info in FILE_CATEGORIES.items():
-            for ext in info.get("extensions", []):
-                if path_lower.endswith(ext):
-                    return info["label"]
+    def _detect_file_type(self, path: str, category: Optional[str]) -> str:
+        """Detect file type label from path and its category key."""
+        if category is not None:
+            return FILE_CATEGORIES[category].label
         
         # Fallback
+        path_lower = path.lower()
         if path_lower.endswith(('.md', '.txt', '.json', '.yaml', '.yml')):
             return "Config"
         elif path_lower.endswith(('.py', '.sh')):
@@ -371,11 +384,9 @@ class FileSelectionDialog(QDialog):
                 if search_text not in file_path:
                     show = False
             
-            # Type filter
+            # Type filter, against the category key stored with the row
             if type_filter != "all":
-                file_type = item.text(3).lower()
-                expected = FILE_CATEGORIES.get(type_filter, {}).get("label", "").lower()
-                if expected not in file_type:
+                if item.data(3, Qt.ItemDataRole.UserRole) != type_filter:
                     show = False
             
             item.setHidden(not show)
@@ -30,7 +30,11 @@ logger = logging.getLogger(__name__)
 
 
 class SearchWorker(QThread):
-    """Background worker for searching repositories."""
+    """
+    Background worker for searching repositories.
+    
+    An empty query lists the recently used repositories instead.
+    """
     
     results_ready = pyqtSignal(list)
     error = pyqtSignal(str)
@@ -48,52 +52,48 @@ class SearchWorker(QThread):
         except Exception as e:
             self.error.emit(str(e))
     
+    def _api(self):
+        """Get the API client for the selected platform."""
+        config = get_config()
+        endpoint = config.get_effective_endpoint(self.platform)
+        if self.platform == "modelscope":
+            from ...core.api import ModelScopeAPI
+            return ModelScopeAPI(endpoint=endpoint)
+        from ...core.api import HuggingFaceAPI
+        return HuggingFaceAPI(endpoint=endpoint)
+    
     def _search(self) -> List[RepoInfo]:
         """Perform the search."""
-        from huggingface_hub import HfApi, ModelFilter
-        
-        api = HfApi()
-        models = []
+        api = self._api()
         
         try:
-            # Build filter
-            model_filter = ModelFilter()
-            
-            # Apply filters
-            if self.filters.get("task"):
-                model_filter.task = self.filters["task"]
-            if self.filters.get("library"):
-                model_filter.library = self.filters["library"]
-            
-            # Search
-            results = api.list_models(
-                search=self.query,
-                filter=model_filter,
-                limit=50,
-                sort="downloads",
-                direction=-1,
-            )
-            
-            for model in results:
-                models.append(RepoInfo(
-                    repo_id=model.id,
-                    platform="huggingface",
-                    repo_type="model",
-                    author=model.id.split("/")[0] if "/" in model.id else "",
-                    name=model.id.split("/")[-1] if "/" in model.id else model.id,
-                    downloads=model.downloads or 0,
-                    likes=model.likes or 0,
-                    tags=list(model.tags) if model.tags else [],
-                    last_modified=model.lastModified if hasattr(model, 'lastModified') else None,
-                    private=model.private if hasattr(model, 'private') else False,
-                    gated=model.gated if hasattr(model, 'gated') else False,
-                ))
-                
+            if self.query:
+                results = api.search(self.query, limit=50, filters=self.filters)
+            else:
+                # Looked up concurrently; repos that no longer resolve are left out
+                recent = list(get_config().recent_repos)
+                results = [m for m in api.get_repo_infos(recent) if m is not None]
         except Exception as e:
             logger.error(f"Search error: {e}")
             raise
         
-        return models
+        return [
+            RepoInfo(
+                repo_id=meta.repo_id,
+                platform=meta.platform,
+                repo_type=meta.repo_type,
+                author=meta.author,
+                name=meta.name or meta.repo_id,
+                description=meta.description or None,
+                downloads=meta.downloads,
+                likes=meta.likes,
+                tags=meta.tags,
+                last_modified=meta.last_modified,
+                private=meta.private,
+                gated=meta.gated,
+            )
+            for meta in results
+        ]
 
 
 class BrowserTab(QWidget):
@@ -213,13 +213,13 @@ class BrowserTab(QWidget):
         # Platform selector
         self.platform_combo = QComboBox()
         for key, info in PLATFORMS.items():
-            self.platform_combo.addItem(info["name"], key)
+            self.platform_combo.addItem(info.name, key)
         self.platform_combo.setFixedWidth(140)
         layout.addWidget(self.platform_combo)
         
         # Search input
         self.search_input = QLineEdit()
-        self.search_input.setPlaceholderText("Search models... (e.g., stable diffusion, llama, whisper)")
+        self.search_input.setPlaceholderText("Search models... (e.g., stable diffusion, llama, whisper), or leave empty for recent")
         self.search_input.returnPressed.connect(self._do_search)
         layout.addWidget(self.search_input, 1)
         
@@ -278,15 +278,15 @@ class BrowserTab(QWidget):
         return frame
     
     def _do_search(self) -> None:
-        """Execute the search."""
+        """Execute the search, or list recent repositories for an empty query."""
         query = self.search_input.text().strip()
-        if not query:
+        if not query and not self.config.recent_repos:
             return
         
         # Clear previous results
         self._clear_results()
         
-        self.results_header.setText("Searching...")
+        self.results_header.setText("Searching..." if query else "Loading recent repositories...")
         self.search_btn.setEnabled(False)
         
         # Build filters
@@ -314,7 +314,10 @@ class BrowserTab(QWidget):
             self.results_header.setText("No results found")
             return
         
-        self.results_header.setText(f"{len(results)} results found")
+        if self._search_worker is not None and not self._search_worker.query:
+            self.results_header.setText(f"{len(results)} recent repositories")
+        else:
+            self.results_header.setText(f"{len(results)} results found")
         
         # Create model cards in grid (3 columns)
         for i, repo in enumerate(results):
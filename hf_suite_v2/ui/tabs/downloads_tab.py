@@ -114,7 +114,7 @@ class DownloadsTab(QWidget):
         # Platform selector
         self.platform_combo = QComboBox()
         for key, info in PLATFORMS.items():
-            self.platform_combo.addItem(info["name"], key)
+            self.platform_combo.addItem(info.name, key)
         self.platform_combo.setFixedWidth(140)
         layout.addWidget(self.platform_combo)
         
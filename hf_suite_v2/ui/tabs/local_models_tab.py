@@ -5,6 +5,7 @@ Local Models tab - Scan and manage locally downloaded models.
 import logging
 import os
 import hashlib
+from operator import attrgetter
 from pathlib import Path
 from typing import List, Optional, Dict
 from datetime import datetime
@@ -20,7 +21,7 @@ from PyQt6.QtCore import Qt, QThread, pyqtSignal
 
 from ...core import get_config, get_db, EventBus, Events
 from ...core.constants import FILE_CATEGORIES
-from ...core.database import LocalModelTable
+from ...core.database import LOCAL_MODELS_UPSERT_CHUNK, LocalModelTable
 
 logger = logging.getLogger(__name__)
 
@@ -172,6 +173,8 @@ class LocalModelsTab(QWidget):
         self.event_bus = EventBus()
         self._scan_worker: Optional[ScanWorker] = None
         self._scan_paths: List[str] = []
+        # Scan results not yet written; saved in batches by _flush_found_models()
+        self._found_models: List[Dict] = []
         
         self._setup_ui()
         self._load_scan_paths()
@@ -262,7 +265,7 @@ class LocalModelsTab(QWidget):
         self.type_filter = QComboBox()
         self.type_filter.addItem("All Types", "all")
         for key, info in FILE_CATEGORIES.items():
-            self.type_filter.addItem(info["label"], key)
+            self.type_filter.addItem(info.label, key)
         self.type_filter.currentIndexChanged.connect(self._filter_tree)
         self.type_filter.setFixedWidth(150)
         layout.addWidget(self.type_filter)
@@ -410,10 +413,19 @@ class LocalModelsTab(QWidget):
     
     def _on_model_found(self, model_info: Dict) -> None:
         """Handle model found during scan."""
-        self.db.add_local_model(model_info)
+        self._found_models.append(model_info)
+        if len(self._found_models) >= LOCAL_MODELS_UPSERT_CHUNK:
+            self._flush_found_models()
+    
+    def _flush_found_models(self) -> None:
+        """Save buffered scan results in one transaction."""
+        if self._found_models:
+            self.db.add_local_models(self._found_models)
+            self._found_models = []
     
     def _on_scan_completed(self, total: int) -> None:
         """Handle scan completion."""
+        self._flush_found_models()
         self.progress_frame.hide()
         self.scan_btn.setEnabled(True)
         self.scan_btn.setText("🔄 Scan Now")
@@ -424,6 +436,7 @@ class LocalModelsTab(QWidget):
     
     def _on_scan_error(self, error: str) -> None:
         """Handle scan error."""
+        self._flush_found_models()
         self.progress_frame.hide()
         self.scan_btn.setEnabled(True)
         self.scan_btn.setText("🔄 Scan Now")
@@ -458,7 +471,7 @@ class LocalModelsTab(QWidget):
             ])
             type_item.setExpanded(True)
             
-            for model in sorted(type_models, key=lambda m: m.file_name):
+            for model in sorted(type_models, key=attrgetter("file_name")):
                 model_item = QTreeWidgetItem([
                     model.file_name,
                     self._format_bytes(model.file_size) if model.file_size else "-",
@@ -124,7 +124,7 @@ class SettingsTab(QWidget):
         
         hf_get_btn = QPushButton("Get Token")
         hf_get_btn.setFixedWidth(80)
-        hf_get_btn.clicked.connect(lambda: self._open_url(PLATFORMS["huggingface"]["token_url"]))
+        hf_get_btn.clicked.connect(lambda: self._open_url(PLATFORMS["huggingface"].token_url))
         hf_layout.addWidget(hf_get_btn)
         
         # Token status label
@@ -143,7 +143,7 @@ class SettingsTab(QWidget):
         
         ms_get_btn = QPushButton("Get Token")
         ms_get_btn.setFixedWidth(80)
-        ms_get_btn.clicked.connect(lambda: self._open_url(PLATFORMS["modelscope"]["token_url"]))
+        ms_get_btn.clicked.connect(lambda: self._open_url(PLATFORMS["modelscope"].token_url))
         ms_layout.addWidget(ms_get_btn)
         
         layout.addRow("ModelScope:", ms_layout)
@@ -359,7 +359,7 @@ class SettingsTab(QWidget):
             
             # Network
             self.config.network.use_hf_mirror = self.hf_mirror_check.isChecked()
-            self.config.network.hf_endpoint = self.endpoint_input.text() or PLATFORMS["huggingface"]["default_endpoint"]
+            self.config.network.hf_endpoint = self.endpoint_input.text() or PLATFORMS["huggingface"].default_endpoint
             self.config.network.timeout = self.timeout_spin.value()
             
             # Appearance
@@ -86,7 +86,7 @@ class EmbeddedBrowser(QWidget):
         self._setup_connections()
         
         # Navigate to default page
-        self.navigate_to(PLATFORMS["huggingface"]["models_url"])
+        self.navigate_to(PLATFORMS["huggingface"].models_url)
     
     def _setup_fallback_ui(self) -> None:
         """Show fallback UI when WebEngine is not available."""
@@ -254,13 +254,13 @@ class EmbeddedBrowser(QWidget):
         hf_btn = QPushButton("HF")
         hf_btn.setFixedSize(40, 32)
         hf_btn.setToolTip("HuggingFace Models")
-        hf_btn.clicked.connect(lambda: self.navigate_to(PLATFORMS["huggingface"]["models_url"]))
+        hf_btn.clicked.connect(lambda: self.navigate_to(PLATFORMS["huggingface"].models_url))
         layout.addWidget(hf_btn)
         
         ms_btn = QPushButton("MS")
         ms_btn.setFixedSize(40, 32)
         ms_btn.setToolTip("ModelScope Models")
-        ms_btn.clicked.connect(lambda: self.navigate_to(PLATFORMS["modelscope"]["models_url"]))
+        ms_btn.clicked.connect(lambda: self.navigate_to(PLATFORMS["modelscope"].models_url))
         layout.addWidget(ms_btn)
         
         # Download current model button
@@ -304,13 +304,13 @@ class EmbeddedBrowser(QWidget):
     def navigate_to_model(self, repo_id: str, platform: str = "huggingface") -> None:
         """Navigate to a model page."""
         platform_info = PLATFORMS.get(platform, PLATFORMS["huggingface"])
-        url = f"{platform_info['models_url']}/{repo_id}"
+        url = f"{platform_info.models_url}/{repo_id}"
         self.navigate_to(url)
     
     def navigate_to_token_page(self, platform: str = "huggingface") -> None:
         """Navigate to token settings page."""
         platform_info = PLATFORMS.get(platform, PLATFORMS["huggingface"])
-        self.navigate_to(platform_info["token_url"])
+        self.navigate_to(platform_info.token_url)
     
     def _navigate_to_url_bar(self) -> None:
         """Navigate to URL in the URL bar."""
@@ -335,7 +335,7 @@ class EmbeddedBrowser(QWidget):
     
     def _go_home(self) -> None:
         """Go to home page."""
-        self.navigate_to(PLATFORMS["huggingface"]["models_url"])
+        self.navigate_to(PLATFORMS["huggingface"].models_url)
     
     def _on_url_changed(self, url: QUrl) -> None:
         """Handle URL change."""